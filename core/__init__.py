@@ -23,9 +23,15 @@ Módulos Disponíveis:
 🔄 proces_response.py
     Sistema multi-agente para análise
     - Pipeline de 4 agentes especializados
-    - Processamento sequencial estruturado
+    - Processamento concorrente por termo (asyncio)
     - Geração de resumos e sínteses
 
+💾 cache.py
+    Cache persistente de respostas da IA
+    - Chave SHA-256 dos parâmetros da chamada
+    - Expiração configurável (TTL)
+    - Camada semântica opcional por embeddings
+
 🗂️ htmlcolect.py (Legacy)
     Funcionalidade anterior de coleta HTML
     - Mantido para compatibilidade
@@ -57,7 +63,7 @@ Configuração Necessária:
 
 2. Dependências (requirements.txt):
    ```
-   cohere>=4.0.0
+   cohere>=5.0.0
    requests>=2.28.0
    beautifulsoup4>=4.11.0
    python-dotenv>=0.19.0
@@ -80,7 +86,16 @@ Versão: 2.0
 """
 
 # Imports principais para facilitar uso do pacote
-from .co import create_agent, get_api_key, create_specialized_agents
+from .co import (
+    create_agent,
+    create_async_agent,
+    async_client_session,
+    get_api_key,
+    parse_json_objects,
+    create_specialized_agents,
+    create_specialized_async_agents,
+    run_stage_one
+)
 from .web_search import (
     collect_web_pages, 
     download_and_save_content, 
@@ -89,6 +104,7 @@ from .web_search import (
 )
 from .proces_response import (
     create_multi_agent_summary,
+    create_multi_agent_summary_async,
     process_with_multiple_agents
 )
 
@@ -101,8 +117,13 @@ __description__ = "Sistema Inteligente de Coleta e Análise Web com IA"
 __all__ = [
     # Módulo co.py
     'create_agent',
+    'create_async_agent',
+    'async_client_session',
     'get_api_key', 
+    'parse_json_objects',
     'create_specialized_agents',
+    'create_specialized_async_agents',
+    'run_stage_one',
     
     # Módulo web_search.py
     'collect_web_pages',
@@ -112,6 +133,7 @@ __all__ = [
     
     # Módulo proces_response.py
     'create_multi_agent_summary',
+    'create_multi_agent_summary_async',
     'process_with_multiple_agents',
     
     # Metadados
@@ -0,0 +1,179 @@
+"""
+Módulo de Cache de Respostas da IA
+==================================
+
+Este módulo mantém um cache persistente (SQLite) das respostas geradas
+pela API Cohere, evitando chamadas repetidas para prompts idênticos.
+
+Funcionalidades:
+- Cache exato por hash SHA-256 dos parâmetros da chamada
+- Expiração configurável (TTL) das entradas
+- Camada semântica opcional por similaridade de cosseno entre embeddings,
+  restrita às respostas do mesmo escopo (agente e parâmetros da chamada)
+- Acesso seguro entre threads
+
+Dependências:
+- sqlite3: Armazenamento persistente em arquivo único
+- hashlib: Geração das chaves de cache
+
+Autor: Marco
+Data: Agosto 2025
+"""
+
+import hashlib
+import json
+import math
+import os
+import sqlite3
+import threading
+import time
+from array import array
+from typing import Any, Optional, Sequence
+
+
+class ResponseCache:
+    """Cache persistente de respostas indexado por hash do prompt."""
+    
+    def __init__(self, db_path: str, ttl: float):
+        """
+        Args:
+            db_path (str): Caminho do arquivo SQLite do cache
+            ttl (float): Tempo de vida das entradas em segundos
+        """
+        self.db_path = db_path
+        self.ttl = ttl
+        self._connection = None
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def make_key(payload: Any) -> str:
+        """
+        Gera a chave de cache para um conjunto de parâmetros.
+        
+        Args:
+            payload (Any): Dados serializáveis em JSON que identificam a chamada
+        
+        Returns:
+            str: Hash SHA-256 hexadecimal do payload
+        """
+        serialized = json.dumps(payload, sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(serialized.encode('utf-8')).hexdigest()
+    
+    def _connect(self) -> sqlite3.Connection:
+        """Abre a conexão (uma única vez) e garante a estrutura da tabela."""
+        if self._connection is None:
+            directory = os.path.dirname(self.db_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            
+            self._connection = sqlite3.connect(self.db_path, check_same_thread=False)
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, "
+                "response TEXT NOT NULL, "
+                "created REAL NOT NULL, "
+                "embedding BLOB, "
+                "scope TEXT)"
+            )
+            
+            # Bancos criados antes da coluna de escopo: as entradas antigas
+            # ficam sem escopo e não participam da busca semântica
+            columns = {row[1] for row in self._connection.execute("PRAGMA table_info(responses)")}
+            if 'scope' not in columns:
+                self._connection.execute("ALTER TABLE responses ADD COLUMN scope TEXT")
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS responses_scope ON responses (scope)"
+            )
+        return self._connection
+    
+    def get(self, key: str) -> Optional[str]:
+        """
+        Busca uma resposta pela chave exata.
+        
+        Args:
+            key (str): Chave gerada por `make_key`
+        
+        Returns:
+            Optional[str]: Resposta armazenada ou None se ausente/expirada
+        """
+        with self._lock:
+            row = self._connect().execute(
+                "SELECT response FROM responses WHERE key = ? AND created >= ?",
+                (key, time.time() - self.ttl)
+            ).fetchone()
+        return row[0] if row else None
+    
+    def get_similar(self, embedding: Sequence[float], threshold: float, scope: str) -> Optional[str]:
+        """
+        Busca a resposta cujo embedding é mais próximo do informado.
+        
+        Args:
+            embedding (Sequence[float]): Embedding do prompt atual
+            threshold (float): Similaridade de cosseno mínima para aceitar
+            scope (str): Escopo da chamada (ver `set`); só respostas do mesmo
+                escopo são comparadas
+        
+        Returns:
+            Optional[str]: Resposta mais similar acima do limiar ou None
+        """
+        query_norm = math.sqrt(sum(value * value for value in embedding))
+        if not query_norm:
+            return None
+        
+        with self._lock:
+            rows = self._connect().execute(
+                "SELECT response, embedding FROM responses "
+                "WHERE scope = ? AND embedding IS NOT NULL AND created >= ?",
+                (scope, time.time() - self.ttl)
+            ).fetchall()
+        
+        best_response, best_score = None, threshold
+        for response, blob in rows:
+            stored = array('f')
+            stored.frombytes(blob)
+            if len(stored) != len(embedding):
+                continue
+            
+            stored_norm = math.sqrt(sum(value * value for value in stored))
+            if not stored_norm:
+                continue
+            
+            score = sum(a * b for a, b in zip(embedding, stored)) / (query_norm * stored_norm)
+            if score >= best_score:
+                best_response, best_score = response, score
+        
+        return best_response
+    
+    def set(
+        self, 
+        key: str, 
+        response: str, 
+        embedding: Optional[Sequence[float]] = None, 
+        scope: Optional[str] = None
+    ) -> None:
+        """
+        Armazena (ou substitui) uma resposta no cache.
+        
+        Args:
+            key (str): Chave gerada por `make_key`
+            response (str): Resposta a ser armazenada
+            embedding (Optional[Sequence[float]]): Embedding do prompt, para
+                a camada semântica
+            scope (Optional[str]): Hash de tudo que identifica a chamada
+                exceto a mensagem (agente, modelo, tokens, temperatura);
+                limita a busca semântica a respostas comparáveis
+        """
+        blob = array('f', embedding).tobytes() if embedding is not None else None
+        
+        with self._lock:
+            connection = self._connect()
+            connection.execute(
+                "INSERT OR REPLACE INTO responses (key, response, created, embedding, scope) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (key, response, time.time(), blob, scope)
+            )
+            connection.commit()
+
+
+__all__ = ['ResponseCache']
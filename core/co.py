@@ -9,6 +9,8 @@ Funcionalidades:
 - Configuração segura de API keys
 - Factory de agentes especializados
 - Gestão de chamadas para API Cohere
+- Agentes assíncronos para execução paralela
+- Cache persistente de respostas (exato e semântico)
 - Fallback para modelos default quando necessário
 
 Dependências:
@@ -19,24 +21,55 @@ Autor: Marco
 Data: Agosto 2025
 """
 
+import asyncio
+import json
+import logging
 import os
-from typing import Callable, Optional
+import re
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from functools import lru_cache
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterator, List, Mapping, Optional, Tuple
 
 try:
-    from .config import SystemConfig
+    import cohere
 except ImportError:
-    # Fallback se config não estiver disponível
-    class SystemConfig:
-        COHERE_DEFAULT_TEMPERATURE = 0.6
-        COHERE_MAX_TOKENS_MEDIUM = 500
-        @classmethod
-        def get_cohere_config(cls, content_size):
-            return {'max_tokens': 500, 'temperature': 0.6}
-        @classmethod
-        def get_agent_config(cls, agent_type):
-            return {'max_tokens': 500, 'temperature': 0.6}
+    cohere = None
 
+from .cache import ResponseCache
+from .config import SystemConfig
 
+
+logger = logging.getLogger(__name__)
+
+
+# Cliente Cohere compartilhado entre todos os agentes
+_CLIENT = None
+
+# Sessão do cliente assíncrono aberta no contexto atual (ver
+# `async_client_session`); guarda o cliente e seu pool HTTP
+_ASYNC_SESSION: ContextVar[Optional[dict]] = ContextVar('cohere_async_session', default=None)
+
+# Semáforo que limita chamadas simultâneas à API (também preso ao loop)
+_SEMAPHORE = None
+_SEMAPHORE_LOOP = None
+
+# Cache de respostas (criado sob demanda quando habilitado)
+_RESPONSE_CACHE = None
+
+# Arquivo .env na raiz do projeto, resolvido uma única vez na importação
+_ENV_PATH = Path(__file__).resolve().parent.parent / ".env"
+
+# Padrão para extrair a chave do arquivo .env em uma única varredura
+_API_KEY_PATTERN = re.compile(r'^[ \t]*COHERE_API_KEY=(.*)$', re.MULTILINE)
+
+# Fronteira entre frases, usada para truncar prompts sem cortar no meio
+_SENTENCE_BOUNDARY = re.compile(r'(?<=[.!?])\s')
+
+
+@lru_cache(maxsize=1)
 def get_api_key() -> str:
     """
     Obtém a chave da API Cohere das variáveis de ambiente ou arquivo .env.
@@ -48,28 +81,23 @@ def get_api_key() -> str:
         RuntimeError: Se a chave da API não for encontrada
         
     Note:
-        Busca primeiro nas variáveis de ambiente, depois no arquivo .env
+        Busca primeiro nas variáveis de ambiente, depois no arquivo .env.
+        A chave encontrada é memorizada para as chamadas seguintes.
     """
     # Primeira tentativa: variável de ambiente
     api_key = os.getenv("COHERE_API_KEY")
     
     if not api_key:
         # Segunda tentativa: arquivo .env no diretório do projeto
-        env_path = os.path.join(os.path.dirname(__file__), "..", ".env")
-        env_path = os.path.abspath(env_path)
-        
-        if os.path.exists(env_path):
+        if _ENV_PATH.exists():
             try:
-                with open(env_path, "r", encoding="utf-8") as file:
-                    for line in file:
-                        line = line.strip()
-                        if line.startswith("COHERE_API_KEY="):
-                            api_key = line.split("=", 1)[1].strip()
-                            # Define a variável de ambiente para uso futuro
-                            os.environ["COHERE_API_KEY"] = api_key
-                            break
+                match = _API_KEY_PATTERN.search(_ENV_PATH.read_text(encoding="utf-8"))
+                if match:
+                    api_key = match.group(1).strip()
+                    # Define a variável de ambiente para uso futuro
+                    os.environ["COHERE_API_KEY"] = api_key
             except Exception as e:
-                print(f"⚠️ Erro ao ler arquivo .env: {e}")
+                logger.warning("⚠️ Erro ao ler arquivo .env: %s", e)
     
     if not api_key:
         raise RuntimeError(
@@ -82,13 +110,459 @@ def get_api_key() -> str:
     return api_key
 
 
-def create_agent(system_prompt: str, max_tokens: int = 500) -> Callable[[str], str]:
+def _get_client():
+    """
+    Retorna o cliente Cohere compartilhado, criando-o na primeira chamada.
+    
+    Returns:
+        cohere.Client: Cliente reutilizado por todos os agentes, mantendo
+        as conexões HTTPS abertas entre as chamadas
+        
+    Raises:
+        ImportError: Se a biblioteca 'cohere' não estiver instalada
+    """
+    global _CLIENT
+    
+    if _CLIENT is None:
+        if cohere is None:
+            raise ImportError("Biblioteca 'cohere' não instalada")
+        _CLIENT = cohere.Client(get_api_key())
+    
+    return _CLIENT
+
+
+@asynccontextmanager
+async def async_client_session() -> AsyncIterator[None]:
+    """
+    Delimita o uso do cliente Cohere assíncrono, fechando-o ao final.
+    
+    Examples:
+        >>> async def main():
+        ...     async with async_client_session():
+        ...         await asyncio.gather(agent("Texto 1"), agent("Texto 2"))
+        
+    Note:
+        Os agentes assíncronos chamados dentro da sessão (inclusive em
+        tarefas criadas nela) compartilham um único cliente e pool de
+        conexões, criado no primeiro uso. Sessões aninhadas reaproveitam a
+        mais externa; fora de uma sessão, cada chamada abre a sua própria.
+    """
+    if _ASYNC_SESSION.get() is not None:
+        yield
+        return
+    
+    session = {}
+    token = _ASYNC_SESSION.set(session)
+    try:
+        yield
+    finally:
+        _ASYNC_SESSION.reset(token)
+        await _close_async_session(session)
+
+
+def _get_async_client(session: Optional[dict] = None):
+    """
+    Retorna o cliente Cohere assíncrono da sessão, criando-o no primeiro uso.
+    
+    Args:
+        session (Optional[dict]): Sessão a usar. Default: a aberta por
+            `async_client_session` no contexto atual
+        
+    Returns:
+        cohere.AsyncClient: Cliente com pool de conexões limitado a
+        SystemConfig.MAX_CONCURRENT_COHERE, reutilizado até o fim da sessão
+        
+    Raises:
+        ImportError: Se a biblioteca 'cohere' não estiver instalada
+    """
+    if session is None:
+        session = _ASYNC_SESSION.get()
+    
+    client = session.get('client')
+    if client is None:
+        if cohere is None:
+            raise ImportError("Biblioteca 'cohere' não instalada")
+        
+        import httpx
+        
+        max_connections = SystemConfig.MAX_CONCURRENT_COHERE
+        http_client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections
+            )
+        )
+        client = cohere.AsyncClient(get_api_key(), httpx_client=http_client)
+        session['client'] = client
+        session['http_client'] = http_client
+    
+    return client
+
+
+async def _close_async_session(session: dict) -> None:
+    """Fecha o pool HTTP do cliente da sessão, se ele chegou a ser criado."""
+    http_client = session.pop('http_client', None)
+    session.pop('client', None)
+    if http_client is not None:
+        await http_client.aclose()
+
+
+def _get_semaphore() -> asyncio.Semaphore:
+    """
+    Retorna o semáforo que limita as chamadas simultâneas à API Cohere.
+    
+    Returns:
+        asyncio.Semaphore: Semáforo com SystemConfig.MAX_CONCURRENT_COHERE
+        vagas, criado sob demanda dentro do event loop atual
+    """
+    global _SEMAPHORE, _SEMAPHORE_LOOP
+    
+    loop = asyncio.get_running_loop()
+    
+    if _SEMAPHORE is None or _SEMAPHORE_LOOP is not loop:
+        _SEMAPHORE = asyncio.Semaphore(SystemConfig.MAX_CONCURRENT_COHERE)
+        _SEMAPHORE_LOOP = loop
+    
+    return _SEMAPHORE
+
+
+def _get_response_cache() -> Optional[ResponseCache]:
+    """
+    Retorna o cache de respostas compartilhado, se habilitado na configuração.
+    
+    Returns:
+        Optional[ResponseCache]: Cache em OUTPUT_DIRECTORY/CACHE_FILE ou None
+        quando SystemConfig.ENABLE_CACHE estiver desligado
+    """
+    global _RESPONSE_CACHE
+    
+    if not SystemConfig.ENABLE_CACHE:
+        return None
+    
+    if _RESPONSE_CACHE is None:
+        _RESPONSE_CACHE = ResponseCache(
+            os.path.join(SystemConfig.OUTPUT_DIRECTORY, SystemConfig.CACHE_FILE),
+            SystemConfig.CACHE_DURATION
+        )
+    
+    return _RESPONSE_CACHE
+
+
+def _embed_prompt(client, prompt: str) -> Optional[List[float]]:
+    """Gera o embedding de um prompt para o cache semântico (None em caso de erro)."""
+    try:
+        response = client.embed(
+            texts=[prompt],
+            model=SystemConfig.COHERE_EMBED_MODEL,
+            input_type="search_query"
+        )
+        return list(response.embeddings[0])
+    except Exception:
+        return None
+
+
+async def _embed_prompt_async(client, prompt: str) -> Optional[List[float]]:
+    """Versão assíncrona de `_embed_prompt`."""
+    try:
+        async with _get_semaphore():
+            response = await client.embed(
+                texts=[prompt],
+                model=SystemConfig.COHERE_EMBED_MODEL,
+                input_type="search_query"
+            )
+        return list(response.embeddings[0])
+    except Exception:
+        return None
+
+
+def _truncate_prompt(text: str, limit: int) -> str:
+    """
+    Trunca o texto na última fronteira de frase que cabe no limite.
+    
+    Args:
+        text (str): Texto a ser enviado para o agente
+        limit (int): Número máximo de caracteres
+        
+    Returns:
+        str: Texto original, se couber, ou truncado com marcação
+    """
+    if len(text) <= limit:
+        return text
+    
+    cut = limit
+    for match in _SENTENCE_BOUNDARY.finditer(text, 0, limit + 1):
+        cut = match.start()
+    
+    return text[:cut] + "\n\n[TRUNCADO]"
+
+
+def _static_generation_params(system_prompt: str, content_size: int, max_tokens: int) -> dict:
+    """Parâmetros de `chat` que dependem apenas do agente e da faixa de tamanho."""
+    cohere_config = SystemConfig.get_cohere_config(content_size)
+    
+    # Usa configuração otimizada ou fallback
+    tokens = cohere_config.get('max_tokens', max_tokens)
+    temperature = cohere_config.get('temperature', SystemConfig.COHERE_DEFAULT_TEMPERATURE)
+    
+    # Ajusta tokens se especificado
+    if max_tokens != 500:  # Se não for o padrão, usa o especificado
+        tokens = max_tokens
+    
+    return {
+        'preamble': system_prompt,
+        'max_tokens': tokens,
+        'temperature': temperature,
+        'k': cohere_config.get('k', 0),
+        'p': cohere_config.get('p', 0.9),
+        'frequency_penalty': cohere_config.get('frequency_penalty', 0.1),
+        'presence_penalty': cohere_config.get('presence_penalty', 0.1)
+    }
+
+
+def _make_params_builder(system_prompt: str, max_tokens: int) -> Callable[[str], dict]:
+    """
+    Cria o montador de parâmetros da chamada `chat` de um agente.
+    
+    Args:
+        system_prompt (str): Prompt que define o comportamento do agente
+        max_tokens (int): Número máximo de tokens configurado no agente
+        
+    Returns:
+        Callable[[str], dict]: Função que recebe a mensagem do usuário e
+        retorna os argumentos nomeados prontos para `client.chat`
+        
+    Note:
+        As configurações das três faixas de tamanho são calculadas uma única
+        vez, na criação do agente; por chamada resta apenas escolher a faixa.
+        Mensagens acima de `MAX_PROMPT_LENGTH` são truncadas em fronteira de
+        frase antes do envio.
+        O prompt de sistema vai no `preamble`, idêntico entre chamadas do
+        mesmo agente, permitindo que o provedor reaproveite esse prefixo.
+    """
+    small_limit = SystemConfig.CONTENT_SMALL_THRESHOLD
+    medium_limit = SystemConfig.CONTENT_MEDIUM_THRESHOLD
+    
+    def build(
+        user_prompt: str,
+        _small=_static_generation_params(system_prompt, small_limit, max_tokens),
+        _medium=_static_generation_params(system_prompt, medium_limit, max_tokens),
+        _large=_static_generation_params(system_prompt, medium_limit + 1, max_tokens),
+        _small_limit=small_limit,
+        _medium_limit=medium_limit,
+        _max_length=SystemConfig.MAX_PROMPT_LENGTH
+    ) -> dict:
+        # Trunca antes do envio, evitando uma chamada que falharia por tamanho
+        if len(user_prompt) > _max_length:
+            user_prompt = _truncate_prompt(user_prompt, _max_length)
+        
+        content_length = len(user_prompt)
+        if content_length <= _small_limit:
+            params = dict(_small)
+        elif content_length <= _medium_limit:
+            params = dict(_medium)
+        else:
+            params = dict(_large)
+        params['message'] = user_prompt
+        return params
+    
+    return build
+
+
+def _cache_payload(params: dict, preamble_digest: str) -> dict:
+    """
+    Parâmetros que identificam a chamada no cache.
+    
+    O prompt de sistema entra pelo seu hash, calculado uma vez na criação do
+    agente, em vez de ser serializado e codificado de novo a cada chamada.
+    """
+    payload = dict(params)
+    payload['preamble'] = preamble_digest
+    return payload
+
+
+def _cache_scope(params: dict, preamble_digest: str) -> str:
+    """
+    Escopo da camada semântica: a chamada sem a mensagem.
+    
+    Respostas só são reaproveitadas por similaridade entre chamadas do mesmo
+    agente com os mesmos parâmetros de geração (modelo, tokens, temperatura).
+    """
+    payload = _cache_payload(params, preamble_digest)
+    del payload['message']
+    return ResponseCache.make_key(payload)
+
+
+def _make_cache_lookup(
+    build_params: Callable[[str], dict], 
+    preamble_digest: str
+) -> Callable[..., Optional[str]]:
+    """
+    Cria a consulta ao cache usada por `agent.cached(prompt)`.
+    
+    Args:
+        build_params (Callable[[str], dict]): Montador de parâmetros do agente
+        preamble_digest (str): Hash do prompt de sistema do agente
+        
+    Returns:
+        Callable[..., Optional[str]]: Função que devolve a resposta em cache
+        para uma mensagem (ou None), sem gerar texto. Com `semantic=True` e
+        `ENABLE_SEMANTIC_CACHE`, uma falha no cache exato consulta também o
+        cache semântico (ao custo de uma chamada de embedding)
+    """
+    def cached(user_prompt: str, semantic: bool = False) -> Optional[str]:
+        cache = _get_response_cache()
+        if cache is None:
+            return None
+        
+        params = build_params(user_prompt)
+        response = cache.get(cache.make_key(_cache_payload(params, preamble_digest)))
+        
+        if response is None and semantic and SystemConfig.ENABLE_SEMANTIC_CACHE:
+            embedding = _embed_prompt(_get_client(), params['message'])
+            if embedding is not None:
+                response = cache.get_similar(
+                    embedding,
+                    SystemConfig.SEMANTIC_CACHE_THRESHOLD,
+                    _cache_scope(params, preamble_digest)
+                )
+        
+        return response
+    
+    return cached
+
+
+def _build_fallback_params(system_prompt: str, user_prompt: str, max_tokens: int) -> dict:
+    """
+    Monta parâmetros reduzidos para nova tentativa após erro de limite de tokens.
+    
+    Args:
+        system_prompt (str): Prompt que define o comportamento do agente
+        user_prompt (str): Mensagem original do usuário
+        max_tokens (int): Número máximo de tokens configurado no agente
+        
+    Returns:
+        dict: Argumentos nomeados (`client.chat`) com conteúdo truncado
+        e menos tokens
+    """
+    fallback_tokens = min(300, max_tokens // 2)
+    
+    # Trunca conteúdo se muito longo
+    if len(user_prompt) > 2000:
+        truncated_prompt = user_prompt[:2000] + "\n\n[CONTEÚDO TRUNCADO - ANÁLISE PARCIAL]"
+    else:
+        truncated_prompt = user_prompt
+    
+    return {
+        'preamble': system_prompt,
+        'message': truncated_prompt,
+        'max_tokens': fallback_tokens,
+        'temperature': 0.6
+    }
+
+
+def _compose_prompt(params: dict) -> str:
+    """Combina preamble e mensagem em um único prompt de texto."""
+    return (
+        f"{params['preamble']}\n\n---\n\nTEXTO PARA PROCESSAR:\n"
+        f"{params['message']}\n\n---\n\nRESPOSTA:"
+    )
+
+
+def _to_generate_params(params: dict) -> dict:
+    """Converte parâmetros de `chat` para o formato legado de `generate`."""
+    generate_params = {
+        key: value for key, value in params.items()
+        if key not in ('preamble', 'message')
+    }
+    generate_params['prompt'] = _compose_prompt(params)
+    return generate_params
+
+
+def _request_completion(client, params: dict) -> str:
+    """
+    Envia a requisição ao Cohere e retorna o texto gerado.
+    
+    Args:
+        client: Cliente Cohere síncrono
+        params (dict): Parâmetros montados para `client.chat`
+        
+    Returns:
+        str: Texto da resposta sem espaços nas bordas
+        
+    Note:
+        Versões antigas do SDK não aceitam `preamble`; nesse caso o prompt
+        completo é enviado pelo endpoint `generate`.
+    """
+    try:
+        response = client.chat(**params)
+    except TypeError:
+        response = client.generate(**_to_generate_params(params))
+        return response.generations[0].text.strip()
+    
+    return response.text.strip()
+
+
+async def _request_completion_async(client, params: dict) -> str:
+    """Versão assíncrona de `_request_completion`."""
+    try:
+        response = await client.chat(**params)
+    except TypeError:
+        response = await client.generate(**_to_generate_params(params))
+        return response.generations[0].text.strip()
+    
+    return response.text.strip()
+
+
+def _is_length_error(error: Exception) -> bool:
+    """Verifica se o erro da API indica limite de tokens/tamanho excedido."""
+    error_msg = str(error).lower()
+    return "token" in error_msg or "length" in error_msg
+
+
+def parse_json_objects(response: str) -> List[Dict[str, Any]]:
+    """
+    Extrai os objetos do array JSON contido na resposta de um agente.
+    
+    Args:
+        response (str): Resposta do agente a um prompt que pede um array JSON
+        
+    Returns:
+        List[Dict[str, Any]]: Objetos do array, na ordem da resposta (vazio
+        se não houver um array JSON válido)
+        
+    Note:
+        A resposta pode vir cercada de texto ou de blocos de código; vale o
+        trecho entre o primeiro '[' e o último ']'. Itens que não são objetos
+        são ignorados.
+    """
+    start = response.find('[')
+    end = response.rfind(']')
+    if start < 0 or end < start:
+        return []
+    
+    try:
+        items = json.loads(response[start:end + 1])
+    except ValueError:
+        return []
+    
+    if not isinstance(items, list):
+        return []
+    return [item for item in items if isinstance(item, dict)]
+
+
+def create_agent(
+    system_prompt: str, 
+    max_tokens: int = 500, 
+    use_cache: bool = True
+) -> Callable[[str], str]:
     """
     Factory para criar agentes de IA especializados usando Cohere.
     
     Args:
         system_prompt (str): Prompt que define o comportamento do agente
         max_tokens (int, optional): Número máximo de tokens na resposta. Default: 500
+        use_cache (bool, optional): Se False, ignora respostas já em cache e
+            sempre chama a API (a nova resposta ainda é gravada). Default: True
         
     Returns:
         Callable[[str], str]: Função agente que processa mensagens
@@ -98,10 +572,18 @@ def create_agent(system_prompt: str, max_tokens: int = 500) -> Callable[[str], s
         >>> summary = agent("Texto para resumir...")
         >>> print(summary)
         
+        >>> for chunk in agent.stream("Texto para resumir..."):
+        ...     print(chunk, end="")
+        
+        >>> summaries = agent.batch(["Texto 1...", "Texto 2..."])
+        
     Note:
         Usa configuração otimizada para textos longos e respostas estruturadas.
         Implementa sistema de fallback inteligente para diferentes tamanhos.
     """
+    build_params = _make_params_builder(system_prompt, max_tokens)
+    preamble_digest = ResponseCache.make_key(system_prompt)
+    
     def agent(user_prompt: str) -> str:
         """
         Processa uma mensagem usando o agente configurado.
@@ -113,81 +595,423 @@ def create_agent(system_prompt: str, max_tokens: int = 500) -> Callable[[str], s
             str: Resposta gerada pelo agente
         """
         try:
-            # Importa cohere dinamicamente para evitar dependências desnecessárias
-            import cohere
-            
-            # Inicializa cliente com chave da API
-            client = cohere.Client(get_api_key())
-            
-            # Combina prompt do sistema com entrada do usuário de forma otimizada
-            complete_message = f"{system_prompt}\n\n---\n\nTEXTO PARA PROCESSAR:\n{user_prompt}\n\n---\n\nRESPOSTA:"
+            params = build_params(user_prompt)
             
-            # Determina configuração baseada no tamanho do conteúdo
-            content_length = len(user_prompt)
-            cohere_config = SystemConfig.get_cohere_config(content_length)
+            # Consulta o cache exato antes de qualquer chamada à API
+            cache = _get_response_cache()
+            cache_key = embedding = scope = None
+            if cache is not None:
+                cache_key = cache.make_key(_cache_payload(params, preamble_digest))
+                cached = cache.get(cache_key) if use_cache else None
+                if cached is not None:
+                    return cached
             
-            # Usa configuração otimizada ou fallback
-            tokens = cohere_config.get('max_tokens', max_tokens)
-            temperature = cohere_config.get('temperature', SystemConfig.COHERE_DEFAULT_TEMPERATURE)
+            # Reutiliza o cliente compartilhado (conexões mantidas entre chamadas)
+            client = _get_client()
             
-            # Ajusta tokens se especificado
-            if max_tokens != 500:  # Se não for o padrão, usa o especificado
-                tokens = max_tokens
+            # Camada semântica: aproveita resposta de prompt muito parecido
+            if cache is not None and SystemConfig.ENABLE_SEMANTIC_CACHE:
+                scope = _cache_scope(params, preamble_digest)
+                embedding = _embed_prompt(client, params['message'])
+                if embedding is not None and use_cache:
+                    cached = cache.get_similar(embedding, SystemConfig.SEMANTIC_CACHE_THRESHOLD, scope)
+                    if cached is not None:
+                        return cached
             
             # Gera resposta usando configuração otimizada
-            response = client.generate(
-                prompt=complete_message,
-                max_tokens=tokens,
-                temperature=temperature,
-                k=cohere_config.get('k', 0),
-                p=cohere_config.get('p', 0.9),
-                frequency_penalty=cohere_config.get('frequency_penalty', 0.1),
-                presence_penalty=cohere_config.get('presence_penalty', 0.1)
-            )
+            text = _request_completion(client, params)
+            
+            if cache is not None:
+                cache.set(cache_key, text, embedding, scope)
             
-            return response.generations[0].text.strip()
+            return text
             
         except ImportError:
             return "❌ Erro: Biblioteca 'cohere' não instalada. Execute: pip install cohere"
             
         except Exception as error:
-            error_msg = str(error).lower()
-            
             # Fallback inteligente para diferentes tipos de erro
-            if "token" in error_msg or "length" in error_msg:
+            if _is_length_error(error):
                 try:
-                    print("🔄 Tentando com menos tokens devido a limite excedido...")
-                    fallback_tokens = min(300, max_tokens // 2)
-                    
-                    # Trunca conteúdo se muito longo
-                    if len(user_prompt) > 2000:
-                        truncated_prompt = user_prompt[:2000] + "\n\n[CONTEÚDO TRUNCADO - ANÁLISE PARCIAL]"
-                    else:
-                        truncated_prompt = user_prompt
+                    logger.warning("🔄 Tentando com menos tokens devido a limite excedido...")
+                    return _request_completion(
+                        client, _build_fallback_params(system_prompt, user_prompt, max_tokens)
+                    )
                     
-                    complete_message = f"{system_prompt}\n\n---\n\nTEXTO PARA PROCESSAR:\n{truncated_prompt}\n\n---\n\nRESPOSTA:"
+                except Exception as e2:
+                    return f"❌ Erro persistente após fallback: {str(e2)}"
+            
+            return f"❌ Erro Cohere: {str(error)}"
+    
+    def stream(user_prompt: str) -> Iterator[str]:
+        """
+        Processa uma mensagem entregando a resposta em partes, conforme geradas.
+        
+        Args:
+            user_prompt (str): Mensagem do usuário para processar
+            
+        Yields:
+            str: Trechos da resposta na ordem em que chegam da API
+            
+        Note:
+            Se a transmissão falhar antes do primeiro trecho, recorre ao
+            agente sem streaming (que trata limite de tokens e erros).
+        """
+        params = build_params(user_prompt)
+        
+        cache = _get_response_cache()
+        cache_key = embedding = scope = None
+        if cache is not None:
+            cache_key = cache.make_key(_cache_payload(params, preamble_digest))
+            cached = cache.get(cache_key) if use_cache else None
+            if cached is not None:
+                yield cached
+                return
+        
+        chunks = []
+        try:
+            client = _get_client()
+            
+            # Embedding calculado antes da transmissão, para a resposta
+            # também entrar na camada semântica
+            if cache is not None and SystemConfig.ENABLE_SEMANTIC_CACHE:
+                scope = _cache_scope(params, preamble_digest)
+                embedding = _embed_prompt(client, params['message'])
+                if embedding is not None and use_cache:
+                    cached = cache.get_similar(embedding, SystemConfig.SEMANTIC_CACHE_THRESHOLD, scope)
+                    if cached is not None:
+                        yield cached
+                        return
+            
+            for event in client.chat_stream(**params):
+                if event.event_type == "text-generation":
+                    chunks.append(event.text)
+                    yield event.text
                     
-                    response = client.generate(
-                        prompt=complete_message,
-                        max_tokens=fallback_tokens,
-                        temperature=0.6
-                    )
-                    return response.generations[0].text.strip()
+        except Exception as error:
+            if chunks:
+                yield f"\n\n❌ Erro Cohere durante transmissão: {str(error)}"
+            else:
+                yield agent(user_prompt)
+            return
+        
+        if cache is not None:
+            cache.set(cache_key, "".join(chunks).strip(), embedding, scope)
+    
+    async_agent = None
+    
+    def batch(user_prompts: List[str]) -> List[str]:
+        """
+        Processa várias mensagens de uma vez, com chamadas concorrentes.
+        
+        Args:
+            user_prompts (List[str]): Mensagens do usuário para processar
+            
+        Returns:
+            List[str]: Respostas na mesma ordem das mensagens
+            
+        Note:
+            Não pode ser chamada de dentro de um event loop em execução;
+            nesse caso use `create_async_agent` com `asyncio.gather`.
+        """
+        nonlocal async_agent
+        if async_agent is None:
+            async_agent = create_async_agent(system_prompt, max_tokens, use_cache)
+        
+        # Mensagens repetidas no lote geram uma única chamada
+        unique_prompts = list(dict.fromkeys(user_prompts))
+        
+        async def run_batch() -> List[str]:
+            async with async_client_session():
+                return await asyncio.gather(*(async_agent(prompt) for prompt in unique_prompts))
+        
+        responses = dict(zip(unique_prompts, asyncio.run(run_batch())))
+        return [responses[prompt] for prompt in user_prompts]
+    
+    # Variantes com streaming e em lote: `agent.stream(prompt)` e
+    # `agent.batch(prompts)`; `agent.cached(prompt)` só consulta o cache
+    agent.stream = stream
+    agent.batch = batch
+    agent.cached = _make_cache_lookup(build_params, preamble_digest)
+    
+    return agent
+
+
+def create_async_agent(
+    system_prompt: str, 
+    max_tokens: int = 500, 
+    use_cache: bool = True
+) -> Callable[[str], Awaitable[str]]:
+    """
+    Factory para criar agentes assíncronos, equivalentes a `create_agent`.
+    
+    Args:
+        system_prompt (str): Prompt que define o comportamento do agente
+        max_tokens (int, optional): Número máximo de tokens na resposta. Default: 500
+        use_cache (bool, optional): Se False, ignora respostas já em cache e
+            sempre chama a API (a nova resposta ainda é gravada). Default: True
+        
+    Returns:
+        Callable[[str], Awaitable[str]]: Corrotina agente que processa mensagens
+        
+    Examples:
+        >>> agent = create_async_agent("Você é um resumidor especialista.")
+        >>> summary = asyncio.run(agent("Texto para resumir..."))
+        
+        >>> async for chunk in agent.stream("Texto para resumir..."):
+        ...     print(chunk, end="")
+        
+    Note:
+        Permite executar vários agentes em paralelo com `asyncio.gather`,
+        sobrepondo a latência de rede das chamadas à API Cohere.
+    """
+    build_params = _make_params_builder(system_prompt, max_tokens)
+    preamble_digest = ResponseCache.make_key(system_prompt)
+    
+    async def call(user_prompt: str, session: Optional[dict] = None) -> str:
+        """Corpo de `agent`, executado dentro de uma sessão do cliente."""
+        try:
+            params = build_params(user_prompt)
+            
+            cache = _get_response_cache()
+            cache_key = embedding = scope = None
+            if cache is not None:
+                cache_key = cache.make_key(_cache_payload(params, preamble_digest))
+                cached = cache.get(cache_key) if use_cache else None
+                if cached is not None:
+                    return cached
+            
+            client = _get_async_client(session)
+            
+            if cache is not None and SystemConfig.ENABLE_SEMANTIC_CACHE:
+                scope = _cache_scope(params, preamble_digest)
+                embedding = await _embed_prompt_async(client, params['message'])
+                if embedding is not None and use_cache:
+                    cached = cache.get_similar(embedding, SystemConfig.SEMANTIC_CACHE_THRESHOLD, scope)
+                    if cached is not None:
+                        return cached
+            
+            # Limita chamadas em voo para não esbarrar no rate limit da API
+            async with _get_semaphore():
+                text = await _request_completion_async(client, params)
+            
+            if cache is not None:
+                cache.set(cache_key, text, embedding, scope)
+            
+            return text
+            
+        except ImportError:
+            return "❌ Erro: Biblioteca 'cohere' não instalada. Execute: pip install cohere"
+            
+        except Exception as error:
+            if _is_length_error(error):
+                try:
+                    logger.warning("🔄 Tentando com menos tokens devido a limite excedido...")
+                    async with _get_semaphore():
+                        return await _request_completion_async(
+                            client, _build_fallback_params(system_prompt, user_prompt, max_tokens)
+                        )
                     
                 except Exception as e2:
                     return f"❌ Erro persistente após fallback: {str(e2)}"
             
             return f"❌ Erro Cohere: {str(error)}"
     
+    async def agent(user_prompt: str) -> str:
+        """
+        Processa uma mensagem usando o agente configurado.
+        
+        Args:
+            user_prompt (str): Mensagem do usuário para processar
+            
+        Returns:
+            str: Resposta gerada pelo agente
+            
+        Note:
+            Fora de uma `async_client_session`, abre uma só para esta chamada.
+        """
+        async with async_client_session():
+            return await call(user_prompt)
+    
+    async def stream(user_prompt: str) -> AsyncIterator[str]:
+        """
+        Processa uma mensagem entregando a resposta em partes, conforme geradas.
+        
+        Args:
+            user_prompt (str): Mensagem do usuário para processar
+            
+        Yields:
+            str: Trechos da resposta na ordem em que chegam da API
+            
+        Note:
+            Se a transmissão falhar antes do primeiro trecho, recorre ao
+            agente sem streaming (que trata limite de tokens e erros). Fora
+            de uma `async_client_session`, o cliente usado é fechado ao fim
+            da transmissão.
+        """
+        params = build_params(user_prompt)
+        
+        cache = _get_response_cache()
+        cache_key = embedding = scope = None
+        if cache is not None:
+            cache_key = cache.make_key(_cache_payload(params, preamble_digest))
+            cached = cache.get(cache_key) if use_cache else None
+            if cached is not None:
+                yield cached
+                return
+        
+        # Um gerador não deve alterar o contexto de quem o consome: sem
+        # sessão ativa, usa uma própria, passada explicitamente
+        session = _ASYNC_SESSION.get()
+        own_session = session is None
+        if own_session:
+            session = {}
+        
+        chunks = []
+        try:
+            client = _get_async_client(session)
+            
+            # Embedding calculado antes da transmissão, para a resposta
+            # também entrar na camada semântica
+            if cache is not None and SystemConfig.ENABLE_SEMANTIC_CACHE:
+                scope = _cache_scope(params, preamble_digest)
+                embedding = await _embed_prompt_async(client, params['message'])
+                if embedding is not None and use_cache:
+                    cached = cache.get_similar(embedding, SystemConfig.SEMANTIC_CACHE_THRESHOLD, scope)
+                    if cached is not None:
+                        yield cached
+                        return
+            
+            async with _get_semaphore():
+                async for event in client.chat_stream(**params):
+                    if event.event_type == "text-generation":
+                        chunks.append(event.text)
+                        yield event.text
+                        
+        except Exception as error:
+            if chunks:
+                yield f"\n\n❌ Erro Cohere durante transmissão: {str(error)}"
+            else:
+                yield await call(user_prompt, session)
+            return
+        
+        finally:
+            if own_session:
+                await _close_async_session(session)
+        
+        if cache is not None:
+            cache.set(cache_key, "".join(chunks).strip(), embedding, scope)
+    
+    # Variante com streaming: `agent.stream(prompt)`; e consulta ao cache
+    # sem chamar a API: `agent.cached(prompt)`
+    agent.stream = stream
+    agent.cached = _make_cache_lookup(build_params, preamble_digest)
+    
     return agent
 
 
-def create_specialized_agents() -> dict:
+# Prompts de sistema dos agentes especializados (compartilhados pelas
+# versões síncrona e assíncrona)
+_RESUMIDOR_SYS = (
+    "Você é um ESPECIALISTA EM RESUMOS TÉCNICOS. Sua missão é extrair os pontos mais importantes do texto fornecido.\n\n"
+    "DIRETRIZES:\n"
+    "• Foque nos conceitos centrais e informações-chave\n"
+    "• Use linguagem clara, objetiva e técnica\n"
+    "• Mantenha a estrutura lógica do conteúdo original\n"
+    "• Elimine redundâncias e informações secundárias\n"
+    "• Use português brasileiro formal\n"
+    "• Limite-se aos fatos apresentados no texto\n\n"
+    "FORMATO DE RESPOSTA:\n"
+    "- Pontos principais em bullets\n"
+    "- Máximo 5-7 pontos essenciais\n"
+    "- Cada ponto deve ser conciso mas completo"
+)
+
+_ANALISTA_SYS = (
+    "Você é um ANALISTA SÊNIOR DE CONTEÚDO com expertise em identificar insights e padrões.\n\n"
+    "SUAS RESPONSABILIDADES:\n"
+    "• Identificar tendências e padrões importantes\n"
+    "• Extrair insights técnicos e práticos\n"
+    "• Conectar conceitos e relações entre temas\n"
+    "• Destacar informações críticas para tomada de decisão\n"
+    "• Avaliar qualidade e relevância das informações\n"
+    "• Usar terminologia técnica apropriada\n\n"
+    "ESTRUTURA DA ANÁLISE:\n"
+    "1. INSIGHTS PRINCIPAIS (3-5 pontos)\n"
+    "2. TENDÊNCIAS IDENTIFICADAS\n"
+    "3. IMPLICAÇÕES PRÁTICAS\n"
+    "4. PONTOS DE ATENÇÃO\n\n"
+    "Use português brasileiro e seja detalhado mas objetivo."
+)
+
+_ORGANIZADOR_SYS = (
+    "Você é um ESPECIALISTA EM ORGANIZAÇÃO DE INFORMAÇÕES e estruturação de conteúdo.\n\n"
+    "OBJETIVOS:\n"
+    "• Criar estrutura hierárquica clara e lógica\n"
+    "• Categorizar informações por relevância e tema\n"
+    "• Usar formatação visual para facilitar leitura\n"
+    "• Estabelecer relações entre diferentes seções\n"
+    "• Criar índice mental do conteúdo\n\n"
+    "FORMATAÇÃO OBRIGATÓRIA:\n"
+    "```\n"
+    "# TÍTULO PRINCIPAL\n"
+    "## Seção 1\n"
+    "### Subseção 1.1\n"
+    "• Ponto importante\n"
+    "• Outro ponto\n"
+    "\n"
+    "## Seção 2\n"
+    "### Subseção 2.1\n"
+    "...\n"
+    "```\n\n"
+    "Use numeração, bullets e hierarquia visual clara."
+)
+
+_SINTETIZADOR_SYS = (
+    "Você é o SINTETIZADOR MASTER - responsável pela síntese final e integração de múltiplas análises.\n\n"
+    "MISSÃO CRÍTICA:\n"
+    "• Integrar resumos, análises e organizações em documento único\n"
+    "• Eliminar redundâncias entre diferentes fontes\n"
+    "• Criar visão holística e coerente do tema\n"
+    "• Destacar conclusões e recomendações principais\n"
+    "• Produzir documento final de alta qualidade\n\n"
+    "ESTRUTURA OBRIGATÓRIA DA SÍNTESE:\n"
+    "# SÍNTESE EXECUTIVA\n"
+    "## 🎯 Resumo Geral\n"
+    "## 🔍 Principais Descobertas\n"
+    "## 📊 Insights Estratégicos\n"
+    "## 💡 Recomendações\n"
+    "## 🔗 Conexões Entre Temas\n"
+    "## ⚡ Conclusões Finais\n\n"
+    "QUALIDADE EXIGIDA:\n"
+    "• Linguagem profissional e técnica\n"
+    "• Português brasileiro formal\n"
+    "• Estrutura visual clara com emojis\n"
+    "• Máxima coerência e fluidez\n"
+    "• Foco em valor agregado"
+)
+
+# Agente -> (prompt de sistema, máximo de tokens)
+_SPECIALIZED_AGENT_SPECS = {
+    'resumidor': (_RESUMIDOR_SYS, 600),
+    'analista': (_ANALISTA_SYS, 800),
+    'organizador': (_ORGANIZADOR_SYS, 700),
+    'sintetizador': (_SINTETIZADOR_SYS, 1200),
+}
+
+
+@lru_cache(maxsize=1)
+def create_specialized_agents() -> Mapping[str, Callable[[str], str]]:
     """
     Cria um conjunto de agentes especializados para análise de conteúdo.
     
     Returns:
-        dict: Dicionário com agentes especializados pré-configurados
+        Mapping[str, Callable[[str], str]]: Agentes especializados
+        pré-configurados (somente leitura)
+        
+    Note:
+        O conjunto é criado uma única vez e compartilhado entre as chamadas,
+        reaproveitando o mesmo cliente Cohere.
         
     Agents Available:
         - resumidor: Resume conteúdo de forma concisa e estruturada
@@ -196,104 +1020,79 @@ def create_specialized_agents() -> dict:
         - sintetizador: Combina múltiplas fontes em síntese coerente
     """
     agents = {
-        'resumidor': create_agent(
-            "Você é um ESPECIALISTA EM RESUMOS TÉCNICOS. Sua missão é extrair os pontos mais importantes do texto fornecido.\n\n"
-            "DIRETRIZES:\n"
-            "• Foque nos conceitos centrais e informações-chave\n"
-            "• Use linguagem clara, objetiva e técnica\n"
-            "• Mantenha a estrutura lógica do conteúdo original\n"
-            "• Elimine redundâncias e informações secundárias\n"
-            "• Use português brasileiro formal\n"
-            "• Limite-se aos fatos apresentados no texto\n\n"
-            "FORMATO DE RESPOSTA:\n"
-            "- Pontos principais em bullets\n"
-            "- Máximo 5-7 pontos essenciais\n"
-            "- Cada ponto deve ser conciso mas completo",
-            max_tokens=600
-        ),
-        
-        'analista': create_agent(
-            "Você é um ANALISTA SÊNIOR DE CONTEÚDO com expertise em identificar insights e padrões.\n\n"
-            "SUAS RESPONSABILIDADES:\n"
-            "• Identificar tendências e padrões importantes\n"
-            "• Extrair insights técnicos e práticos\n"
-            "• Conectar conceitos e relações entre temas\n"
-            "• Destacar informações críticas para tomada de decisão\n"
-            "• Avaliar qualidade e relevância das informações\n"
-            "• Usar terminologia técnica apropriada\n\n"
-            "ESTRUTURA DA ANÁLISE:\n"
-            "1. INSIGHTS PRINCIPAIS (3-5 pontos)\n"
-            "2. TENDÊNCIAS IDENTIFICADAS\n"
-            "3. IMPLICAÇÕES PRÁTICAS\n"
-            "4. PONTOS DE ATENÇÃO\n\n"
-            "Use português brasileiro e seja detalhado mas objetivo.",
-            max_tokens=800
-        ),
-        
-        'organizador': create_agent(
-            "Você é um ESPECIALISTA EM ORGANIZAÇÃO DE INFORMAÇÕES e estruturação de conteúdo.\n\n"
-            "OBJETIVOS:\n"
-            "• Criar estrutura hierárquica clara e lógica\n"
-            "• Categorizar informações por relevância e tema\n"
-            "• Usar formatação visual para facilitar leitura\n"
-            "• Estabelecer relações entre diferentes seções\n"
-            "• Criar índice mental do conteúdo\n\n"
-            "FORMATAÇÃO OBRIGATÓRIA:\n"
-            "```\n"
-            "# TÍTULO PRINCIPAL\n"
-            "## Seção 1\n"
-            "### Subseção 1.1\n"
-            "• Ponto importante\n"
-            "• Outro ponto\n"
-            "\n"
-            "## Seção 2\n"
-            "### Subseção 2.1\n"
-            "...\n"
-            "```\n\n"
-            "Use numeração, bullets e hierarquia visual clara.",
-            max_tokens=700
-        ),
-        
-        'sintetizador': create_agent(
-            "Você é o SINTETIZADOR MASTER - responsável pela síntese final e integração de múltiplas análises.\n\n"
-            "MISSÃO CRÍTICA:\n"
-            "• Integrar resumos, análises e organizações em documento único\n"
-            "• Eliminar redundâncias entre diferentes fontes\n"
-            "• Criar visão holística e coerente do tema\n"
-            "• Destacar conclusões e recomendações principais\n"
-            "• Produzir documento final de alta qualidade\n\n"
-            "ESTRUTURA OBRIGATÓRIA DA SÍNTESE:\n"
-            "# SÍNTESE EXECUTIVA\n"
-            "## 🎯 Resumo Geral\n"
-            "## 🔍 Principais Descobertas\n"
-            "## 📊 Insights Estratégicos\n"
-            "## 💡 Recomendações\n"
-            "## 🔗 Conexões Entre Temas\n"
-            "## ⚡ Conclusões Finais\n\n"
-            "QUALIDADE EXIGIDA:\n"
-            "• Linguagem profissional e técnica\n"
-            "• Português brasileiro formal\n"
-            "• Estrutura visual clara com emojis\n"
-            "• Máxima coerência e fluidez\n"
-            "• Foco em valor agregado",
-            max_tokens=1200
-        )
+        name: create_agent(system_prompt, max_tokens=tokens)
+        for name, (system_prompt, tokens) in _SPECIALIZED_AGENT_SPECS.items()
+    }
+    
+    return MappingProxyType(agents)
+
+
+def create_specialized_async_agents() -> dict:
+    """
+    Cria a versão assíncrona do conjunto de agentes especializados.
+    
+    Returns:
+        dict: Dicionário com as corrotinas agentes (mesmas chaves de
+        `create_specialized_agents`)
+    """
+    agents = {
+        name: create_async_agent(system_prompt, max_tokens=tokens)
+        for name, (system_prompt, tokens) in _SPECIALIZED_AGENT_SPECS.items()
     }
     
     return agents
 
 
+async def run_stage_one(text: str, agents: Optional[dict] = None) -> Tuple[str, str, str]:
+    """
+    Executa resumidor, analista e organizador em paralelo sobre o mesmo texto.
+    
+    Args:
+        text (str): Conteúdo a ser processado pelos três agentes
+        agents (Optional[dict]): Agentes assíncronos a usar. Default: cria
+            com `create_specialized_async_agents`
+        
+    Returns:
+        Tuple[str, str, str]: Resumo, análise e organização, nessa ordem
+        
+    Note:
+        Os três agentes são independentes entre si; apenas o sintetizador
+        depende dos seus resultados, então as chamadas são sobrepostas.
+    """
+    if agents is None:
+        agents = create_specialized_async_agents()
+    
+    async with async_client_session():
+        summary, analysis, organization = await asyncio.gather(
+            agents['resumidor'](text),
+            agents['analista'](text),
+            agents['organizador'](text)
+        )
+    
+    return summary, analysis, organization
+
+
 def test_api_connection() -> bool:
     """
     Testa a conexão com a API Cohere.
     
+    Returns:
+        bool: True se a conexão foi bem-sucedida, False caso contrário
+    """
+    return asyncio.run(test_api_connection_async())
+
+
+async def test_api_connection_async() -> bool:
+    """
+    Versão assíncrona de `test_api_connection`.
+    
     Returns:
         bool: True se a conexão foi bem-sucedida, False caso contrário
     """
     try:
         # Cria um agente simples para teste
-        test_agent = create_agent("Responda apenas 'Teste OK'", max_tokens=50)
-        response = test_agent("teste de conexão")
+        test_agent = create_async_agent("Responda apenas 'Teste OK'", max_tokens=50)
+        response = await test_agent("teste de conexão")
         
         if "ok" in response.lower() or "teste" in response.lower():
             print("✅ Conexão com Cohere API: Sucesso")
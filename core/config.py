@@ -9,8 +9,10 @@ Autor: Marco
 Data: Agosto 2025
 """
 
+import logging
 import os
-from typing import Dict, Any
+from types import MappingProxyType
+from typing import Any, Callable, Mapping, Tuple
 
 
 class SystemConfig:
@@ -39,6 +41,9 @@ class SystemConfig:
     MAX_CONTENT_LENGTH = 3000
     MAX_SYNTHESIS_LENGTH = 12000
     AGENT_CONTEXT_WINDOW = 8000
+    MAX_PROMPT_LENGTH = 24000  # Limite do prompt enviado a um agente (truncado antes do envio)
+    COMPACT_DOWNSTREAM = False  # Organizador recebe resumo e análise completos e só o início do conteúdo
+    COMPACT_DOWNSTREAM_LENGTH = 800  # Caracteres do conteúdo mantidos no modo compacto
     
     # ========================================================================
     # CONFIGURAÇÕES DE WEB SCRAPING
@@ -77,6 +82,7 @@ class SystemConfig:
     OUTPUT_DIRECTORY = "outputs"
     BACKUP_DIRECTORY = "backups"
     LOG_DIRECTORY = "logs"
+    COMPRESS_OUTPUT = False  # Salva os dados coletados compactados (dados_*.json.zst, requer zstandard)
     
     # Encoding
     DEFAULT_ENCODING = 'utf-8'
@@ -92,10 +98,17 @@ class SystemConfig:
     # Cache e otimização
     ENABLE_CACHE = True
     CACHE_DURATION = 3600  # 1 hora
+    CACHE_FILE = ".cohere_cache.sqlite"  # Dentro de OUTPUT_DIRECTORY
+    
+    # Cache semântico (reaproveita respostas de prompts parecidos)
+    ENABLE_SEMANTIC_CACHE = False
+    SEMANTIC_CACHE_THRESHOLD = 0.95  # Similaridade de cosseno mínima
+    COHERE_EMBED_MODEL = "embed-multilingual-v3.0"
     
     # Processamento paralelo
     MAX_WORKERS = 4
-    ENABLE_PARALLEL_PROCESSING = False  # Para desenvolvimento futuro
+    MAX_CONCURRENT_COHERE = 8  # Chamadas simultâneas à API Cohere
+    ENABLE_PARALLEL_PROCESSING = False  # Comprime as páginas dos termos em MAX_WORKERS processos
     
     # ========================================================================
     # CONFIGURAÇÕES DE DEBUG E LOGGING
@@ -110,47 +123,105 @@ class SystemConfig:
     COLLECT_STATS = True
     SHOW_PROGRESS_BARS = True
     
+    # Configurações Cohere por faixa de tamanho (pequeno, médio, grande),
+    # montadas por `_build_lookup_tables` após carregar o ambiente
+    _COHERE_CONFIGS: Tuple[Mapping[str, Any], ...] = ()
+    
+    # Configurações específicas de cada tipo de agente
+    _AGENT_CONFIGS: Mapping[str, Mapping[str, Any]] = MappingProxyType({
+        'resumidor': MappingProxyType({
+            'max_tokens': 600,
+            'temperature': 0.5,
+            'focus': 'concisão e clareza'
+        }),
+        'analista': MappingProxyType({
+            'max_tokens': 800,
+            'temperature': 0.6,
+            'focus': 'insights e padrões'
+        }),
+        'organizador': MappingProxyType({
+            'max_tokens': 700,
+            'temperature': 0.4,
+            'focus': 'estrutura e hierarquia'
+        }),
+        'sintetizador': MappingProxyType({
+            'max_tokens': 1200,
+            'temperature': 0.5,
+            'focus': 'integração e síntese'
+        })
+    })
+    
+    # Configurações que podem ser sobrescritas por variáveis de ambiente
+    _ENV_MAPPINGS: Mapping[str, Tuple[str, Callable[[str], Any]]] = MappingProxyType({
+        'REQUEST_TIMEOUT': ('REQUEST_TIMEOUT', int),
+        'MAX_CONTENT_LENGTH': ('MAX_CONTENT_LENGTH', int),
+        'COHERE_DEFAULT_TEMPERATURE': ('COHERE_TEMPERATURE', float),
+        'LOG_LEVEL': ('LOG_LEVEL', str),
+        'ENABLE_VERBOSE': ('VERBOSE_MODE', lambda x: x.lower() == 'true'),
+        'COMPACT_DOWNSTREAM': ('COMPACT_DOWNSTREAM', lambda x: x.lower() == 'true'),
+        'COMPRESS_OUTPUT': ('COMPRESS_OUTPUT', lambda x: x.lower() == 'true'),
+    })
+    _ENV_LOADED = False
+    
+    # Configuração para tipos de agente desconhecidos (depende do ambiente)
+    _DEFAULT_AGENT_CONFIG: Mapping[str, Any] = MappingProxyType({})
+    
     @classmethod
-    def get_cohere_config(cls, content_size: int) -> Dict[str, Any]:
-        """
-        Retorna configuração otimizada do Cohere baseada no tamanho do conteúdo.
-        
-        Args:
-            content_size (int): Tamanho do conteúdo em caracteres
-            
-        Returns:
-            Dict[str, Any]: Configuração otimizada
-        """
-        if content_size <= cls.CONTENT_SMALL_THRESHOLD:
-            return {
+    def _build_lookup_tables(cls) -> None:
+        """Pré-calcula as tabelas imutáveis que dependem das configurações."""
+        cls._COHERE_CONFIGS = (
+            MappingProxyType({
                 'max_tokens': cls.COHERE_MAX_TOKENS_SMALL,
                 'temperature': cls.COHERE_DEFAULT_TEMPERATURE + 0.1,
                 'k': cls.COHERE_K_VALUE,
                 'p': cls.COHERE_P_VALUE,
                 'frequency_penalty': cls.COHERE_FREQUENCY_PENALTY,
                 'presence_penalty': cls.COHERE_PRESENCE_PENALTY
-            }
-        elif content_size <= cls.CONTENT_MEDIUM_THRESHOLD:
-            return {
+            }),
+            MappingProxyType({
                 'max_tokens': cls.COHERE_MAX_TOKENS_MEDIUM,
                 'temperature': cls.COHERE_DEFAULT_TEMPERATURE,
                 'k': cls.COHERE_K_VALUE,
                 'p': cls.COHERE_P_VALUE,
                 'frequency_penalty': cls.COHERE_FREQUENCY_PENALTY,
                 'presence_penalty': cls.COHERE_PRESENCE_PENALTY
-            }
-        else:
-            return {
+            }),
+            MappingProxyType({
                 'max_tokens': cls.COHERE_MAX_TOKENS_LARGE,
                 'temperature': cls.COHERE_DEFAULT_TEMPERATURE - 0.1,
                 'k': cls.COHERE_K_VALUE,
                 'p': cls.COHERE_P_VALUE - 0.05,
                 'frequency_penalty': cls.COHERE_FREQUENCY_PENALTY + 0.05,
                 'presence_penalty': cls.COHERE_PRESENCE_PENALTY + 0.05
-            }
+            })
+        )
+        
+        cls._DEFAULT_AGENT_CONFIG = MappingProxyType({
+            'max_tokens': cls.COHERE_MAX_TOKENS_MEDIUM,
+            'temperature': cls.COHERE_DEFAULT_TEMPERATURE,
+            'focus': 'análise geral'
+        })
+    
+    @classmethod
+    def get_cohere_config(cls, content_size: int) -> Mapping[str, Any]:
+        """
+        Retorna configuração otimizada do Cohere baseada no tamanho do conteúdo.
+        
+        Args:
+            content_size (int): Tamanho do conteúdo em caracteres
+            
+        Returns:
+            Mapping[str, Any]: Configuração otimizada (somente leitura,
+            compartilhada entre chamadas)
+        """
+        index = (
+            (content_size > cls.CONTENT_SMALL_THRESHOLD) +
+            (content_size > cls.CONTENT_MEDIUM_THRESHOLD)
+        )
+        return cls._COHERE_CONFIGS[index]
     
     @classmethod
-    def get_agent_config(cls, agent_type: str) -> Dict[str, Any]:
+    def get_agent_config(cls, agent_type: str) -> Mapping[str, Any]:
         """
         Retorna configuração específica para cada tipo de agente.
         
@@ -158,56 +229,57 @@ class SystemConfig:
             agent_type (str): Tipo do agente (resumidor, analista, etc.)
             
         Returns:
-            Dict[str, Any]: Configuração específica do agente
+            Mapping[str, Any]: Configuração específica do agente (somente
+            leitura, compartilhada entre chamadas)
         """
-        configs = {
-            'resumidor': {
-                'max_tokens': 600,
-                'temperature': 0.5,
-                'focus': 'concisão e clareza'
-            },
-            'analista': {
-                'max_tokens': 800,
-                'temperature': 0.6,
-                'focus': 'insights e padrões'
-            },
-            'organizador': {
-                'max_tokens': 700,
-                'temperature': 0.4,
-                'focus': 'estrutura e hierarquia'
-            },
-            'sintetizador': {
-                'max_tokens': 1200,
-                'temperature': 0.5,
-                'focus': 'integração e síntese'
-            }
-        }
+        return cls._AGENT_CONFIGS.get(agent_type, cls._DEFAULT_AGENT_CONFIG)
+    
+    @classmethod
+    def load_from_env(cls, force: bool = False) -> None:
+        """
+        Carrega configurações de variáveis de ambiente.
         
-        return configs.get(agent_type, {
-            'max_tokens': cls.COHERE_MAX_TOKENS_MEDIUM,
-            'temperature': cls.COHERE_DEFAULT_TEMPERATURE,
-            'focus': 'análise geral'
-        })
+        Args:
+            force (bool, optional): Recarrega mesmo que o ambiente já tenha
+                sido lido. Default: False
+        """
+        if cls._ENV_LOADED and not force:
+            return
+        
+        env = os.environ
+        for attr, (env_var, converter) in cls._ENV_MAPPINGS.items():
+            env_value = env.get(env_var)
+            if not env_value:
+                continue
+            try:
+                setattr(cls, attr, converter(env_value))
+            except (ValueError, TypeError):
+                print(f"⚠️ Valor inválido para {env_var}: {env_value}")
+        
+        cls._ENV_LOADED = True
+        
+        # Recalcula as tabelas derivadas com os valores finais
+        cls._build_lookup_tables()
     
     @classmethod
-    def load_from_env(cls) -> None:
-        """Carrega configurações de variáveis de ambiente."""
-        # Configurações que podem ser sobrescritas por variáveis de ambiente
-        env_mappings = {
-            'REQUEST_TIMEOUT': ('REQUEST_TIMEOUT', int),
-            'MAX_CONTENT_LENGTH': ('MAX_CONTENT_LENGTH', int),
-            'COHERE_DEFAULT_TEMPERATURE': ('COHERE_TEMPERATURE', float),
-            'LOG_LEVEL': ('LOG_LEVEL', str),
-            'ENABLE_VERBOSE': ('VERBOSE_MODE', lambda x: x.lower() == 'true'),
-        }
+    def configure_logging(cls) -> None:
+        """
+        Envia os logs do pacote `core` para o stderr, no nível LOG_LEVEL.
         
-        for attr, (env_var, converter) in env_mappings.items():
-            env_value = os.getenv(env_var)
-            if env_value:
-                try:
-                    setattr(cls, attr, converter(env_value))
-                except (ValueError, TypeError):
-                    print(f"⚠️ Valor inválido para {env_var}: {env_value}")
+        Note:
+            Só o logger `core` é configurado: bibliotecas de terceiros
+            (httpx, httpcore...) mantêm o padrão do Python e não passam a
+            exibir mensagens INFO. Deve ser chamado pelos pontos de entrada
+            (`main.py`, `test_optimization.py`), não na importação.
+        """
+        package_logger = logging.getLogger('core')
+        if not package_logger.handlers:
+            handler = logging.StreamHandler()
+            handler.setFormatter(logging.Formatter("%(message)s"))
+            package_logger.addHandler(handler)
+        package_logger.setLevel(
+            getattr(logging, str(cls.LOG_LEVEL).upper(), logging.INFO)
+        )
     
     @classmethod
     def validate_config(cls) -> bool:
@@ -217,14 +289,13 @@ class SystemConfig:
         Returns:
             bool: True se configurações válidas
         """
-        validations = [
+        for is_valid, message in (
             (cls.REQUEST_TIMEOUT > 0, "REQUEST_TIMEOUT deve ser positivo"),
             (0.0 <= cls.COHERE_DEFAULT_TEMPERATURE <= 1.0, "Temperature deve estar entre 0 e 1"),
             (cls.MAX_CONTENT_LENGTH > 0, "MAX_CONTENT_LENGTH deve ser positivo"),
+            (cls.MAX_PROMPT_LENGTH > 0, "MAX_PROMPT_LENGTH deve ser positivo"),
             (cls.COHERE_MAX_TOKENS_LARGE > cls.COHERE_MAX_TOKENS_MEDIUM, "Tokens devem ser crescentes"),
-        ]
-        
-        for is_valid, message in validations:
+        ):
             if not is_valid:
                 print(f"❌ Erro de configuração: {message}")
                 return False
@@ -235,8 +306,8 @@ class SystemConfig:
 # Carrega configurações de ambiente na importação
 SystemConfig.load_from_env()
 
-# Valida configurações
-if not SystemConfig.validate_config():
+# Valida configurações (omitido com `python -O`)
+if __debug__ and not SystemConfig.validate_config():
     print("⚠️ Algumas configurações podem estar incorretas")
 
 # Exports para fácil importação
@@ -43,13 +43,203 @@ Data: Agosto 2025 (Legacy)
 Status: Deprecated - Use web_search.py
 """
 
+import asyncio
+import html
 import json
-import requests
-from bs4 import BeautifulSoup
+import logging
+import mmap
+import re
+import aiohttp
 import os
 from datetime import datetime
+from functools import lru_cache
+from itertools import islice
 import time
 from typing import Dict, Any, List, Optional
+from urllib.parse import urlsplit
+
+try:
+    import orjson
+except ImportError:  # orjson é opcional; sem ele usa o json da biblioteca padrão
+    orjson = None
+
+try:
+    from lxml import etree
+except ImportError:  # sem lxml os metadados saem das expressões regulares/bs4
+    etree = None
+
+# Progresso por URL em nível DEBUG (LOG_LEVEL=DEBUG para exibir)
+logger = logging.getLogger(__name__)
+
+
+# Cabeçalhos enviados em todas as requisições
+HEADERS_PADRAO = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Language': 'pt-BR,pt;q=0.9,en;q=0.8',
+    'Accept-Encoding': 'gzip, deflate, br',
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1'
+}
+
+# Parser do BeautifulSoup: lxml (C) quando instalado, senão o parser nativo
+PARSER_HTML = "lxml" if etree is not None else "html.parser"
+
+# Só as tags usadas nos metadados são montadas na árvore
+_TAGS_METADADOS = ["title", "meta"]
+
+# Varredura rápida dos metadados no início do HTML, sem montar árvore
+LIMITE_CABECALHO = 16384
+_TITLE_RE = re.compile(br"<title[^>]*>(.*?)</title>", re.I | re.S)
+# Cada <meta ...> é lido inteiro e seus atributos separados depois, em qualquer
+# ordem, com aspas duplas, simples ou sem aspas
+_META_RE = re.compile(br'<meta\b((?:"[^"]*"|\'[^\']*\'|[^"\'>])*)>', re.I)
+_ATRIBUTO_RE = re.compile(
+    br'([\w:.-]+)\s*=\s*(?:"([^"]*)"|\'([^\']*)\'|([^\s"\'>]+))'
+)
+_FIM_HEAD_RE = re.compile(br"</head\s*>", re.I)
+
+# Tamanho dos blocos lidos ao transmitir o corpo da resposta
+TAMANHO_BLOCO = 65536
+
+# Tamanho máximo do corpo lido por URL; o excedente é descartado
+MAX_BYTES_HTML = 2 * 1024 * 1024
+
+# Content-types tratados como HTML (os demais não têm o corpo baixado)
+TIPOS_HTML = ("text/html", "application/xhtml")
+
+# JSON de saída compacto (sem indentação nem espaços); `json.dumps` de uma
+# só vez usa o codificador em C, ao contrário de `json.dump` em partes
+SEPARADORES_JSON = (",", ":")
+
+# Buffer de escrita do arquivo de saída (1 MiB): o gravador incremental faz
+# muitas escritas pequenas, agrupadas aqui em poucas chamadas ao sistema
+TAMANHO_BUFFER_ESCRITA = 1 << 20
+
+
+def _json_para_bytes(dados):
+    """Serializa em JSON compacto (UTF-8), com orjson quando instalado"""
+    if orjson is not None:
+        return orjson.dumps(dados, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(dados, ensure_ascii=False, separators=SEPARADORES_JSON).encode('utf-8')
+
+
+def _ler_arquivo_json(arquivo):
+    """
+    Desserializa o JSON de um arquivo aberto em modo binário
+    
+    Com orjson, o arquivo é mapeado em memória (mmap) e entregue ao parser
+    sem cópia para um objeto bytes intermediário.
+    """
+    if orjson is not None and os.fstat(arquivo.fileno()).st_size:
+        with mmap.mmap(arquivo.fileno(), 0, access=mmap.ACCESS_READ) as mapa, memoryview(mapa) as conteudo:
+            return orjson.loads(conteudo)
+    return json.loads(arquivo.read())
+
+# Limites de concorrência da coleta assíncrona
+MAX_REQUISICOES_SIMULTANEAS = 64
+MAX_CONEXOES = 256
+MAX_CONEXOES_POR_HOST = 8
+
+# Novas tentativas para respostas temporárias (rate limit / erro no servidor)
+MAX_TENTATIVAS = 3
+STATUS_RETENTAVEIS = {429, 500, 502, 503, 504}
+
+
+@lru_cache(maxsize=1)
+def _obter_sessao():
+    """
+    Cria (na primeira chamada) a sessão HTTP síncrona compartilhada
+    
+    A sessão usa pool de conexões e novas tentativas, reaproveitando conexões
+    TCP/TLS entre as URLs. requests só é importado aqui, quando a coleta
+    síncrona é de fato usada.
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+    
+    sessao = requests.Session()
+    sessao.headers.update(HEADERS_PADRAO)
+    
+    adaptador = HTTPAdapter(
+        pool_connections=64,
+        pool_maxsize=64,
+        max_retries=Retry(
+            total=MAX_TENTATIVAS,
+            backoff_factor=0.5,
+            status_forcelist=sorted(STATUS_RETENTAVEIS),
+            respect_retry_after_header=True
+        )
+    )
+    sessao.mount("http://", adaptador)
+    sessao.mount("https://", adaptador)
+    return sessao
+
+
+class _ColetorCabecalho:
+    """
+    Lê o início do HTML bloco a bloco (lxml) e coleta título e metas do <head>
+    
+    Os blocos já chegam descomprimidos (gzip/deflate/br) do cliente HTTP e
+    são entregues ao parser incremental conforme são lidos, sem decodificar
+    o documento inteiro; a leitura pode parar assim que o <head> termina.
+    """
+    
+    def __init__(self, encoding):
+        self.titulo = None
+        self.metas = {}
+        self.concluido = False
+        self._parser = etree.HTMLPullParser(events=("end",), encoding=encoding)
+    
+    @classmethod
+    def criar(cls, encoding):
+        """Cria o coletor, ou None se lxml/encoding não estiverem disponíveis"""
+        if etree is None:
+            return None
+        try:
+            return cls(encoding)
+        except LookupError:
+            return None
+    
+    def alimentar(self, bloco):
+        """
+        Processa mais um bloco do corpo
+        
+        Returns:
+            bool: True quando o <head> já terminou
+        """
+        if self.concluido:
+            return True
+        
+        try:
+            self._parser.feed(bytes(bloco))
+            for _, elemento in self._parser.read_events():
+                tag = elemento.tag
+                if tag == "title":
+                    if self.titulo is None:
+                        self.titulo = elemento.text or ""
+                elif tag == "meta":
+                    nome = elemento.get("name")
+                    if nome:
+                        self.metas.setdefault(nome.lower(), elemento.get("content", ""))
+                elif tag in ("head", "body"):
+                    self.concluido = True
+                    break
+        except etree.LxmlError:
+            self.concluido = True
+        
+        return self.concluido
+    
+    def metadados(self):
+        """Retorna (titulo, descricao, keywords), ou None sem <title>"""
+        if self.titulo is None:
+            return None
+        return (
+            self.titulo.strip() or "Sem título",
+            self.metas.get("description", "").strip(),
+            self.metas.get("keywords", "").strip()
+        )
 
 
 def carregar_dados_json(arquivo_json: str = "dados_coletados.json") -> Optional[Dict[str, Any]]:
@@ -67,12 +257,12 @@ def carregar_dados_json(arquivo_json: str = "dados_coletados.json") -> Optional[
     print("⚠️ AVISO: Função legacy em uso. Considere migrar para json.load()")
     
     try:
-        if not os.path.exists(arquivo_json):
+        if not os.path.isfile(arquivo_json):
             print(f"❌ Arquivo {arquivo_json} não encontrado!")
             return None
             
-        with open(arquivo_json, 'r', encoding='utf-8') as f:
-            dados = json.load(f)
+        with open(arquivo_json, 'rb') as f:
+            dados = _ler_arquivo_json(f)
         
         print(f"✅ Dados carregados de: {arquivo_json}")
         return dados
@@ -80,92 +270,305 @@ def carregar_dados_json(arquivo_json: str = "dados_coletados.json") -> Optional[
     except Exception as e:
         print(f"❌ Erro ao carregar arquivo JSON: {e}")
         return None
-        return None
 
-def extrair_html_completo(url, timeout=15):
+def extrair_html_completo(url, timeout=15, armazenar_html=True, timestamp=None):
     """
     Extrai o HTML completo de uma URL
     
     Args:
         url (str): URL para extrair o HTML
         timeout (int): Timeout em segundos
+        armazenar_html (bool): Se False, lê o corpo apenas até </head> e
+            devolve só os metadados (sem "html_completo")
+        timestamp (str, optional): Data/hora (ISO) gravada no resultado;
+            se None, usa o instante da chamada
     
     Returns:
         dict: Dicionário com HTML completo e metadados
     """
+    import requests
+    
+    timestamp = timestamp or datetime.now().isoformat()
+    
     try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-            'Accept-Language': 'pt-BR,pt;q=0.9,en;q=0.8',
-            'Accept-Encoding': 'gzip, deflate, br',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1'
-        }
-        
-        print(f"  Extraindo HTML de: {url[:80]}...")
-        resp = requests.get(url, headers=headers, timeout=timeout)
-        resp.raise_for_status()
-        
-        # Detectar encoding
-        encoding = resp.encoding if resp.encoding else 'utf-8'
-        html_content = resp.content.decode(encoding, errors='ignore')
-        
-        # Extrair metadados básicos com BeautifulSoup
-        soup = BeautifulSoup(html_content, "html.parser")
-        
-        # Título
-        titulo = soup.find("title")
-        titulo = titulo.get_text().strip() if titulo else "Sem título"
-        
-        # Meta description
-        meta_desc = soup.find("meta", attrs={"name": "description"})
-        descricao = meta_desc.get("content", "").strip() if meta_desc else ""
-        
-        # Meta keywords
-        meta_keywords = soup.find("meta", attrs={"name": "keywords"})
-        keywords = meta_keywords.get("content", "").strip() if meta_keywords else ""
-        
-        return {
-            "url": url,
-            "titulo": titulo,
-            "descricao": descricao,
-            "keywords": keywords,
-            "html_completo": html_content,
-            "tamanho_html": len(html_content),
-            "encoding": encoding,
-            "status_code": resp.status_code,
-            "content_type": resp.headers.get('content-type', ''),
-            "status": "sucesso",
-            "timestamp": datetime.now().isoformat()
-        }
+        logger.debug("  Extraindo HTML de: %.80s...", url)
+        with _obter_sessao().get(url, timeout=timeout, stream=True) as resp:
+            resp.raise_for_status()
+            
+            content_type = resp.headers.get('content-type', '')
+            if not _eh_html(content_type):
+                return _resultado_nao_html(url, resp.status_code, content_type, timestamp)
+            
+            # Detectar encoding
+            encoding = resp.encoding if resp.encoding else 'utf-8'
+            
+            # iter_content já entrega os blocos descomprimidos
+            coletor = _ColetorCabecalho.criar(encoding)
+            conteudo = bytearray()
+            for bloco in resp.iter_content(chunk_size=TAMANHO_BLOCO):
+                conteudo += bloco
+                if coletor is not None:
+                    if coletor.alimentar(bloco) and not armazenar_html:
+                        break
+                elif not armazenar_html and _FIM_HEAD_RE.search(conteudo):
+                    break
+                if len(conteudo) > MAX_BYTES_HTML:
+                    break
+            
+            return _montar_resultado_html(
+                url, conteudo, encoding,
+                resp.status_code, content_type, timestamp,
+                armazenar_html, coletor.metadados() if coletor is not None else None
+            )
         
     except requests.exceptions.Timeout:
-        return {
-            "url": url,
-            "status": "erro: timeout",
-            "timestamp": datetime.now().isoformat()
-        }
+        return _resultado_erro(url, "erro: timeout", timestamp)
     except requests.exceptions.RequestException as e:
-        return {
-            "url": url,
-            "status": f"erro: {str(e)}",
-            "timestamp": datetime.now().isoformat()
-        }
+        return _resultado_erro(url, f"erro: {str(e)}", timestamp)
     except Exception as e:
-        return {
-            "url": url,
-            "status": f"erro: {str(e)}",
-            "timestamp": datetime.now().isoformat()
-        }
+        return _resultado_erro(url, f"erro: {str(e)}", timestamp)
 
-def processar_todos_links(dados_json, delay=1):
+async def extrair_html_completo_async(session, url, timeout=15, armazenar_html=True, timestamp=None):
+    """
+    Versão assíncrona de extrair_html_completo, usando uma sessão aiohttp
+    
+    Respostas 429/5xx são repetidas até MAX_TENTATIVAS vezes, respeitando o
+    cabeçalho Retry-After quando presente (senão, espera exponencial).
+    
+    Args:
+        session (aiohttp.ClientSession): Sessão HTTP compartilhada
+        url (str): URL para extrair o HTML
+        timeout (int): Timeout em segundos
+        armazenar_html (bool): Se False, lê o corpo apenas até </head> e
+            devolve só os metadados (sem "html_completo")
+        timestamp (str, optional): Data/hora (ISO) gravada no resultado;
+            se None, usa o instante da chamada
+    
+    Returns:
+        dict: Dicionário com HTML completo e metadados
+    """
+    timestamp = timestamp or datetime.now().isoformat()
+    
+    try:
+        logger.debug("  Extraindo HTML de: %.80s...", url)
+        
+        for tentativa in range(MAX_TENTATIVAS):
+            async with session.get(url, timeout=aiohttp.ClientTimeout(total=timeout)) as resp:
+                if resp.status in STATUS_RETENTAVEIS and tentativa < MAX_TENTATIVAS - 1:
+                    await asyncio.sleep(_tempo_espera(resp.headers.get('Retry-After'), tentativa))
+                    continue
+                
+                resp.raise_for_status()
+                
+                content_type = resp.headers.get('content-type', '')
+                if not _eh_html(content_type):
+                    return _resultado_nao_html(url, resp.status, content_type, timestamp)
+                
+                # Detectar encoding
+                encoding = resp.charset or 'utf-8'
+                
+                coletor = _ColetorCabecalho.criar(encoding)
+                conteudo = bytearray()
+                async for bloco in resp.content.iter_chunked(TAMANHO_BLOCO):
+                    conteudo += bloco
+                    if coletor is not None:
+                        if coletor.alimentar(bloco) and not armazenar_html:
+                            break
+                    elif not armazenar_html and _FIM_HEAD_RE.search(conteudo):
+                        break
+                    if len(conteudo) > MAX_BYTES_HTML:
+                        break
+                
+                return _montar_resultado_html(
+                    url, conteudo, encoding,
+                    resp.status, content_type, timestamp,
+                    armazenar_html, coletor.metadados() if coletor is not None else None
+                )
+        
+    except asyncio.TimeoutError:
+        return _resultado_erro(url, "erro: timeout", timestamp)
+    except aiohttp.ClientError as e:
+        return _resultado_erro(url, f"erro: {str(e)}", timestamp)
+    except Exception as e:
+        return _resultado_erro(url, f"erro: {str(e)}", timestamp)
+
+def _tempo_espera(retry_after, tentativa):
+    """Calcula a espera antes de nova tentativa (Retry-After ou exponencial)"""
+    try:
+        return max(0.0, float(retry_after))
+    except (TypeError, ValueError):
+        return 2 ** tentativa
+
+def _montar_resultado_html(url, conteudo, encoding, status_code, content_type, timestamp, armazenar_html=True, metadados=None):
+    """
+    Decodifica o HTML baixado e extrai os metadados básicos
+    
+    Args:
+        url (str): URL de origem
+        conteudo (bytearray): Corpo da resposta (cortado em MAX_BYTES_HTML)
+        encoding (str): Encoding detectado
+        status_code (int): Código HTTP da resposta
+        content_type (str): Cabeçalho content-type da resposta
+        timestamp (str): Data/hora (ISO) gravada no resultado
+        armazenar_html (bool): Se inclui o HTML decodificado no resultado
+        metadados (tuple, optional): (titulo, descricao, keywords) já
+            coletados durante a leitura; se None, são extraídos aqui
+    
+    Returns:
+        dict: Dicionário com HTML completo e metadados
+    """
+    # Corpo maior que o limite: guarda só o início e marca como truncado
+    truncado = len(conteudo) > MAX_BYTES_HTML
+    if truncado:
+        del conteudo[MAX_BYTES_HTML:]
+    
+    # Decodifica o documento só quando ele será armazenado
+    html_content = conteudo.decode(encoding, errors='ignore') if armazenar_html else None
+    
+    if metadados is None:
+        metadados = _extrair_metadados_rapido(bytes(conteudo[:LIMITE_CABECALHO]), encoding)
+    if metadados is None:
+        metadados = _extrair_metadados_soup(
+            html_content if html_content is not None
+            else conteudo.decode(encoding, errors='ignore')
+        )
+    titulo, descricao, keywords = metadados
+    
+    resultado = {
+        "url": url,
+        "titulo": titulo,
+        "descricao": descricao,
+        "keywords": keywords
+    }
+    if html_content is not None:
+        resultado["html_completo"] = html_content
+    
+    resultado.update({
+        "tamanho_html": len(html_content) if html_content is not None else len(conteudo),
+        "encoding": encoding,
+        "status_code": status_code,
+        "content_type": content_type,
+        "status": "sucesso",
+        "timestamp": timestamp
+    })
+    if truncado:
+        resultado["truncado"] = True
+    return resultado
+
+def _extrair_metadados_rapido(cabecalho, encoding):
+    """
+    Extrai título, description e keywords por expressões regulares
+    
+    Args:
+        cabecalho (bytes): Início do corpo da resposta
+        encoding (str): Encoding detectado
+    
+    Returns:
+        tuple: (titulo, descricao, keywords) ou None se o título não for
+        encontrado (nesse caso use _extrair_metadados_soup)
+    """
+    titulo_match = _TITLE_RE.search(cabecalho)
+    if not titulo_match:
+        return None
+    
+    def decodificar(valor):
+        return html.unescape(valor.decode(encoding, errors='ignore')).strip()
+    
+    metas = {}
+    for atributos_tag in _META_RE.findall(cabecalho):
+        atributos = {}
+        for nome, *valores in _ATRIBUTO_RE.findall(atributos_tag):
+            atributos.setdefault(nome.lower(), b"".join(valores))
+        if b"name" in atributos:
+            metas.setdefault(atributos[b"name"].lower(), atributos.get(b"content", b""))
+    
+    titulo = decodificar(titulo_match.group(1)) or "Sem título"
+    descricao = decodificar(metas.get(b"description", b""))
+    keywords = decodificar(metas.get(b"keywords", b""))
+    return titulo, descricao, keywords
+
+def _extrair_metadados_soup(html_content):
+    """
+    Extrai título, description e keywords com BeautifulSoup
+    
+    Args:
+        html_content (str): HTML já decodificado
+    
+    Returns:
+        tuple: (titulo, descricao, keywords)
+    """
+    from bs4 import BeautifulSoup, SoupStrainer
+    
+    # Texto já decodificado, sem nova detecção de encoding; apenas <title> e <meta>
+    soup = BeautifulSoup(html_content, PARSER_HTML, parse_only=SoupStrainer(_TAGS_METADADOS))
+    
+    # Título
+    titulo = soup.find("title")
+    titulo = titulo.get_text().strip() if titulo else "Sem título"
+    
+    # Meta description
+    meta_desc = soup.find("meta", attrs={"name": "description"})
+    descricao = meta_desc.get("content", "").strip() if meta_desc else ""
+    
+    # Meta keywords
+    meta_keywords = soup.find("meta", attrs={"name": "keywords"})
+    keywords = meta_keywords.get("content", "").strip() if meta_keywords else ""
+    
+    return titulo, descricao, keywords
+
+def _eh_html(content_type):
+    """Indica se o content-type é HTML (ausente conta como HTML)"""
+    return not content_type or content_type.lstrip().lower().startswith(TIPOS_HTML)
+
+def _resultado_nao_html(url, status_code, content_type, timestamp):
+    """Monta o registro de uma URL que não é HTML (PDF, imagem, JSON...), sem ler o corpo"""
+    return {
+        "url": url,
+        "titulo": "",
+        "descricao": "",
+        "keywords": "",
+        "tamanho_html": 0,
+        "status_code": status_code,
+        "content_type": content_type,
+        "status": "sucesso",
+        "timestamp": timestamp
+    }
+
+def _resultado_erro(url, status, timestamp):
+    """Monta o registro de uma URL cuja extração falhou"""
+    return {
+        "url": url,
+        "status": status,
+        "timestamp": timestamp
+    }
+
+def processar_todos_links(dados_json, delay=1, armazenar_html=True):
     """
     Processa todos os links do JSON e extrai o HTML completo
     
+    Executa processar_todos_links_async em um novo event loop.
+    
     Args:
         dados_json (dict): Dados carregados do JSON
-        delay (int): Delay em segundos entre requisições
+        delay (int): Delay em segundos entre requisições ao mesmo host
+        armazenar_html (bool): Se False, guarda apenas os metadados das páginas
+    
+    Returns:
+        dict: Dados com HTML completo adicionado
+    """
+    return asyncio.run(processar_todos_links_async(dados_json, delay, armazenar_html))
+
+async def processar_todos_links_async(dados_json, delay=1, armazenar_html=True):
+    """
+    Processa todos os links do JSON concorrentemente e extrai o HTML completo
+    
+    As URLs são baixadas em paralelo (até MAX_REQUISICOES_SIMULTANEAS), mas
+    o início de requisições ao mesmo host é espaçado por pelo menos `delay`.
+    
+    Args:
+        dados_json (dict): Dados carregados do JSON
+        delay (int): Delay em segundos entre requisições ao mesmo host
+        armazenar_html (bool): Se False, guarda apenas os metadados das páginas
     
     Returns:
         dict: Dados com HTML completo adicionado
@@ -175,49 +578,119 @@ def processar_todos_links(dados_json, delay=1):
         return None
     
     dados_com_html = {
-        "metadata": {
-            "data_processamento": datetime.now().isoformat(),
-            "total_termos": len(dados_json["dados"]),
-            "delay_usado": delay
-        },
+        "metadata": _metadados_processamento(dados_json, delay),
         "dados": {}
     }
     
-    total_urls = 0
+    async for termo, paginas in iterar_paginas_async(dados_json, delay, armazenar_html):
+        dados_com_html["dados"][termo] = [pagina async for pagina in paginas]
+    
+    return dados_com_html
+
+async def iterar_paginas_async(dados_json, delay=1, armazenar_html=True):
+    """
+    Baixa todos os links do JSON e produz os resultados termo a termo
+    
+    Todas as requisições são disparadas de uma vez, uma só por URL (URLs
+    repetidas entre termos reaproveitam o mesmo download); os resultados são
+    entregues na ordem original, para que o consumidor possa gravá-los e
+    descartá-los sem manter o conjunto inteiro em memória.
+    
+    Args:
+        dados_json (dict): Dados carregados do JSON (já validados)
+        delay (int): Delay em segundos entre requisições ao mesmo host
+        armazenar_html (bool): Se False, guarda apenas os metadados das páginas
+    
+    Yields:
+        tuple: (termo, iterador assíncrono das páginas do termo)
+    """
+    # Pares (termo, páginas) lidos uma única vez e reaproveitados abaixo
+    termos = list(dados_json["dados"].items())
+    total_urls = len({
+        pagina["url"] for _, paginas in termos for pagina in paginas if "url" in pagina
+    })
     urls_processadas = 0
     
-    # Contar total de URLs
-    for termo, paginas in dados_json["dados"].items():
-        total_urls += len(paginas)
+    # Data/hora única para todos os registros do lote
+    timestamp_lote = datetime.now().isoformat()
     
-    print(f"\nIniciando extração de HTML de {total_urls} URLs...")
+    logger.info("\nIniciando extração de HTML de %d URLs...", total_urls)
     
-    for termo, paginas in dados_json["dados"].items():
-        print(f"\nProcessando termo: {termo}")
-        dados_com_html["dados"][termo] = []
+    semaforo = asyncio.Semaphore(MAX_REQUISICOES_SIMULTANEAS)
+    locks_por_host = {}
+    ultima_requisicao = {}  # host -> instante (monotônico) da última requisição
+    
+    async def baixar_url(session, url):
+        nonlocal urls_processadas
         
-        for i, pagina in enumerate(paginas, 1):
-            if "url" in pagina:
-                url = pagina["url"]
-                print(f"  {i}/{len(paginas)} - URL {urls_processadas + 1}/{total_urls}")
-                
-                # Extrair HTML completo
-                html_data = extrair_html_completo(url)
-                
-                # Combinar dados originais com HTML
-                dados_combinados = {**pagina, **html_data}
-                dados_com_html["dados"][termo].append(dados_combinados)
-                
-                urls_processadas += 1
-                
-                # Delay entre requisições para não sobrecarregar
-                if delay > 0 and urls_processadas < total_urls:
-                    time.sleep(delay)
-            else:
+        host = urlsplit(url).netloc
+        lock_host = locks_por_host.setdefault(host, asyncio.Lock())
+        
+        # Limite por host: espera só o que falta do delay desde a última
+        # requisição ao mesmo host; hosts diferentes não esperam entre si
+        if delay > 0:
+            async with lock_host:
+                ultima = ultima_requisicao.get(host)
+                if ultima is not None:
+                    espera = delay - (time.monotonic() - ultima)
+                    if espera > 0:
+                        await asyncio.sleep(espera)
+                ultima_requisicao[host] = time.monotonic()
+        
+        async with semaforo:
+            html_data = await extrair_html_completo_async(
+                session, url, armazenar_html=armazenar_html, timestamp=timestamp_lote
+            )
+        
+        urls_processadas += 1
+        logger.debug("  URL %d/%d concluída", urls_processadas, total_urls)
+        return html_data
+    
+    tarefas_por_url = {}
+    
+    def tarefa_da_url(session, url):
+        # Uma única tarefa por URL, compartilhada pelas páginas repetidas
+        tarefa = tarefas_por_url.get(url)
+        if tarefa is None:
+            tarefa = tarefas_por_url[url] = asyncio.create_task(baixar_url(session, url))
+        return tarefa
+    
+    async def em_ordem(paginas, inicio):
+        for pagina, tarefa in zip(paginas, islice(tarefas, inicio, None)):
+            if tarefa is None:
                 # Manter dados originais se não tiver URL
-                dados_com_html["dados"][termo].append(pagina)
+                yield pagina
+            else:
+                # Combinar dados originais com HTML
+                yield {**pagina, **await tarefa}
     
-    return dados_com_html
+    connector = aiohttp.TCPConnector(limit=MAX_CONEXOES, limit_per_host=MAX_CONEXOES_POR_HOST)
+    async with aiohttp.ClientSession(connector=connector, headers=HEADERS_PADRAO) as session:
+        # Lista plana com uma tarefa por página (None se não houver URL); o
+        # aninhamento por termo só é refeito ao entregar os resultados
+        tarefas = [
+            tarefa_da_url(session, pagina["url"]) if "url" in pagina else None
+            for _, paginas in termos
+            for pagina in paginas
+        ]
+        
+        try:
+            inicio = 0
+            for termo, paginas in termos:
+                yield termo, em_ordem(paginas, inicio)
+                inicio += len(paginas)
+        finally:
+            # Consumidor interrompido: cancela os downloads pendentes
+            for tarefa in tarefas_por_url.values():
+                tarefa.cancel()
+
+def _metadados_processamento(dados_json, delay):
+    """Monta os metadados do processamento de links"""
+    return {
+        "data_processamento": datetime.now().isoformat(),
+        "total_termos": len(dados_json["dados"]),
+        "delay_usado": delay
+    }
 
 def salvar_html_completo(dados_com_html, arquivo_saida="dados_com_html.json"):
     """
@@ -238,8 +711,8 @@ def salvar_html_completo(dados_com_html, arquivo_saida="dados_com_html.json"):
         dados_com_html["metadata"]["arquivo_html"] = arquivo_saida
         dados_com_html["metadata"]["data_salvamento"] = datetime.now().isoformat()
         
-        with open(arquivo_saida, 'w', encoding='utf-8') as f:
-            json.dump(dados_com_html, f, ensure_ascii=False, indent=2)
+        with open(arquivo_saida, 'wb', buffering=TAMANHO_BUFFER_ESCRITA) as f:
+            f.write(_json_para_bytes(dados_com_html))
         
         print(f"\nDados com HTML salvos em: {arquivo_saida}")
         
@@ -256,11 +729,7 @@ def salvar_html_completo(dados_com_html, arquivo_saida="dados_com_html.json"):
                 else:
                     total_erros += 1
         
-        print(f"\nEstatísticas finais:")
-        print(f"  Arquivo: {arquivo_saida}")
-        print(f"  Sucessos: {total_sucessos}")
-        print(f"  Erros: {total_erros}")
-        print(f"  Tamanho total do HTML: {tamanho_total / 1024 / 1024:.2f} MB")
+        _exibir_estatisticas(arquivo_saida, total_sucessos, total_erros, tamanho_total)
         
         return True
         
@@ -268,6 +737,86 @@ def salvar_html_completo(dados_com_html, arquivo_saida="dados_com_html.json"):
         print(f"Erro ao salvar arquivo: {e}")
         return False
 
+async def salvar_html_completo_async(dados_json, arquivo_saida="dados_com_html.json", delay=1, armazenar_html=True):
+    """
+    Baixa os links do JSON e grava cada página no arquivo assim que fica pronta
+    
+    Produz o mesmo formato de salvar_html_completo ({"metadata", "dados"}),
+    mas sem montar o dicionário completo em memória: cada página é
+    serializada e descartada logo após o download.
+    
+    Args:
+        dados_json (dict): Dados carregados do JSON
+        arquivo_saida (str): Nome do arquivo de saída
+        delay (int): Delay em segundos entre requisições ao mesmo host
+        armazenar_html (bool): Se False, guarda apenas os metadados das páginas
+    
+    Returns:
+        bool: True se salvou com sucesso
+    """
+    if not dados_json or "dados" not in dados_json:
+        print("Dados JSON inválidos!")
+        return False
+    
+    metadata = _metadados_processamento(dados_json, delay)
+    metadata["arquivo_html"] = arquivo_saida
+    metadata["data_salvamento"] = datetime.now().isoformat()
+    
+    total_sucessos = 0
+    total_erros = 0
+    tamanho_total = 0
+    
+    try:
+        with open(arquivo_saida, 'wb', buffering=TAMANHO_BUFFER_ESCRITA) as f:
+            f.write(b'{"metadata":')
+            f.write(_json_para_bytes(metadata))
+            f.write(b',"dados":{')
+            
+            primeiro_termo = True
+            async for termo, paginas in iterar_paginas_async(dados_json, delay, armazenar_html):
+                if not primeiro_termo:
+                    f.write(b',')
+                primeiro_termo = False
+                
+                f.write(_json_para_bytes(termo))
+                f.write(b':[')
+                
+                primeira_pagina = True
+                async for pagina in paginas:
+                    if not primeira_pagina:
+                        f.write(b',')
+                    primeira_pagina = False
+                    
+                    f.write(b'\n')
+                    f.write(_json_para_bytes(pagina))
+                    
+                    if pagina.get("status") == "sucesso":
+                        total_sucessos += 1
+                        tamanho_total += pagina.get("tamanho_html", 0)
+                    else:
+                        total_erros += 1
+                
+                f.write(b']')
+            
+            f.write(b'}}\n')
+        
+        print(f"\nDados com HTML salvos em: {arquivo_saida}")
+        _exibir_estatisticas(arquivo_saida, total_sucessos, total_erros, tamanho_total)
+        
+        return True
+        
+    except Exception as e:
+        print(f"Erro ao salvar arquivo: {e}")
+        return False
+
+def _exibir_estatisticas(arquivo_saida, total_sucessos, total_erros, tamanho_total):
+    """Exibe as estatísticas finais da extração"""
+    print(f"\nEstatísticas finais:")
+    print(f"  Arquivo: {arquivo_saida}")
+    print(f"  Sucessos: {total_sucessos}")
+    print(f"  Erros: {total_erros}")
+    print(f"  Tamanho total do HTML: {tamanho_total / 1024 / 1024:.2f} MB")
+
 def extrair_html_de_json(arquivo_json="dados_coletados.json", arquivo_saida="dados_com_html.json", delay=1):
     """
     Função principal para extrair HTML completo dos links do JSON
@@ -275,7 +824,21 @@ def extrair_html_de_json(arquivo_json="dados_coletados.json", arquivo_saida="dad
     Args:
         arquivo_json (str): Arquivo JSON de entrada
         arquivo_saida (str): Arquivo JSON de saída
-        delay (int): Delay entre requisições
+        delay (int): Delay entre requisições ao mesmo host
+    
+    Returns:
+        bool: True se processou com sucesso
+    """
+    return asyncio.run(extrair_html_de_json_async(arquivo_json, arquivo_saida, delay))
+
+async def extrair_html_de_json_async(arquivo_json="dados_coletados.json", arquivo_saida="dados_com_html.json", delay=1):
+    """
+    Versão assíncrona de extrair_html_de_json
+    
+    Args:
+        arquivo_json (str): Arquivo JSON de entrada
+        arquivo_saida (str): Arquivo JSON de saída
+        delay (int): Delay entre requisições ao mesmo host
     
     Returns:
         bool: True se processou com sucesso
@@ -289,13 +852,8 @@ def extrair_html_de_json(arquivo_json="dados_coletados.json", arquivo_saida="dad
     if not dados:
         return False
     
-    # Processar todos os links
-    dados_com_html = processar_todos_links(dados, delay)
-    if not dados_com_html:
-        return False
-    
-    # Salvar resultados
-    return salvar_html_completo(dados_com_html, arquivo_saida)
+    # Processar todos os links, gravando cada página assim que fica pronta
+    return await salvar_html_completo_async(dados, arquivo_saida, delay)
 
 if __name__ == "__main__":
     print("⚠️ MÓDULO LEGACY - Para funcionalidades atualizadas, use:")
@@ -305,7 +863,7 @@ if __name__ == "__main__":
     
     # Executar extração legacy
     print("🔄 Executando funcionalidade legacy...")
-    sucesso = extrair_html_de_json()
+    sucesso = asyncio.run(extrair_html_de_json_async())
     if sucesso:
         print("✅ Extração legacy concluída com sucesso!")
         print("💡 Considere migrar para o módulo web_search.py")
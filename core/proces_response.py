@@ -7,7 +7,7 @@ múltiplos agentes especializados de IA para análise aprofundada.
 
 Funcionalidades:
 - Sistema multi-agente com 4 especialistas
-- Processamento sequencial e estruturado
+- Processamento concorrente entre termos (asyncio)
 - Geração de resumos parciais e síntese final
 - Relatórios detalhados e estatísticas
 - Tratamento robusto de dados JSON
@@ -22,29 +22,96 @@ Autor: Marco
 Data: Agosto 2025
 """
 
+import asyncio
+import bisect
+import hashlib
+import io
+import itertools
 import json
+import math
 import os
+import re
+import statistics
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Any, Tuple
+from functools import lru_cache
+from typing import Dict, List, Any, Awaitable, Callable, Iterable, Iterator, NamedTuple, Optional, Set, Tuple
 from utils.console import (
     print_header, print_section, print_step, print_result, 
     log, RichProgress, RichStatus, console
 )
-from core.co import create_agent
+from core.co import async_client_session, create_agent, create_async_agent, parse_json_objects
+from core.config import SystemConfig
+
+try:
+    import ijson
+    _JSON_ERRORS = (ValueError, ijson.JSONError)
+except ImportError:
+    ijson = None
+    _JSON_ERRORS = (ValueError,)
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
 
 
 # Configurações do processamento
 MAX_CONTENT_LENGTH = 3000  # Aumentado para processar mais conteúdo
 MAX_SYNTHESIS_LENGTH = 12000  # Aumentado para síntese mais completa
+MAX_AGENT_CONTENT_LENGTH = 12000  # Conteúdo do prefixo comum; deixa espaço para a TAREFA no fim do prompt
 ENCODING = 'utf-8'
+WRITE_BUFFER_SIZE = 1 << 20  # Buffer de escrita dos arquivos de saída (1 MiB)
+PROGRESS_UPDATE_INTERVAL = 0.05  # Intervalo mínimo entre atualizações da barra (≤ 20 Hz)
+
+# Campos de texto das páginas, em ordem de preferência
+CONTENT_FIELDS = ('conteudo_texto', 'conteudo', 'texto')
+
+# Compressão extrativa local das páginas (antes do envio aos agentes)
+MIN_SENTENCE_WORDS = 5  # Frases menores costumam ser menus, botões e rodapés
+MIN_COMPRESS_SENTENCES = 4  # Abaixo disso a página é mantida como está
+_SENTENCE_SPLIT = re.compile(r'(?<=[.!?])\s+|\n+')
+_WORD_PATTERN = re.compile(r'\w{4,}')
 
+# Palavras funcionais (pt-BR e inglês) ignoradas na pontuação das frases;
+# as com menos de 4 letras já ficam de fora pelo _WORD_PATTERN
+_STOPWORDS = frozenset((
+    'para', 'como', 'mais', 'pelo', 'pela', 'pelos', 'pelas', 'sobre', 'entre',
+    'quando', 'também', 'este', 'esta', 'estes', 'estas', 'isto', 'esse',
+    'essa', 'esses', 'essas', 'isso', 'aquele', 'aquela', 'aquilo', 'muito',
+    'muita', 'muitos', 'muitas', 'pode', 'podem', 'seus', 'suas', 'mesmo',
+    'ainda', 'onde', 'qual', 'quais', 'porque', 'pois', 'depois', 'antes',
+    'cada', 'todo', 'toda', 'todos', 'todas', 'outro', 'outra', 'outros',
+    'outras', 'sendo', 'será', 'serão', 'foram', 'eram', 'está', 'estão',
+    'estar', 'seja', 'sejam', 'temos', 'tinha', 'assim', 'apenas', 'desde',
+    'nosso', 'nossa', 'você', 'vocês', 'deles', 'delas', 'dele',
+    'dela', 'nele', 'nela', 'numa', 'qualquer', 'algum', 'alguma',
+    'alguns', 'algumas', 'that', 'this', 'with', 'from', 'have', 'which',
+    'their', 'there', 'when', 'what', 'will', 'your', 'about', 'into', 'than',
+    'them', 'then', 'these', 'those', 'also', 'been', 'were', 'they', 'more',
+    'only', 'such', 'some', 'each', 'other', 'most', 'very', 'just', 'does',
+))
 
-def process_with_multiple_agents(json_file: str) -> None:
+# Agrupamento de termos curtos em uma única chamada ao resumidor
+SHORT_TERM_THRESHOLD = 600  # Termos com menos caracteres entram em lotes
+SHORT_TERM_BATCH_LENGTH = 4000  # Conteúdo máximo somado de um lote
+
+
+def process_with_multiple_agents(json_file: str, use_cache: bool = True) -> None:
     """
     Processa conteúdo JSON usando sistema multi-agente especializado.
     
     Args:
         json_file (str): Caminho para arquivo JSON com dados coletados
+        use_cache (bool, optional): Se False, refaz todas as chamadas aos
+            agentes em vez de reaproveitar respostas em cache. Default: True
         
     Raises:
         FileNotFoundError: Se o arquivo JSON não for encontrado
@@ -54,398 +121,852 @@ def process_with_multiple_agents(json_file: str) -> None:
         Gera dois arquivos de saída:
         - resumos_parciais_*.txt: Análises individuais por termo
         - sintese_final_*.txt: Síntese unificada de todos os agentes
+        
+        Os termos são processados concorrentemente: executa
+        `create_multi_agent_summary_async` em um novo event loop.
     """
-    print_header("SISTEMA MULTI-AGENTE DE ANÁLISE", "Processamento inteligente com 4 agentes especializados")
-    
-    # Carrega e valida dados
-    data = _load_json_data(json_file)
-    if not data:
-        return
-    
-    # Cria agentes especializados
-    agents = _create_specialized_agents()
-    
-    # Processa dados e gera resumos
-    partial_summaries = _process_terms_with_agents(data, agents, json_file)
-    
-    # Cria síntese final
-    _create_final_synthesis(partial_summaries, agents['sintetizador'], json_file)
-    
-    # Exibe estatísticas finais
-    _display_processing_stats(len(partial_summaries), json_file)
+    asyncio.run(create_multi_agent_summary_async(json_file, use_cache))
 
 
-def _load_json_data(json_file: str) -> Dict[str, Any]:
+def _load_json_data(json_file: str) -> Optional[Iterator[Tuple[str, List[Dict[str, Any]]]]]:
     """
-    Carrega e valida dados do arquivo JSON.
+    Abre o arquivo JSON e prepara a leitura dos termos.
     
     Args:
         json_file (str): Caminho para o arquivo JSON
         
     Returns:
-        Dict[str, Any]: Dados carregados ou dicionário vazio em caso de erro
+        Optional[Iterator[Tuple[str, List[Dict[str, Any]]]]]: Pares
+        (termo, páginas) do campo 'dados', lidos sob demanda, ou None em
+        caso de erro ou sem termos
+        
+    Note:
+        Com `ijson` instalado, os termos são lidos em fluxo, um por vez,
+        sem carregar o arquivo inteiro na memória; sem ele, o arquivo é lido
+        de uma vez com `orjson` (se disponível) ou `json`. Arquivos `.zst`
+        (coletas comprimidas) são descomprimidos em fluxo com `zstandard`.
     """
+    compressed = json_file.endswith('.zst')
+    if compressed and zstandard is None:
+        log.error(f"Instale 'zstandard' para ler o arquivo comprimido: {json_file}")
+        return None
+    
     try:
-        with open(json_file, 'r', encoding=ENCODING) as file:
-            data = json.load(file)
-        
-        log.success(f"Dados carregados com sucesso: {json_file}")
-        
-        # Valida estrutura básica
-        if 'dados' not in data:
-            log.warning("Estrutura JSON inválida: campo 'dados' não encontrado")
-            return {}
-            
-        return data
+        file = open(json_file, 'rb')
+        if compressed:
+            file = zstandard.ZstdDecompressor().stream_reader(file)
         
     except FileNotFoundError:
         log.error(f"Arquivo não encontrado: {json_file}")
-        return {}
-        
-    except json.JSONDecodeError as e:
-        log.error(f"Erro ao decodificar JSON: {e}")
-        return {}
+        return None
         
     except Exception as e:
         log.error(f"Erro inesperado ao carregar arquivo: {e}")
-        return {}
+        return None
+    
+    # Lê só o primeiro termo para validar o arquivo antes de criar os agentes
+    terms = _iter_terms(file)
+    first = next(terms, None)
+    if first is None:
+        return None
+    
+    log.success(f"Dados carregados com sucesso: {json_file}")
+    return itertools.chain([first], terms)
 
 
-def _create_specialized_agents() -> Dict[str, Any]:
+def _iter_terms(file) -> Iterator[Tuple[str, List[Dict[str, Any]]]]:
+    """
+    Lê os pares (termo, páginas) do campo 'dados' e fecha o arquivo ao final.
+    
+    Args:
+        file: Arquivo JSON aberto em modo binário
+        
+    Yields:
+        Tuple[str, List[Dict[str, Any]]]: Termo e suas páginas
+    """
+    with file:
+        try:
+            if ijson is not None:
+                found = False
+                for term, pages in ijson.kvitems(file, 'dados', use_float=True):
+                    found = True
+                    yield term, pages
+            else:
+                data = orjson.loads(file.read()) if orjson is not None else json.load(file)
+                found = 'dados' in data
+                yield from data.get('dados', {}).items()
+            
+            # Valida estrutura básica
+            if not found:
+                log.warning("Estrutura JSON inválida: campo 'dados' não encontrado")
+                
+        except _JSON_ERRORS as e:
+            log.error(f"Erro ao decodificar JSON: {e}")
+
+
+_RESUMIDOR_SYS = (
+    "ESPECIALISTA EM RESUMOS TÉCNICOS\n"
+    "═══════════════════════════════\n\n"
+    "MISSÃO: Extrair e consolidar os pontos mais importantes do conteúdo fornecido.\n\n"
+    "INSTRUÇÕES ESPECÍFICAS:\n"
+    "• Identifique os 5-7 conceitos mais importantes\n"
+    "• Use linguagem técnica mas acessível\n"
+    "• Mantenha a ordem lógica do conteúdo original\n"
+    "• Foque em informações práticas e aplicáveis\n"
+    "• Elimine detalhes redundantes ou secundários\n\n"
+    "FORMATO DE SAÍDA:\n"
+    "📋 RESUMO TÉCNICO:\n"
+    "• [Ponto principal 1 - detalhamento conciso]\n"
+    "• [Ponto principal 2 - detalhamento conciso]\n"
+    "• [Ponto principal 3 - detalhamento conciso]\n"
+    "...\n\n"
+    "Use SEMPRE português brasileiro e seja objetivo."
+)
+
+# Resumidor de lotes: mesma missão, mas a saída é só o JSON pedido no prompt
+_RESUMIDOR_LOTE_SYS = (
+    "ESPECIALISTA EM RESUMOS TÉCNICOS (LOTES)\n"
+    "═══════════════════════════════════════\n\n"
+    "MISSÃO: Resumir separadamente o conteúdo de cada termo numerado recebido.\n\n"
+    "INSTRUÇÕES ESPECÍFICAS:\n"
+    "• Identifique os 5-7 conceitos mais importantes de cada termo\n"
+    "• Use linguagem técnica mas acessível\n"
+    "• Não misture conteúdos de termos diferentes\n\n"
+    "FORMATO DE SAÍDA:\n"
+    "Responda SOMENTE com um array JSON válido, sem texto antes ou depois e sem\n"
+    "blocos de código. Cada objeto identifica o termo pelo NÚMERO da sua seção\n"
+    "(\"### TERMO <número>\"), nunca pelo nome.\n\n"
+    "Use SEMPRE português brasileiro e seja objetivo."
+)
+
+_ANALISTA_SYS = (
+    "ANALISTA SÊNIOR DE CONTEÚDO TÉCNICO\n"
+    "══════════════════════════════════\n\n"
+    "EXPERTISE: Análise profunda, identificação de patterns e extração de insights.\n\n"
+    "RESPONSABILIDADES:\n"
+    "• Identificar tendências e padrões emergentes\n"
+    "• Extrair insights técnicos e estratégicos\n"
+    "• Avaliar qualidade e confiabilidade das informações\n"
+    "• Conectar conceitos e estabelecer relações\n"
+    "• Destacar implicações práticas e aplicações\n\n"
+    "ESTRUTURA OBRIGATÓRIA:\n"
+    "🔍 ANÁLISE TÉCNICA:\n\n"
+    "💡 INSIGHTS PRINCIPAIS:\n"
+    "• [Insight 1 com justificativa]\n"
+    "• [Insight 2 com justificativa]\n\n"
+    "📈 TENDÊNCIAS IDENTIFICADAS:\n"
+    "• [Tendência 1 e implicações]\n"
+    "• [Tendência 2 e implicações]\n\n"
+    "⚡ IMPLICAÇÕES PRÁTICAS:\n"
+    "• [Aplicação prática 1]\n"
+    "• [Aplicação prática 2]\n\n"
+    "Use terminologia técnica apropriada em português brasileiro."
+)
+
+_ORGANIZADOR_SYS = (
+    "ESPECIALISTA EM ARQUITETURA DE INFORMAÇÃO\n"
+    "═══════════════════════════════════════\n\n"
+    "OBJETIVO: Estruturar informações de forma hierárquica, lógica e visualmente clara.\n\n"
+    "METODOLOGIA:\n"
+    "• Criar taxonomia clara dos tópicos\n"
+    "• Estabelecer hierarquia de importância\n"
+    "• Agrupar conceitos relacionados\n"
+    "• Usar formatação visual consistente\n"
+    "• Facilitar navegação e compreensão\n\n"
+    "TEMPLATE OBRIGATÓRIO:\n"
+    "📊 ESTRUTURA ORGANIZACIONAL:\n\n"
+    "# 🎯 TÓPICO PRINCIPAL\n"
+    "## 📝 Seção 1: [Nome da Seção]\n"
+    "### 🔸 Subseção 1.1\n"
+    "   • Ponto importante A\n"
+    "   • Ponto importante B\n"
+    "### 🔸 Subseção 1.2\n"
+    "   • Ponto importante C\n\n"
+    "## 📝 Seção 2: [Nome da Seção]\n"
+    "### 🔸 Subseção 2.1\n"
+    "   • Ponto importante D\n\n"
+    "SEMPRE use emojis, numeração e hierarquia visual clara."
+)
+
+_SINTETIZADOR_SYS = (
+    "SINTETIZADOR MASTER - SÍNTESE EXECUTIVA COMPLETA\n"
+    "═══════════════════════════════════════════════\n\n"
+    "RESPONSABILIDADE CRÍTICA: Criar síntese executiva ABRANGENTE e DETALHADA consolidando todas as análises.\n\n"
+    "PROCESSO AVANÇADO DE SÍNTESE:\n"
+    "• CONSOLIDAR completamente resumos, análises e estruturas organizacionais\n"
+    "• ELIMINAR redundâncias mantendo informações essenciais\n"
+    "• EXPANDIR insights com contexto adicional e implicações\n"
+    "• DETALHAR conclusões e recomendações estratégicas\n"
+    "• PRODUZIR documento executivo extenso e comprehensivo\n"
+    "• MANTER rigor acadêmico com linguagem profissional\n\n"
+    "TEMPLATE EXECUTIVO EXPANDIDO OBRIGATÓRIO:\n\n"
+    "# 🎯 SÍNTESE EXECUTIVA COMPLETA\n\n"
+    "## 📋 RESUMO GERAL CONSOLIDADO\n"
+    "[Visão geral detalhada e consolidada do tema com contexto amplo]\n\n"
+    "## 🔍 DESCOBERTAS PRINCIPAIS DETALHADAS\n"
+    "### 💎 Descoberta Crítica 1\n"
+    "• **Descrição:** [Detalhamento completo]\n"
+    "• **Impacto:** [Análise de impacto específica]\n"
+    "• **Evidências:** [Dados que suportam a descoberta]\n"
+    "• **Implicações:** [Consequências práticas]\n\n"
+    "### 💎 Descoberta Crítica 2\n"
+    "• **Descrição:** [Detalhamento completo]\n"
+    "• **Impacto:** [Análise de impacto específica]\n"
+    "• **Evidências:** [Dados que suportam a descoberta]\n"
+    "• **Implicações:** [Consequências práticas]\n\n"
+    "### 💎 Descoberta Crítica 3\n"
+    "• **Descrição:** [Detalhamento completo]\n"
+    "• **Impacto:** [Análise de impacto específica]\n"
+    "• **Evidências:** [Dados que suportam a descoberta]\n"
+    "• **Implicações:** [Consequências práticas]\n\n"
+    "## 📊 ANÁLISE DE TENDÊNCIAS E PADRÕES\n"
+    "### 📈 Tendências Emergentes\n"
+    "• [Tendência 1 com análise detalhada]\n"
+    "• [Tendência 2 com análise detalhada]\n"
+    "• [Tendência 3 com análise detalhada]\n\n"
+    "### 🔄 Padrões Identificados\n"
+    "• [Padrão 1 e suas manifestações]\n"
+    "• [Padrão 2 e suas manifestações]\n\n"
+    "## 🧠 INSIGHTS ESTRATÉGICOS APROFUNDADOS\n"
+    "### 💡 Insight Estratégico 1\n"
+    "• **Natureza:** [Caracterização do insight]\n"
+    "• **Fundamentação:** [Base teórica ou empírica]\n"
+    "• **Aplicabilidade:** [Contextos de aplicação]\n"
+    "• **Valor Agregado:** [Benefícios específicos]\n\n"
+    "### 💡 Insight Estratégico 2\n"
+    "• **Natureza:** [Caracterização do insight]\n"
+    "• **Fundamentação:** [Base teórica ou empírica]\n"
+    "• **Aplicabilidade:** [Contextos de aplicação]\n"
+    "• **Valor Agregado:** [Benefícios específicos]\n\n"
+    "## 🎯 RECOMENDAÇÕES ESPECÍFICAS E ACIONÁVEIS\n"
+    "### ⚡ Ações Imediatas (0-30 dias)\n"
+    "• [Recomendação 1 com passos específicos]\n"
+    "• [Recomendação 2 com passos específicos]\n\n"
+    "### 📅 Ações de Médio Prazo (1-6 meses)\n"
+    "• [Recomendação estratégica 1]\n"
+    "• [Recomendação estratégica 2]\n\n"
+    "### � Ações de Longo Prazo (6+ meses)\n"
+    "• [Recomendação visionária 1]\n"
+    "• [Recomendação visionária 2]\n\n"
+    "## �🔗 CONEXÕES E INTERRELAÇÕES\n"
+    "### 🌐 Mapa de Conexões\n"
+    "[Análise detalhada de como os diferentes aspectos se relacionam e influenciam mutuamente]\n\n"
+    "### 🔄 Sistemas e Processos\n"
+    "[Identificação de sistemas complexos e processos interconectados]\n\n"
+    "## ⚡ CONCLUSÕES FINAIS E DIREÇÕES FUTURAS\n"
+    "### 🎯 Conclusões Definitivas\n"
+    "[Conclusões consolidadas com base em toda a análise]\n\n"
+    "### 🚀 Direções Estratégicas\n"
+    "[Orientações para desenvolvimentos futuros]\n\n"
+    "### 📝 Considerações Finais\n"
+    "[Reflexões finais e contextualizações adicionais]\n\n"
+    "EXIGÊNCIAS DE QUALIDADE PREMIUM:\n"
+    "• Linguagem executiva sofisticada e profissional\n"
+    "• Português brasileiro formal com precisão técnica\n"
+    "• Máxima clareza, coerência e profundidade\n"
+    "• Foco em valor agregado máximo e aplicabilidade prática\n"
+    "• Estrutura visual rica e hierarquizada\n"
+    "• Densidade informacional alta com organização exemplar"
+)
+
+# Agentes do pipeline: nome -> (prompt de sistema, max_tokens)
+_AGENT_SPECS = {
+    'resumidor': (_RESUMIDOR_SYS, 600),
+    'analista': (_ANALISTA_SYS, 800),
+    'organizador': (_ORGANIZADOR_SYS, 700),
+}
+
+# Aumentado significativamente para sínteses completas
+_SYNTHESIZER_MAX_TOKENS = 2000
+
+
+class _SpecializedAgents(NamedTuple):
+    """Agentes do pipeline multi-agente, acessados por atributo."""
+    
+    resumidor: Callable[[str], Any]
+    analista: Callable[[str], Any]
+    organizador: Callable[[str], Any]
+    resumidor_lote: Callable[[str], Any]
+    sintetizador: Callable[[str], str]
+
+
+# Resumidor de lotes de termos curtos (vários resumos em uma resposta)
+_BATCH_SUMMARY_MAX_TOKENS = 1500
+
+# Modelos dos prompts de usuário, preenchidos com `str.format` a cada termo
+_CONTEXT_HEADER_TMPL = """
+CONTEXTO DO PROCESSAMENTO:
+═══════════════════════════
+🏷️  TERMO: {term}
+📊 ESTATÍSTICAS: {words} palavras, {lines} linhas
+🎯 OBJETIVO: Análise técnica completa e estruturada
+
+"""
+
+_SHARED_PREFIX_TMPL = "CONTEÚDO:\n{content}\n{header}"
+
+_SUMMARY_PROMPT_TMPL = "{prefix}TAREFA: Resuma os pontos técnicos mais importantes do conteúdo acima."
+
+_BATCH_SECTION_TMPL = "### TERMO {number}: {term}\nCONTEÚDO:\n{content}"
+
+_BATCH_SUMMARY_PROMPT_TMPL = """{sections}
+
+TAREFA: Resuma os pontos técnicos mais importantes do conteúdo de CADA termo acima.
+
+Responda APENAS em JSON, sem texto adicional, com um objeto por termo:
+[{{"numero": <número do TERMO>, "resumo": "<resumo em markdown>"}}, ...]"""
+
+_ANALYSIS_PROMPT_TMPL = """{prefix}TAREFA: Analise profundamente o conteúdo, identificando insights e padrões.
+
+Foque em insights não óbvios e conexões importantes entre os conceitos."""
+
+_ORGANIZATION_PROMPT_TMPL = """{prefix}TAREFA: Organize hierarquicamente todas as informações disponíveis.
+
+RESUMO TÉCNICO:
+{summary}
+
+ANÁLISE DETALHADA:
+{analysis}
+
+Crie uma estrutura visual clara que integre resumo, análise e conteúdo original."""
+
+_SYNTHESIS_PROMPT_TMPL = """
+BRIEFING EXECUTIVO PARA SÍNTESE FINAL
+═══════════════════════════════════
+
+📊 ESTATÍSTICAS DO PROJETO:
+• Total de termos analisados: {total_termos}
+• Volume de conteúdo processado: {total_caracteres:,} caracteres
+• Fonte de dados: {arquivo_origem}
+
+🎯 MISSÃO CRÍTICA:
+Você recebeu análises especializadas de múltiplos agentes sobre diferentes aspectos de um tema.
+Sua tarefa é criar uma SÍNTESE EXECUTIVA DEFINITIVA que integre todos os insights de forma coerente.
+
+📋 ANÁLISES DOS AGENTES ESPECIALIZADOS:
+{combined_content}
+
+🎯 INSTRUÇÕES PARA SÍNTESE FINAL:
+• Integre TODOS os insights dos agentes especializados
+• Elimine redundâncias mantendo informações únicas
+• Crie narrativa coerente e fluida
+• Destaque descobertas mais importantes
+• Formule recomendações práticas e aplicáveis
+• Use formatação executiva profissional
+• Mantenha tom técnico mas acessível
+
+ENTREGUE uma síntese que demonstre o valor agregado de todo o processo de análise multi-agente.
+"""
+
+
+@lru_cache(maxsize=None)
+def _create_specialized_agents(
+    factory: Callable[..., Any] = create_agent, 
+    use_cache: bool = True
+) -> _SpecializedAgents:
     """
     Cria o conjunto de agentes especializados para análise.
     
+    Args:
+        factory (Callable[..., Any]): Fábrica dos agentes do pipeline por
+            termo (`create_agent` ou `create_async_agent`)
+        use_cache (bool): Se False, os agentes ignoram respostas em cache
+    
     Returns:
-        Dict[str, Any]: Dicionário com agentes especializados
+        _SpecializedAgents: Agentes especializados (somente leitura)
+        
+    Note:
+        O conjunto é criado uma única vez por combinação de argumentos e
+        reaproveitado nas execuções seguintes. O sintetizador é sempre
+        síncrono: a síntese final é transmitida diretamente para o arquivo
+        à medida que é gerada.
     """
     print_section("CRIANDO AGENTES ESPECIALIZADOS")
     
     with RichStatus("Configurando agentes especializados..."):
-        agents = {
-            'resumidor': create_agent(
-            "ESPECIALISTA EM RESUMOS TÉCNICOS\n"
-            "═══════════════════════════════\n\n"
-            "MISSÃO: Extrair e consolidar os pontos mais importantes do conteúdo fornecido.\n\n"
-            "INSTRUÇÕES ESPECÍFICAS:\n"
-            "• Identifique os 5-7 conceitos mais importantes\n"
-            "• Use linguagem técnica mas acessível\n"
-            "• Mantenha a ordem lógica do conteúdo original\n"
-            "• Foque em informações práticas e aplicáveis\n"
-            "• Elimine detalhes redundantes ou secundários\n\n"
-            "FORMATO DE SAÍDA:\n"
-            "📋 RESUMO TÉCNICO:\n"
-            "• [Ponto principal 1 - detalhamento conciso]\n"
-            "• [Ponto principal 2 - detalhamento conciso]\n"
-            "• [Ponto principal 3 - detalhamento conciso]\n"
-            "...\n\n"
-            "Use SEMPRE português brasileiro e seja objetivo.",
-            max_tokens=600
-        ),
-        
-        'analista': create_agent(
-            "ANALISTA SÊNIOR DE CONTEÚDO TÉCNICO\n"
-            "══════════════════════════════════\n\n"
-            "EXPERTISE: Análise profunda, identificação de patterns e extração de insights.\n\n"
-            "RESPONSABILIDADES:\n"
-            "• Identificar tendências e padrões emergentes\n"
-            "• Extrair insights técnicos e estratégicos\n"
-            "• Avaliar qualidade e confiabilidade das informações\n"
-            "• Conectar conceitos e estabelecer relações\n"
-            "• Destacar implicações práticas e aplicações\n\n"
-            "ESTRUTURA OBRIGATÓRIA:\n"
-            "🔍 ANÁLISE TÉCNICA:\n\n"
-            "💡 INSIGHTS PRINCIPAIS:\n"
-            "• [Insight 1 com justificativa]\n"
-            "• [Insight 2 com justificativa]\n\n"
-            "📈 TENDÊNCIAS IDENTIFICADAS:\n"
-            "• [Tendência 1 e implicações]\n"
-            "• [Tendência 2 e implicações]\n\n"
-            "⚡ IMPLICAÇÕES PRÁTICAS:\n"
-            "• [Aplicação prática 1]\n"
-            "• [Aplicação prática 2]\n\n"
-            "Use terminologia técnica apropriada em português brasileiro.",
-            max_tokens=800
-        ),
-        
-        'organizador': create_agent(
-            "ESPECIALISTA EM ARQUITETURA DE INFORMAÇÃO\n"
-            "═══════════════════════════════════════\n\n"
-            "OBJETIVO: Estruturar informações de forma hierárquica, lógica e visualmente clara.\n\n"
-            "METODOLOGIA:\n"
-            "• Criar taxonomia clara dos tópicos\n"
-            "• Estabelecer hierarquia de importância\n"
-            "• Agrupar conceitos relacionados\n"
-            "• Usar formatação visual consistente\n"
-            "• Facilitar navegação e compreensão\n\n"
-            "TEMPLATE OBRIGATÓRIO:\n"
-            "📊 ESTRUTURA ORGANIZACIONAL:\n\n"
-            "# 🎯 TÓPICO PRINCIPAL\n"
-            "## 📝 Seção 1: [Nome da Seção]\n"
-            "### 🔸 Subseção 1.1\n"
-            "   • Ponto importante A\n"
-            "   • Ponto importante B\n"
-            "### 🔸 Subseção 1.2\n"
-            "   • Ponto importante C\n\n"
-            "## 📝 Seção 2: [Nome da Seção]\n"
-            "### 🔸 Subseção 2.1\n"
-            "   • Ponto importante D\n\n"
-            "SEMPRE use emojis, numeração e hierarquia visual clara.",
-            max_tokens=700
-        ),
-        
-        'sintetizador': create_agent(
-            "SINTETIZADOR MASTER - SÍNTESE EXECUTIVA COMPLETA\n"
-            "═══════════════════════════════════════════════\n\n"
-            "RESPONSABILIDADE CRÍTICA: Criar síntese executiva ABRANGENTE e DETALHADA consolidando todas as análises.\n\n"
-            "PROCESSO AVANÇADO DE SÍNTESE:\n"
-            "• CONSOLIDAR completamente resumos, análises e estruturas organizacionais\n"
-            "• ELIMINAR redundâncias mantendo informações essenciais\n"
-            "• EXPANDIR insights com contexto adicional e implicações\n"
-            "• DETALHAR conclusões e recomendações estratégicas\n"
-            "• PRODUZIR documento executivo extenso e comprehensivo\n"
-            "• MANTER rigor acadêmico com linguagem profissional\n\n"
-            "TEMPLATE EXECUTIVO EXPANDIDO OBRIGATÓRIO:\n\n"
-            "# 🎯 SÍNTESE EXECUTIVA COMPLETA\n\n"
-            "## 📋 RESUMO GERAL CONSOLIDADO\n"
-            "[Visão geral detalhada e consolidada do tema com contexto amplo]\n\n"
-            "## 🔍 DESCOBERTAS PRINCIPAIS DETALHADAS\n"
-            "### 💎 Descoberta Crítica 1\n"
-            "• **Descrição:** [Detalhamento completo]\n"
-            "• **Impacto:** [Análise de impacto específica]\n"
-            "• **Evidências:** [Dados que suportam a descoberta]\n"
-            "• **Implicações:** [Consequências práticas]\n\n"
-            "### 💎 Descoberta Crítica 2\n"
-            "• **Descrição:** [Detalhamento completo]\n"
-            "• **Impacto:** [Análise de impacto específica]\n"
-            "• **Evidências:** [Dados que suportam a descoberta]\n"
-            "• **Implicações:** [Consequências práticas]\n\n"
-            "### 💎 Descoberta Crítica 3\n"
-            "• **Descrição:** [Detalhamento completo]\n"
-            "• **Impacto:** [Análise de impacto específica]\n"
-            "• **Evidências:** [Dados que suportam a descoberta]\n"
-            "• **Implicações:** [Consequências práticas]\n\n"
-            "## 📊 ANÁLISE DE TENDÊNCIAS E PADRÕES\n"
-            "### 📈 Tendências Emergentes\n"
-            "• [Tendência 1 com análise detalhada]\n"
-            "• [Tendência 2 com análise detalhada]\n"
-            "• [Tendência 3 com análise detalhada]\n\n"
-            "### 🔄 Padrões Identificados\n"
-            "• [Padrão 1 e suas manifestações]\n"
-            "• [Padrão 2 e suas manifestações]\n\n"
-            "## 🧠 INSIGHTS ESTRATÉGICOS APROFUNDADOS\n"
-            "### 💡 Insight Estratégico 1\n"
-            "• **Natureza:** [Caracterização do insight]\n"
-            "• **Fundamentação:** [Base teórica ou empírica]\n"
-            "• **Aplicabilidade:** [Contextos de aplicação]\n"
-            "• **Valor Agregado:** [Benefícios específicos]\n\n"
-            "### 💡 Insight Estratégico 2\n"
-            "• **Natureza:** [Caracterização do insight]\n"
-            "• **Fundamentação:** [Base teórica ou empírica]\n"
-            "• **Aplicabilidade:** [Contextos de aplicação]\n"
-            "• **Valor Agregado:** [Benefícios específicos]\n\n"
-            "## 🎯 RECOMENDAÇÕES ESPECÍFICAS E ACIONÁVEIS\n"
-            "### ⚡ Ações Imediatas (0-30 dias)\n"
-            "• [Recomendação 1 com passos específicos]\n"
-            "• [Recomendação 2 com passos específicos]\n\n"
-            "### 📅 Ações de Médio Prazo (1-6 meses)\n"
-            "• [Recomendação estratégica 1]\n"
-            "• [Recomendação estratégica 2]\n\n"
-            "### � Ações de Longo Prazo (6+ meses)\n"
-            "• [Recomendação visionária 1]\n"
-            "• [Recomendação visionária 2]\n\n"
-            "## �🔗 CONEXÕES E INTERRELAÇÕES\n"
-            "### 🌐 Mapa de Conexões\n"
-            "[Análise detalhada de como os diferentes aspectos se relacionam e influenciam mutuamente]\n\n"
-            "### 🔄 Sistemas e Processos\n"
-            "[Identificação de sistemas complexos e processos interconectados]\n\n"
-            "## ⚡ CONCLUSÕES FINAIS E DIREÇÕES FUTURAS\n"
-            "### 🎯 Conclusões Definitivas\n"
-            "[Conclusões consolidadas com base em toda a análise]\n\n"
-            "### 🚀 Direções Estratégicas\n"
-            "[Orientações para desenvolvimentos futuros]\n\n"
-            "### 📝 Considerações Finais\n"
-            "[Reflexões finais e contextualizações adicionais]\n\n"
-            "EXIGÊNCIAS DE QUALIDADE PREMIUM:\n"
-            "• Linguagem executiva sofisticada e profissional\n"
-            "• Português brasileiro formal com precisão técnica\n"
-            "• Máxima clareza, coerência e profundidade\n"
-            "• Foco em valor agregado máximo e aplicabilidade prática\n"
-            "• Estrutura visual rica e hierarquizada\n"
-            "• Densidade informacional alta com organização exemplar",
-            max_tokens=2000  # Aumentado significativamente para sínteses completas
+        agents = _SpecializedAgents(
+            **{
+                name: factory(system_prompt, max_tokens=tokens, use_cache=use_cache)
+                for name, (system_prompt, tokens) in _AGENT_SPECS.items()
+            },
+            resumidor_lote=factory(
+                _RESUMIDOR_LOTE_SYS,
+                max_tokens=_BATCH_SUMMARY_MAX_TOKENS,
+                use_cache=use_cache
+            ),
+            sintetizador=create_agent(
+                _SINTETIZADOR_SYS,
+                max_tokens=_SYNTHESIZER_MAX_TOKENS,
+                use_cache=use_cache
+            )
         )
-    }
     
     log.success(f"{len(agents)} agentes especializados criados com prompts otimizados")
     return agents
 
 
-def _process_terms_with_agents(
-    data: Dict[str, Any], 
-    agents: Dict[str, Any], 
+async def _process_terms_with_agents_async(
+    data: Iterable[Tuple[str, List[Dict[str, Any]]]], 
+    agents: _SpecializedAgents, 
     json_file: str
 ) -> List[str]:
     """
-    Processa cada termo usando a sequência de agentes especializados.
+    Processa todos os termos concorrentemente com agentes assíncronos.
     
     Args:
-        data (Dict[str, Any]): Dados carregados do JSON
-        agents (Dict[str, Any]): Agentes especializados
+        data (Iterable[Tuple[str, List[Dict[str, Any]]]]): Pares (termo,
+            páginas) lidos do JSON
+        agents (_SpecializedAgents): Agentes especializados assíncronos
         json_file (str): Nome do arquivo original para nomenclatura
         
     Returns:
-        List[str]: Lista de resumos parciais gerados
+        List[str]: Lista de resumos parciais, na ordem original dos termos
+        
+    Note:
+        Cada termo é gravado assim que seu pipeline termina, em um arquivo
+        temporário que substitui o definitivo (`os.replace`) ao final; o
+        número de chamadas simultâneas à API é limitado em `core.co`. Termos
+        curtos têm os resumos gerados em lote (`_schedule_batch_summaries`).
     """
-    # Configuração de arquivos de saída
     partial_file = _generate_output_filename(json_file, 'resumos_parciais_', '.txt')
-    partial_summaries = []
     
     print_section("PROCESSAMENTO MULTI-AGENTE POR TERMO")
     
-    total_terms = len(data.get('dados', {}))
+    # Extrai conteúdo de todos os termos antes de disparar as chamadas
+    terms = _extract_terms(data)
     
-    with open(partial_file, 'w', encoding=ENCODING) as file:
-        # Cabeçalho do arquivo
-        _write_file_header(file, "RESUMOS PARCIAIS - PIPELINE MULTI-AGENTE")
-        
-        term_counter = 0
-        
-        # Usa RichProgress para mostrar progresso
-        with RichProgress(f"Processando {total_terms} termos") as progress:
-            for term, pages in data.get('dados', {}).items():
-                term_counter += 1
-                progress.update(
-                    (term_counter / total_terms) * 100,
-                    f"Termo {term_counter}/{total_terms}: {term}"
-                )
-                
-                # Extrai e prepara conteúdo do termo
-                term_content = _extract_term_content(pages)
-                
-                if not term_content:
-                    log.warning(f"Nenhum conteúdo válido encontrado para '{term}'")
-                    continue
-                
-                # Aplica pipeline de agentes
-                term_result = _apply_agent_pipeline(term, term_content, agents)
-                
-                # Salva resultado parcial
-                _write_term_result(file, term, term_result)
+    total_terms = len(terms)
+    partial_summaries = [None] * total_terms
+    batch_summaries = _schedule_batch_summaries(terms, agents)
+    completed = 0
+    last_update = 0.0
+    
+    # Grava em arquivo temporário e só o move para o nome final ao terminar,
+    # sem deixar um arquivo de resumos pela metade se a execução falhar
+    temp_file = partial_file + '.tmp'
+    
+    try:
+        with open(temp_file, 'w', encoding=ENCODING, buffering=WRITE_BUFFER_SIZE) as file:
+            # Cabeçalho do arquivo
+            _write_file_header(file, "RESUMOS PARCIAIS - PIPELINE MULTI-AGENTE")
+            
+            with RichProgress(f"Processando {total_terms} termos", total=total_terms) as progress:
                 
-                # Adiciona à lista para síntese final
-                partial_summaries.append(_format_partial_summary(term, term_result))
+                async def process_term(index: int, term: str, term_content: str) -> None:
+                    nonlocal completed, last_update
+                    term_result = await _apply_agent_pipeline_async(
+                        term, term_content, agents, batch_summaries.get(term)
+                    )
+                    
+                    # Salva resultado parcial assim que o termo termina
+                    _write_term_result(file, term, term_result)
+                    partial_summaries[index] = _format_partial_summary(term, term_result)
+                    
+                    completed += 1
+                    
+                    # Limita a frequência de redesenho da barra (sempre mostra o último)
+                    now = time.monotonic()
+                    if completed == total_terms or now - last_update > PROGRESS_UPDATE_INTERVAL:
+                        last_update = now
+                        progress.update(completed, f"Termo {completed}/{total_terms}: {term}")
+                    log.success(f"Termo '{term}' processado com sucesso")
                 
-                log.success(f"Termo '{term}' processado com sucesso")
+                await asyncio.gather(*(
+                    process_term(index, term, term_content)
+                    for index, (term, term_content) in enumerate(terms)
+                ))
+        
+    except Exception:
+        # Não deixa o arquivo temporário incompleto para trás
+        if os.path.exists(temp_file):
+            os.remove(temp_file)
+        raise
     
+    os.replace(temp_file, partial_file)
     log.info(f"Resumos parciais salvos em: {partial_file}")
     return partial_summaries
 
 
-def _extract_term_content(pages: List[Dict[str, Any]]) -> str:
+def _extract_terms(data: Iterable[Tuple[str, List[Dict[str, Any]]]]) -> List[Tuple[str, str]]:
+    """
+    Extrai o conteúdo de cada termo, descartando termos sem conteúdo válido.
+    
+    Args:
+        data (Iterable[Tuple[str, List[Dict[str, Any]]]]): Pares (termo,
+            páginas) lidos do JSON
+        
+    Returns:
+        List[Tuple[str, str]]: Pares (termo, conteúdo), na ordem original
+        
+    Note:
+        Páginas idênticas já enviadas em outro termo não são repetidas, a
+        menos que o termo fique sem conteúdo próprio. Por padrão as páginas
+        de cada termo são descartadas assim que lidas; com
+        `SystemConfig.ENABLE_PARALLEL_PROCESSING`, os termos são lidos de uma
+        vez e a compressão das páginas roda antes, em até
+        `SystemConfig.MAX_WORKERS` processos. A montagem do conteúdo segue
+        igual nos dois modos, e o resultado também.
+    """
+    seen_pages = set()
+    compressed = None
+    
+    if SystemConfig.ENABLE_PARALLEL_PROCESSING:
+        data = list(data)
+        compressed = _compress_pages_parallel(data)
+    
+    extracted = (
+        (
+            term,
+            _extract_term_content(pages, seen_pages, compressed)
+            or _extract_term_content(pages, compressed=compressed)
+        )
+        for term, pages in data
+    )
+    
+    terms = []
+    for term, term_content in extracted:
+        if term_content:
+            terms.append((term, term_content))
+        else:
+            log.warning(f"Nenhum conteúdo válido encontrado para '{term}'")
+    
+    return terms
+
+
+def _usable_page_text(page: Dict[str, Any]) -> str:
+    """Retorna o texto da página, ou '' se ela falhou ou é pequena demais."""
+    if page.get('status') != 'sucesso':
+        return ''
+    
+    # Tenta múltiplos campos de conteúdo
+    text = next((page[field] for field in CONTENT_FIELDS if page.get(field)), '')
+    
+    # Filtra conteúdo muito pequeno
+    return text if len(text) > 100 else ''
+
+
+def _page_digest(text: str) -> bytes:
+    """Hash (BLAKE2b) que identifica páginas de texto idêntico."""
+    return hashlib.blake2b(text.encode(ENCODING), digest_size=16).digest()
+
+
+def _compress_pages_parallel(data: List[Tuple[str, List[Dict[str, Any]]]]) -> Dict[bytes, str]:
+    """
+    Comprime em processos paralelos cada página distinta aproveitável.
+    
+    Args:
+        data (List[Tuple[str, List[Dict[str, Any]]]]): Pares (termo, páginas)
+        
+    Returns:
+        Dict[bytes, str]: Texto comprimido por hash da página, no formato
+        esperado por `_extract_term_content`
+    """
+    texts = {}
+    for _, pages in data:
+        for page in pages:
+            text = _usable_page_text(page)
+            if text:
+                texts.setdefault(_page_digest(text), text)
+    
+    with ProcessPoolExecutor(max_workers=SystemConfig.MAX_WORKERS) as executor:
+        return dict(zip(texts, executor.map(_compress_page, texts.values(), chunksize=4)))
+
+
+def _schedule_batch_summaries(
+    terms: List[Tuple[str, str]], 
+    agents: _SpecializedAgents
+) -> Dict[str, Awaitable[Dict[str, str]]]:
+    """
+    Agrupa os termos curtos e dispara um resumo em lote para cada grupo.
+    
+    Args:
+        terms (List[Tuple[str, str]]): Pares (termo, conteúdo) a processar
+        agents (_SpecializedAgents): Agentes especializados assíncronos
+        
+    Returns:
+        Dict[str, Awaitable[Dict[str, str]]]: Tarefa do lote de cada termo
+        agrupado; termos longos ou sozinhos no lote ficam de fora
+        
+    Note:
+        Termos com menos de SHORT_TERM_THRESHOLD caracteres são reunidos em
+        lotes de até SHORT_TERM_BATCH_LENGTH caracteres; cada lote gera uma
+        única chamada ao resumidor em vez de uma por termo.
+    """
+    batches = []
+    current = []
+    size = 0
+    
+    for term, content in terms:
+        if len(content) >= SHORT_TERM_THRESHOLD:
+            continue
+        if current and size + len(content) > SHORT_TERM_BATCH_LENGTH:
+            batches.append(current)
+            current, size = [], 0
+        current.append((term, content))
+        size += len(content)
+    
+    if current:
+        batches.append(current)
+    
+    scheduled = {}
+    for batch in batches:
+        if len(batch) < 2:
+            continue
+        task = asyncio.ensure_future(_summarize_batch(batch, agents.resumidor_lote))
+        for term, _ in batch:
+            scheduled[term] = task
+    
+    return scheduled
+
+
+async def _summarize_batch(batch: List[Tuple[str, str]], agent: Any) -> Dict[str, str]:
+    """
+    Resume um lote de termos curtos em uma única chamada ao agente.
+    
+    Args:
+        batch (List[Tuple[str, str]]): Pares (termo, conteúdo) do lote
+        agent (Any): Agente resumidor de lotes
+        
+    Returns:
+        Dict[str, str]: Resumo de cada termo encontrado na resposta (vazio se
+        a resposta não for um JSON válido)
+        
+    Note:
+        Os resumos são associados aos termos pelo número da seção
+        (`### TERMO <número>`), não pelo nome devolvido pelo modelo.
+    """
+    response = await agent(_build_batch_summary_prompt(batch))
+    
+    summaries = {}
+    for item in parse_json_objects(response):
+        if item.get('resumo'):
+            try:
+                number = int(item['numero'])
+            except (KeyError, TypeError, ValueError):
+                continue
+            if 1 <= number <= len(batch):
+                summaries[batch[number - 1][0]] = str(item['resumo'])
+    return summaries
+
+
+def _compress_page(text: str) -> str:
+    """
+    Comprime o texto de uma página mantendo só as frases mais relevantes.
+    
+    Args:
+        text (str): Texto extraído da página
+        
+    Returns:
+        str: Frases selecionadas, na ordem original
+        
+    Note:
+        Páginas que já cabem em MAX_CONTENT_LENGTH são mantidas inteiras.
+        Nas demais, descarta frases curtas demais (menus, botões, rodapés) e
+        frases repetidas; das restantes, mantém as que pontuam acima da
+        mediana pelo TF-IDF médio de suas palavras, com cada frase como
+        documento e sem palavras funcionais (termos que aparecem em quase
+        todas as frases pesam pouco; os distintivos, muito).
+    """
+    if len(text) <= MAX_CONTENT_LENGTH:
+        return text
+    
+    sentences = []
+    seen = set()
+    for sentence in _SENTENCE_SPLIT.split(text):
+        sentence = sentence.strip()
+        words = [
+            word for word in _WORD_PATTERN.findall(sentence.lower())
+            if word not in _STOPWORDS
+        ]
+        if len(sentence.split()) < MIN_SENTENCE_WORDS or not words or sentence in seen:
+            continue
+        seen.add(sentence)
+        sentences.append((sentence, words))
+    
+    if len(sentences) < MIN_COMPRESS_SENTENCES:
+        return " ".join(sentence for sentence, _ in sentences) or text
+    
+    # Frequência inversa por frase: em quantas frases cada palavra aparece
+    sentence_frequencies = Counter(word for _, words in sentences for word in set(words))
+    total = len(sentences)
+    idf = {word: math.log(total / count) for word, count in sentence_frequencies.items()}
+    scores = [sum(idf[word] for word in words) / len(words) for _, words in sentences]
+    threshold = statistics.median(scores)
+    
+    return " ".join(
+        sentence for (sentence, _), score in zip(sentences, scores) if score >= threshold
+    )
+
+
+def _extract_term_content(
+    pages: List[Dict[str, Any]], 
+    seen_pages: Optional[Set[bytes]] = None,
+    compressed: Optional[Dict[bytes, str]] = None
+) -> str:
     """
     Extrai e combina conteúdo válido de todas as páginas de um termo.
     
     Args:
         pages (List[Dict[str, Any]]): Lista de páginas do termo
+        seen_pages (Optional[Set[bytes]]): Hashes (BLAKE2b) das páginas já
+            usadas; páginas repetidas são ignoradas e as novas, registradas
+        compressed (Optional[Dict[bytes, str]]): Páginas já comprimidas,
+            por hash (ver `_compress_pages_parallel`)
         
     Returns:
         str: Conteúdo combinado e limitado
+        
+    Note:
+        O texto de cada página passa antes por `_compress_page`, que remove
+        trechos repetidos ou pouco informativos. Cada página contribui com
+        até MAX_CONTENT_LENGTH caracteres e o total
+        para em MAX_AGENT_CONTENT_LENGTH (o que os agentes chegam a receber),
+        escrevendo cada trecho uma única vez no buffer.
     """
-    valid_content = []
+    buffer = io.StringIO()
+    remaining = MAX_AGENT_CONTENT_LENGTH
+    separator = ""
     
     for page in pages:
-        if page.get('status') == 'sucesso':
-            # Tenta múltiplos campos de conteúdo
-            text = (
-                page.get('conteudo_texto') or 
-                page.get('conteudo', '') or 
-                page.get('texto', '')
-            )
-            
-            # Filtra conteúdo muito pequeno
-            if len(text) > 100:
-                # Limita tamanho para evitar sobrecarga
-                limited_text = text[:MAX_CONTENT_LENGTH] if len(text) > MAX_CONTENT_LENGTH else text
-                valid_content.append(limited_text)
+        text = _usable_page_text(page)
+        if not text:
+            continue
+        
+        # Limita tamanho para evitar sobrecarga
+        if remaining - len(separator) <= 0:
+            break
+        
+        page_hash = _page_digest(text) if seen_pages is not None or compressed is not None else None
+        
+        # Ignora páginas idênticas às já enviadas aos agentes
+        if seen_pages is not None:
+            if page_hash in seen_pages:
+                continue
+            seen_pages.add(page_hash)
+        
+        # Mantém só as frases relevantes
+        text = compressed[page_hash] if compressed is not None else _compress_page(text)
+        remaining -= len(separator)
+        
+        piece = text[:min(MAX_CONTENT_LENGTH, remaining)]
+        buffer.write(separator)
+        buffer.write(piece)
+        remaining -= len(piece)
+        separator = "\n\n"
     
-    return "\n\n".join(valid_content)
+    return buffer.getvalue()
 
 
-def _apply_agent_pipeline(
+async def _apply_agent_pipeline_async(
     term: str, 
     content: str, 
-    agents: Dict[str, Any]
+    agents: _SpecializedAgents,
+    batch_summary: Optional[Awaitable[Dict[str, str]]] = None
 ) -> Dict[str, str]:
     """
-    Aplica sequência de agentes especializados em um termo.
+    Aplica a sequência de agentes especializados (assíncronos) em um termo.
     
     Args:
         term (str): Nome do termo sendo processado
         content (str): Conteúdo combinado do termo
-        agents (Dict[str, Any]): Agentes especializados
+        agents (_SpecializedAgents): Agentes especializados assíncronos
+        batch_summary (Optional[Awaitable[Dict[str, str]]]): Resumos do lote
+            do termo, quando ele foi agrupado com outros termos curtos
         
     Returns:
         Dict[str, str]: Resultados de cada agente
+        
+    Note:
+        Se o termo não aparecer na resposta do lote, o resumidor é chamado
+        individualmente. Resumidor e analista só dependem do conteúdo e rodam em paralelo; o
+        organizador espera os dois e integra as saídas. Com
+        `SystemConfig.COMPACT_DOWNSTREAM`, o organizador recebe apenas o
+        início do conteúdo original. As respostas ficam no cache, então novas
+        execuções não as regeneram.
     """
-    print(f"      🔄 Executando pipeline multi-agente otimizado...")
+    prefix = _build_shared_prefix(term, content[:MAX_AGENT_CONTENT_LENGTH])
     
-    # Preparar contexto rico para os agentes
-    content_stats = {
-        'tamanho': len(content),
-        'palavras': len(content.split()),
-        'linhas': len(content.splitlines())
-    }
+    summary, analysis = await asyncio.gather(
+        _summarize_term(term, prefix, agents, batch_summary),
+        agents.analista(_build_analysis_prompt(prefix))
+    )
     
-    context_header = f"""
-CONTEXTO DO PROCESSAMENTO:
-═══════════════════════════
-🏷️  TERMO: {term}
-📊 ESTATÍSTICAS: {content_stats['palavras']} palavras, {content_stats['linhas']} linhas
-🎯 OBJETIVO: Análise técnica completa e estruturada
-
-"""
+    if SystemConfig.COMPACT_DOWNSTREAM:
+        prefix = _build_shared_prefix(term, content[:SystemConfig.COMPACT_DOWNSTREAM_LENGTH])
     
-    # Agente 1: Resumidor
-    print(f"      🤖 Agente Resumidor processando...")
-    summary_prompt = f"{context_header}TAREFA: Resuma os pontos técnicos mais importantes do conteúdo abaixo.\n\nCONTEÚDO:\n{content}"
-    summary = agents['resumidor'](summary_prompt)
+    organization = await agents.organizador(
+        _build_organization_prompt(prefix, summary, analysis)
+    )
     
-    # Agente 2: Analista (com contexto do resumo)
-    print(f"      🤖 Agente Analista processando...")
-    analysis_prompt = f"""{context_header}TAREFA: Analise profundamente o conteúdo, identificando insights e padrões.
+    return {
+        'resumo': summary,
+        'analise': analysis,
+        'organizacao': organization
+    }
 
-RESUMO INICIAL DISPONÍVEL:
-{summary}
 
-CONTEÚDO COMPLETO PARA ANÁLISE:
-{content}
+async def _summarize_term(
+    term: str, 
+    prefix: str, 
+    agents: _SpecializedAgents, 
+    batch_summary: Optional[Awaitable[Dict[str, str]]]
+) -> str:
+    """Obtém o resumo do termo a partir do lote ou do resumidor individual."""
+    if batch_summary is not None:
+        summary = (await batch_summary).get(term)
+        if summary:
+            return summary
+    
+    return await agents.resumidor(_build_summary_prompt(prefix))
+
 
-Foque em insights não cobertos no resumo e conexões importantes."""
+def _build_context_header(term: str, content: str) -> str:
+    """Monta o cabeçalho de contexto compartilhado pelos agentes de um termo."""
+    # Estatísticas aproximadas por contagem de separadores (str.count, sem
+    # criar listas): cada espaço ou quebra de linha separa duas palavras
+    lines = content.count('\n') + 1
+    words = content.count(' ') + lines
     
-    analysis = agents['analista'](analysis_prompt)
+    return _CONTEXT_HEADER_TMPL.format(term=term, words=words, lines=lines)
+
+
+def _build_shared_prefix(term: str, content: str) -> str:
+    """
+    Monta o início comum dos prompts dos agentes de um termo.
     
-    # Agente 3: Organizador (com contexto acumulado)
-    print(f"      🤖 Agente Organizador processando...")
-    organization_prompt = f"""{context_header}TAREFA: Organize hierarquicamente todas as informações disponíveis.
+    Os três agentes recebem exatamente os mesmos caracteres iniciais
+    (conteúdo + contexto); só o final (TAREFA e saídas anteriores) muda,
+    o que permite ao provedor reaproveitar o processamento do prefixo.
+    """
+    return _SHARED_PREFIX_TMPL.format(
+        content=content,
+        header=_build_context_header(term, content)
+    )
 
-RESUMO TÉCNICO:
-{summary}
 
-ANÁLISE DETALHADA:
-{analysis}
+def _build_summary_prompt(prefix: str) -> str:
+    """Monta o prompt do agente resumidor."""
+    return _SUMMARY_PROMPT_TMPL.format(prefix=prefix)
 
-CONTEÚDO ORIGINAL:
-{content[:1500]}...
 
-Crie uma estrutura visual clara que integre resumo, análise e conteúdo original."""
-    
-    organization = agents['organizador'](organization_prompt)
+def _build_batch_summary_prompt(batch: List[Tuple[str, str]]) -> str:
+    """Monta o prompt do resumidor para um lote de termos curtos."""
+    sections = "\n\n".join(
+        _BATCH_SECTION_TMPL.format(number=number, term=term, content=content)
+        for number, (term, content) in enumerate(batch, 1)
+    )
     
-    return {
-        'resumo': summary,
-        'analise': analysis,
-        'organizacao': organization
-    }
+    return _BATCH_SUMMARY_PROMPT_TMPL.format(sections=sections)
+
+
+def _build_analysis_prompt(prefix: str) -> str:
+    """Monta o prompt do agente analista (independe do resumo)."""
+    return _ANALYSIS_PROMPT_TMPL.format(prefix=prefix)
+
+
+def _build_organization_prompt(prefix: str, summary: str, analysis: str) -> str:
+    """Monta o prompt do agente organizador (com contexto acumulado)."""
+    return _ORGANIZATION_PROMPT_TMPL.format(prefix=prefix, summary=summary, analysis=analysis)
 
 
 def _create_final_synthesis(
@@ -467,28 +988,27 @@ def _create_final_synthesis(
         print("❌ Nenhum resumo parcial disponível para síntese")
         return
     
-    # Combina todos os resumos parciais
-    combined_content = "\n\n" + "="*60 + "\n\n".join(partial_summaries)
+    # Cada resumo é precedido pelo separador; o comprimento acumulado diz,
+    # por busca binária, quantos resumos completos cabem no limite
+    separator = "\n\n" + "="*60 + "\n\n"
+    cumulative_lengths = list(itertools.accumulate(
+        len(separator) + len(summary) for summary in partial_summaries
+    ))
+    cut = bisect.bisect_right(cumulative_lengths, MAX_SYNTHESIS_LENGTH)
+    included_summaries = partial_summaries[:cut]
     
     # Limita conteúdo para evitar sobrecarga do agente
-    if len(combined_content) > MAX_SYNTHESIS_LENGTH:
-        # Trunca inteligentemente mantendo resumos completos
-        truncated_summaries = []
-        current_length = 0
-        
-        for summary in partial_summaries:
-            if current_length + len(summary) <= MAX_SYNTHESIS_LENGTH:
-                truncated_summaries.append(summary)
-                current_length += len(summary)
-            else:
-                # Adiciona resumo parcial do último item
-                remaining_space = MAX_SYNTHESIS_LENGTH - current_length - 100
-                if remaining_space > 200:
-                    truncated_summaries.append(summary[:remaining_space] + "\n\n[RESUMO TRUNCADO]")
-                break
+    if cut < len(partial_summaries):
+        # Adiciona resumo parcial do primeiro item que não coube
+        current_length = cumulative_lengths[cut - 1] if cut else 0
+        remaining_space = MAX_SYNTHESIS_LENGTH - current_length - 100
+        if remaining_space > 200:
+            included_summaries.append(partial_summaries[cut][:remaining_space] + "\n\n[RESUMO TRUNCADO]")
         
-        combined_content = "\n\n" + "="*60 + "\n\n".join(truncated_summaries)
-        print(f"   ⚠️ Conteúdo otimizado: {len(truncated_summaries)} de {len(partial_summaries)} resumos incluídos")
+        print(f"   ⚠️ Conteúdo otimizado: {len(included_summaries)} de {len(partial_summaries)} resumos incluídos")
+    
+    # Junta os resumos uma única vez, já com o corte definido
+    combined_content = separator.join([""] + included_summaries)
     
     # Estatísticas para contexto
     stats = {
@@ -498,52 +1018,42 @@ def _create_final_synthesis(
     }
     
     # Prompt otimizado para síntese executiva
-    synthesis_prompt = f"""
-BRIEFING EXECUTIVO PARA SÍNTESE FINAL
-═══════════════════════════════════
-
-📊 ESTATÍSTICAS DO PROJETO:
-• Total de termos analisados: {stats['total_termos']}
-• Volume de conteúdo processado: {stats['total_caracteres']:,} caracteres
-• Fonte de dados: {stats['arquivo_origem']}
-
-🎯 MISSÃO CRÍTICA:
-Você recebeu análises especializadas de múltiplos agentes sobre diferentes aspectos de um tema.
-Sua tarefa é criar uma SÍNTESE EXECUTIVA DEFINITIVA que integre todos os insights de forma coerente.
-
-📋 ANÁLISES DOS AGENTES ESPECIALIZADOS:
-{combined_content}
-
-🎯 INSTRUÇÕES PARA SÍNTESE FINAL:
-• Integre TODOS os insights dos agentes especializados
-• Elimine redundâncias mantendo informações únicas
-• Crie narrativa coerente e fluida
-• Destaque descobertas mais importantes
-• Formule recomendações práticas e aplicáveis
-• Use formatação executiva profissional
-• Mantenha tom técnico mas acessível
-
-ENTREGUE uma síntese que demonstre o valor agregado de todo o processo de análise multi-agente.
-"""
-    
-    # Gera síntese final
-    final_synthesis = synthesizer(synthesis_prompt)
+    synthesis_prompt = _SYNTHESIS_PROMPT_TMPL.format(
+        combined_content=combined_content,
+        **stats
+    )
     
-    # Salva síntese final
+    # Gera e salva síntese final
     final_file = _generate_output_filename(json_file, 'sintese_final_', '.txt')
     
     with open(final_file, 'w', encoding=ENCODING) as file:
         _write_file_header(file, "SÍNTESE FINAL - SISTEMA MULTI-AGENTE OTIMIZADO")
-        file.write(final_synthesis)
-        file.write("\n\n" + "="*80 + "\n")
-        file.write(f"📊 METADATA DO PROCESSAMENTO AVANÇADO\n")
-        file.write(f"   • Termos processados: {stats['total_termos']}\n")
-        file.write(f"   • Agentes utilizados: 4 (Resumidor, Analista, Organizador, Sintetizador)\n")
-        file.write(f"   • Volume processado: {stats['total_caracteres']:,} caracteres\n")
-        file.write(f"   • Arquivo fonte: {stats['arquivo_origem']}\n")
-        file.write(f"   • Tokens otimizados: Sistema adaptativo\n")
-        file.write(f"   • Data/Hora: {datetime.now().strftime('%d/%m/%Y %H:%M:%S')}\n")
-        file.write(f"   • Versão do sistema: 2.0 (Clean Code + IA Otimizada)\n")
+        
+        # Grava os trechos da síntese no arquivo à medida que são gerados
+        stream = getattr(synthesizer, 'stream', None)
+        if stream is not None:
+            synthesis_parts = []
+            for chunk in stream(synthesis_prompt):
+                file.write(chunk)
+                synthesis_parts.append(chunk)
+            final_synthesis = "".join(synthesis_parts)
+        else:
+            final_synthesis = synthesizer(synthesis_prompt)
+            file.write(final_synthesis)
+        
+        # Rodapé de metadados montado e gravado de uma só vez
+        footer_lines = [
+            "\n\n" + "="*80 + "\n",
+            "📊 METADATA DO PROCESSAMENTO AVANÇADO\n",
+            f"   • Termos processados: {stats['total_termos']}\n",
+            "   • Agentes utilizados: 4 (Resumidor, Analista, Organizador, Sintetizador)\n",
+            f"   • Volume processado: {stats['total_caracteres']:,} caracteres\n",
+            f"   • Arquivo fonte: {stats['arquivo_origem']}\n",
+            "   • Tokens otimizados: Sistema adaptativo\n",
+            f"   • Data/Hora: {datetime.now().strftime('%d/%m/%Y %H:%M:%S')}\n",
+            "   • Versão do sistema: 2.0 (Clean Code + IA Otimizada)\n",
+        ]
+        file.write("".join(footer_lines))
     
     print(f"🎉 Síntese final otimizada salva em: {final_file}")
     
@@ -559,14 +1069,17 @@ ENTREGUE uma síntese que demonstre o valor agregado de todo o processo de anál
 
 def _generate_output_filename(original_file: str, prefix: str, extension: str) -> str:
     """Gera nome de arquivo de saída baseado no arquivo original."""
-    return original_file.replace('dados_', prefix).replace('.json', extension)
+    # As saídas são texto simples, mesmo quando os dados vêm compactados (.zst)
+    return original_file.removesuffix('.zst').replace('dados_', prefix).replace('.json', extension)
 
 
 def _write_file_header(file, title: str) -> None:
     """Escreve cabeçalho padrão nos arquivos de saída."""
-    file.write(f"{title}\n")
-    file.write(f"Data: {datetime.now().strftime('%d/%m/%Y %H:%M:%S')}\n")
-    file.write("="*80 + "\n\n")
+    file.write(
+        f"{title}\n"
+        f"Data: {datetime.now().strftime('%d/%m/%Y %H:%M:%S')}\n"
+        f"{'='*80}\n\n"
+    )
 
 
 def _write_term_result(file, term: str, result: Dict[str, str]) -> None:
@@ -588,7 +1101,6 @@ TERMO: {term}
 
 """
     file.write(formatted_result)
-    file.flush()  # Força escrita imediata
 
 
 def _format_partial_summary(term: str, result: Dict[str, str]) -> str:
@@ -612,18 +1124,58 @@ def _display_processing_stats(terms_processed: int, json_file: str) -> None:
     print(f"   ⏱️ Processamento concluído: {datetime.now().strftime('%H:%M:%S')}")
 
 
-def create_multi_agent_summary(json_file: str) -> None:
+async def create_multi_agent_summary_async(json_file: str, use_cache: bool = True) -> None:
+    """
+    Versão assíncrona do processamento multi-agente.
+    
+    Args:
+        json_file (str): Caminho para arquivo JSON com dados coletados
+        use_cache (bool, optional): Se False, refaz todas as chamadas aos
+            agentes em vez de reaproveitar respostas em cache. Default: True
+        
+    Note:
+        Os termos são processados concorrentemente por agentes assíncronos,
+        sobrepondo a latência das chamadas à API Cohere com a escrita dos
+        resultados. A síntese final usa o agente síncrono com transmissão,
+        gravando o texto no arquivo à medida que é gerado; ela roda em uma
+        thread (`asyncio.to_thread`) para não bloquear o event loop.
+    """
+    print_header("SISTEMA MULTI-AGENTE DE ANÁLISE", "Processamento inteligente com 4 agentes especializados")
+    
+    # Carrega e valida dados
+    data = _load_json_data(json_file)
+    if data is None:
+        return
+    
+    # Cria agentes especializados (assíncronos para o pipeline por termo)
+    agents = _create_specialized_agents(create_async_agent, use_cache)
+    
+    # Processa dados e gera resumos (todas as chamadas compartilham um
+    # cliente, fechado ao fim do processamento)
+    async with async_client_session():
+        partial_summaries = await _process_terms_with_agents_async(data, agents, json_file)
+    
+    # Cria síntese final (fora do event loop: a transmissão é síncrona)
+    await asyncio.to_thread(_create_final_synthesis, partial_summaries, agents.sintetizador, json_file)
+    
+    # Exibe estatísticas finais
+    _display_processing_stats(len(partial_summaries), json_file)
+
+
+def create_multi_agent_summary(json_file: str, use_cache: bool = True) -> None:
     """
     Função principal para processar arquivo JSON com sistema multi-agente.
     
     Args:
         json_file (str): Caminho para arquivo JSON com dados coletados
+        use_cache (bool, optional): Se False, refaz todas as chamadas aos
+            agentes em vez de reaproveitar respostas em cache. Default: True
         
     Note:
-        Esta é a interface pública do módulo.
-        Alias para compatibilidade com código existente.
+        Esta é a interface pública do módulo. Executa
+        `create_multi_agent_summary_async` em um novo event loop.
     """
-    process_with_multiple_agents(json_file)
+    asyncio.run(create_multi_agent_summary_async(json_file, use_cache))
 
 
 # Aliases para compatibilidade com código existente
@@ -14,36 +14,119 @@ Funcionalidades:
 
 Dependências:
 - requests: Para requisições HTTP
-- beautifulsoup4: Para parsing de HTML
-- json: Para serialização de dados
+- aiohttp: Para downloads concorrentes
+- trafilatura: Para extração do conteúdo principal (opcional)
+- selectolax: Para parsing rápido de HTML, backend Lexbor (opcional)
+- beautifulsoup4: Para parsing de HTML (fallback, com lxml se instalado)
+- json / orjson: Para serialização de dados (orjson opcional)
+- zstandard: Para compressão zstd dos dados coletados (opcional)
 - datetime: Para timestamps
 
 Autor: Marco
 Data: Agosto 2025
 """
 
+import asyncio
+import aiohttp
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from utils.console import (
     print_header, print_section, print_step, print_result, 
     log, RichProgress, RichStatus, console
 )
-from bs4 import BeautifulSoup
 import urllib.parse
 import json
 import os
 import re
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from functools import lru_cache
+from typing import List, Dict, Any, AsyncIterable, AsyncIterator, Awaitable, Iterable, Optional, Tuple
+
+# Lexbor é o backend mais rápido do selectolax; versões antigas só têm o Modest
+try:
+    from selectolax.lexbor import LexborHTMLParser as HTMLParser
+except ImportError:
+    try:
+        from selectolax.parser import HTMLParser
+    except ImportError:
+        HTMLParser = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+try:
+    import trafilatura
+except ImportError:
+    trafilatura = None
+
+try:
+    from bs4 import BeautifulSoup
+    import soupsieve  # Motor de seletores CSS do BeautifulSoup
+except ImportError:
+    BeautifulSoup = None
+    soupsieve = None
+
+try:
+    import lxml  # Parser em C usado pelo BeautifulSoup, se instalado
+    BS4_PARSER = "lxml"
+except ImportError:
+    BS4_PARSER = "html.parser"
 
 
 # Configurações globais
 REQUEST_TIMEOUT = 15
 MAX_CONTENT_LENGTH = 8000  # Aumentado para capturar mais conteúdo
+MAX_CONCURRENT_DOWNLOADS = 8  # Conexões simultâneas no total
+MAX_CONNECTIONS_PER_HOST = 4  # Conexões simultâneas por domínio
+SYNC_POOL_SIZE = 16  # Conexões mantidas por domínio na sessão síncrona
+MAX_HTML_BYTES = 512 * 1024  # HTML lido por página (o restante é descartado)
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+ZSTD_LEVEL = 3  # Nível de compressão zstd dos dados coletados
 DEFAULT_USER_AGENT = (
     'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 '
     '(KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
 )
 
+# Elementos HTML removidos antes da extração de texto
+UNWANTED_TAGS = [
+    "script", "style", "nav", "header", "footer", 
+    "aside", "noscript", "iframe", "form", "button"
+]
+
+# Sequências de espaços e caracteres especiais (fora a pontuação básica),
+# trocadas por um único espaço na limpeza do texto
+_RE_CLEANUP = re.compile(r'[^\w\.,!?;:()\-\[\]"áàâãéèêíìîóòôõúùûç]+')
+
+# Palavras dos termos de busca: só letras, separadas de pontuação e dígitos
+# ("python:" e "python3" contam como "python")
+_RE_TERM_WORD = re.compile(r'[^\W\d_]+')
+
+# União das tags indesejadas, removidas com uma única busca no documento
+_UNWANTED_QUERY = ", ".join(UNWANTED_TAGS)
+
+# Seletores do conteúdo principal, ordenados por prioridade
+PRIORITY_SELECTORS = [
+    'main', 'article', '.content', '.main-content',
+    '#content', '.post-content', '.entry-content'
+]
+
+# União dos seletores (uma única busca no documento) e prioridade de cada um
+_PRIORITY_QUERY = ", ".join(PRIORITY_SELECTORS)
+_SELECTOR_RANKS = {selector: rank for rank, selector in enumerate(PRIORITY_SELECTORS)}
+
+# Seletores do caminho BeautifulSoup, compilados uma única vez
+if soupsieve is not None:
+    _SOUP_UNWANTED = soupsieve.compile(_UNWANTED_QUERY)
+    _SOUP_PRIORITY = soupsieve.compile(_PRIORITY_QUERY)
+
 # Base de URLs educacionais para Python
 PYTHON_RESOURCES = {
     "aprender python": [
@@ -84,6 +167,21 @@ PYTHON_RESOURCES = {
 }
 
 
+def _build_word_index() -> Dict[str, int]:
+    """Mapeia cada palavra das chaves de PYTHON_RESOURCES para a primeira chave que a contém."""
+    word_index = {}
+    for rank, resource_key in enumerate(PYTHON_RESOURCES):
+        for word in resource_key.split():
+            word_index.setdefault(word, rank)
+    return word_index
+
+
+# Índice invertido calculado na importação (a ordem das chaves define a
+# prioridade entre elas)
+_RESOURCE_URLS = list(PYTHON_RESOURCES.values())
+_WORD_INDEX = _build_word_index()
+
+
 def search_pages_for_term(search_term: str, max_pages: int = 5) -> List[str]:
     """
     Busca URLs relevantes para um termo específico.
@@ -97,31 +195,31 @@ def search_pages_for_term(search_term: str, max_pages: int = 5) -> List[str]:
         
     Note:
         Usa uma base de conhecimento pré-definida para garantir
-        qualidade e relevância dos recursos educacionais.
+        qualidade e relevância dos recursos educacionais. A busca é
+        memorizada por termo normalizado; cada chamada recebe uma lista nova.
     """
     # Normaliza o termo para busca case-insensitive
     normalized_term = search_term.lower().strip()
     
-    # Busca correspondências na base de conhecimento
-    found_urls = []
-    
-    for resource_key, urls in PYTHON_RESOURCES.items():
-        # Verifica se alguma palavra do termo coincide com a chave
-        if any(word in normalized_term for word in resource_key.split()):
-            found_urls = urls[:max_pages]
-            break
+    return list(_lookup_pages(normalized_term, max_pages))
+
+
+@lru_cache(maxsize=256)
+def _lookup_pages(normalized_term: str, max_pages: int) -> Tuple[str, ...]:
+    """Busca as URLs de um termo normalizado (resultado imutável, em cache)."""
+    # Chave mais prioritária que tem alguma palavra em comum com o termo
+    ranks = [_WORD_INDEX[word] for word in _RE_TERM_WORD.findall(normalized_term) if word in _WORD_INDEX]
+    if ranks:
+        return tuple(_RESOURCE_URLS[min(ranks)][:max_pages])
     
     # Fallback: URLs gerais se não encontrar correspondência específica
-    if not found_urls:
-        found_urls = [
-            "https://docs.python.org/pt-br/3/",
-            "https://www.python.org/",
-            "https://realpython.com/",
-            "https://www.w3schools.com/python/",
-            "https://www.programiz.com/python-programming/"
-        ][:max_pages]
-    
-    return found_urls
+    return tuple([
+        "https://docs.python.org/pt-br/3/",
+        "https://www.python.org/",
+        "https://realpython.com/",
+        "https://www.w3schools.com/python/",
+        "https://www.programiz.com/python-programming/"
+    ][:max_pages])
 
 
 def collect_web_pages(search_terms: List[str], max_pages: int = 5) -> Dict[str, List[str]]:
@@ -158,12 +256,40 @@ def collect_web_pages(search_terms: List[str], max_pages: int = 5) -> Dict[str,
     return search_results
 
 
-def extract_page_content(url: str) -> Dict[str, Any]:
+@lru_cache(maxsize=None)
+def _get_session() -> requests.Session:
+    """
+    Cria (na primeira chamada) a sessão HTTP síncrona compartilhada.
+    
+    Returns:
+        requests.Session: Sessão com pool de conexões, novas tentativas e
+        compressão, reaproveitando conexões TCP/TLS entre as URLs
+    """
+    session = requests.Session()
+    session.headers.update({
+        'User-Agent': DEFAULT_USER_AGENT,
+        'Accept-Encoding': 'gzip, deflate'
+    })
+    
+    adapter = HTTPAdapter(
+        pool_connections=SYNC_POOL_SIZE,
+        pool_maxsize=SYNC_POOL_SIZE,
+        max_retries=Retry(total=2, backoff_factor=0.3)
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    
+    return session
+
+
+def extract_page_content(url: str, timestamp: Optional[str] = None) -> Dict[str, Any]:
     """
     Extrai o conteúdo textual de uma página web.
     
     Args:
         url (str): URL da página para extrair conteúdo
+        timestamp (Optional[str]): Timestamp ISO gravado no registro.
+            Default: momento da extração
     
     Returns:
         Dict[str, Any]: Dicionário com dados extraídos da página
@@ -177,89 +303,256 @@ def extract_page_content(url: str) -> Dict[str, Any]:
         - status: Status da extração
         - timestamp: Timestamp da extração
     """
+    timestamp = timestamp or datetime.now().isoformat()
+    
     try:
-        # Configuração da requisição
-        headers = {'User-Agent': DEFAULT_USER_AGENT}
+        # Requisição HTTP com timeout, pela sessão compartilhada; o corpo só
+        # é lido se for HTML, e no máximo MAX_HTML_BYTES
+        with _get_session().get(url, timeout=REQUEST_TIMEOUT, stream=True) as response:
+            response.raise_for_status()
+            
+            content_type = response.headers.get('Content-Type', '')
+            if not _is_html(content_type):
+                return _build_error_result(url, ValueError(f"conteúdo não HTML ({content_type})"), timestamp)
+            
+            chunks = []
+            total = 0
+            for chunk in response.iter_content(DOWNLOAD_CHUNK_SIZE):
+                chunks.append(chunk)
+                total += len(chunk)
+                if total >= MAX_HTML_BYTES:
+                    break
         
-        # Requisição HTTP com timeout
-        response = requests.get(url, headers=headers, timeout=REQUEST_TIMEOUT)
-        response.raise_for_status()
+        return _build_page_result(url, b"".join(chunks)[:MAX_HTML_BYTES], timestamp)
         
-        # Parse do HTML
-        soup = BeautifulSoup(response.content, "html.parser")
+    except Exception as error:
+        return _build_error_result(url, error, timestamp)
+
+
+async def extract_page_content_async(
+    session: aiohttp.ClientSession, 
+    url: str, 
+    timestamp: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Versão assíncrona de `extract_page_content`, usando uma sessão aiohttp.
+    
+    Args:
+        session (aiohttp.ClientSession): Sessão HTTP compartilhada
+        url (str): URL da página para extrair conteúdo
+        timestamp (Optional[str]): Timestamp ISO gravado no registro.
+            Default: momento da extração
+    
+    Returns:
+        Dict[str, Any]: Dicionário com dados extraídos da página (mesma
+        estrutura de `extract_page_content`)
+        
+    Note:
+        O parsing do HTML roda em uma thread (`asyncio.to_thread`), sem
+        bloquear o event loop enquanto os demais downloads estão em curso.
+        Respostas que não são HTML são descartadas sem ler o corpo, e só os
+        primeiros MAX_HTML_BYTES do HTML são lidos.
+    """
+    timestamp = timestamp or datetime.now().isoformat()
+    
+    try:
+        async with session.get(url) as response:
+            response.raise_for_status()
+            
+            content_type = response.headers.get('Content-Type', '')
+            if not _is_html(content_type):
+                return _build_error_result(url, ValueError(f"conteúdo não HTML ({content_type})"), timestamp)
+            
+            chunks = []
+            total = 0
+            async for chunk in response.content.iter_chunked(DOWNLOAD_CHUNK_SIZE):
+                chunks.append(chunk)
+                total += len(chunk)
+                if total >= MAX_HTML_BYTES:
+                    break
+            html = b"".join(chunks)[:MAX_HTML_BYTES]
         
-        # Remove elementos desnecessários
-        _remove_unwanted_elements(soup)
+        return await asyncio.to_thread(_build_page_result, url, html, timestamp)
         
-        # Extrai metadados
-        title = _extract_title(soup)
-        description = _extract_meta_description(soup)
+    except Exception as error:
+        return _build_error_result(url, error, timestamp)
+
+
+def _is_html(content_type: str) -> bool:
+    """Verifica se o Content-Type indica HTML (cabeçalho ausente é aceito)."""
+    return not content_type or 'html' in content_type.lower()
+
+
+def _build_page_result(url: str, html: bytes, timestamp: str) -> Dict[str, Any]:
+    """Extrai e limpa o conteúdo de um HTML baixado com sucesso."""
+    # Parse do HTML e extração de metadados e conteúdo principal (trafilatura
+    # quando instalado e capaz de identificar o conteúdo; senão, seletores)
+    extracted = _extract_with_trafilatura(html, url) if trafilatura is not None else None
+    title, description, main_content = extracted or _parse_html(html)
+    
+    # Limpa e normaliza o texto
+    clean_text = _clean_text_content(main_content)
+    
+    return {
+        "url": url,
+        "titulo": title,
+        "descricao": description,
+        "conteudo_texto": clean_text[:MAX_CONTENT_LENGTH],
+        "tamanho_texto": len(clean_text),
+        "status": "sucesso",
+        "timestamp": timestamp
+    }
+
+
+def _build_error_result(url: str, error: Exception, timestamp: str) -> Dict[str, Any]:
+    """Monta o registro de uma página cuja extração falhou."""
+    return {
+        "url": url,
+        "titulo": "",
+        "descricao": "",
+        "conteudo_texto": "",
+        "tamanho_texto": 0,
+        "status": f"erro: {str(error)}",
+        "timestamp": timestamp
+    }
+
+
+def _extract_with_trafilatura(html: bytes, url: str) -> Optional[Tuple[str, str, str]]:
+    """
+    Extrai título, meta description e conteúdo principal com trafilatura.
+    
+    Args:
+        html (bytes): Conteúdo HTML bruto da página
+        url (str): URL da página (ajuda na extração de metadados)
         
-        # Extrai conteúdo principal
-        main_content = _extract_main_content(soup)
+    Returns:
+        Optional[Tuple[str, str, str]]: Título, descrição e texto principal,
+        ou None se nenhum conteúdo principal for identificado
         
-        # Limpa e normaliza o texto
-        clean_text = _clean_text_content(main_content)
+    Note:
+        Uma única chamada devolve texto e metadados (saída JSON), sem
+        comentários nem tabelas e priorizando precisão sobre abrangência.
+    """
+    result = trafilatura.extract(
+        html,
+        url=url,
+        output_format="json",
+        with_metadata=True,
+        include_comments=False,
+        include_tables=False,
+        favor_precision=True
+    )
+    if not result:
+        return None
+    
+    document = json.loads(result)
+    if not document.get("text"):
+        return None
+    
+    return (
+        (document.get("title") or "Sem título").strip(),
+        (document.get("description") or "").strip(),
+        document["text"]
+    )
+
+
+def _parse_html(html: bytes) -> Tuple[str, str, str]:
+    """
+    Extrai título, meta description e conteúdo principal de um HTML.
+    
+    Args:
+        html (bytes): Conteúdo HTML bruto da página
         
-        return {
-            "url": url,
-            "titulo": title,
-            "descricao": description,
-            "conteudo_texto": clean_text[:MAX_CONTENT_LENGTH],
-            "tamanho_texto": len(clean_text),
-            "status": "sucesso",
-            "timestamp": datetime.now().isoformat()
-        }
+    Returns:
+        Tuple[str, str, str]: Título, descrição e texto do conteúdo principal
         
-    except Exception as error:
-        return {
-            "url": url,
-            "titulo": "",
-            "descricao": "",
-            "conteudo_texto": "",
-            "tamanho_texto": 0,
-            "status": f"erro: {str(error)}",
-            "timestamp": datetime.now().isoformat()
-        }
+    Note:
+        Usa selectolax/Lexbor (parser em C, muito mais rápido) quando instalado;
+        caso contrário recorre ao BeautifulSoup, com o parser lxml (também
+        em C) se disponível.
+    """
+    if HTMLParser is not None:
+        tree = HTMLParser(html)
+        tree.strip_tags(UNWANTED_TAGS)
+        return (
+            _extract_title_fast(tree),
+            _extract_meta_description_fast(tree),
+            _extract_main_content_fast(tree)
+        )
+    
+    soup = BeautifulSoup(html, BS4_PARSER)
+    
+    # Remove elementos desnecessários
+    _remove_unwanted_elements(soup)
+    
+    return (
+        _extract_title(soup),
+        _extract_meta_description(soup),
+        _extract_main_content(soup)
+    )
 
 
-def _remove_unwanted_elements(soup: BeautifulSoup) -> None:
-    """Remove elementos HTML desnecessários para extração de texto."""
-    unwanted_tags = [
-        "script", "style", "nav", "header", "footer", 
-        "aside", "noscript", "iframe", "form", "button"
-    ]
+def _extract_title_fast(tree: "HTMLParser") -> str:
+    """Extrai o título da página (selectolax)."""
+    title_node = tree.css_first("title")
+    return title_node.text().strip() if title_node else "Sem título"
+
+
+def _extract_meta_description_fast(tree: "HTMLParser") -> str:
+    """Extrai a meta description da página (selectolax)."""
+    meta_node = tree.css_first('meta[name="description"]')
+    return (meta_node.attributes.get("content") or "").strip() if meta_node else ""
+
+
+def _extract_main_content_fast(tree: "HTMLParser") -> str:
+    """Extrai o conteúdo principal da página usando seletores prioritários (selectolax)."""
+    nodes = tree.css(_PRIORITY_QUERY)
+    if nodes:
+        node = min(nodes, key=lambda node: _selector_rank(
+            node.tag,
+            node.attributes.get("id"),
+            (node.attributes.get("class") or "").split()
+        ))
+        return node.text()
     
-    for tag_name in unwanted_tags:
-        for element in soup.find_all(tag_name):
+    # Fallback: usa body ou todo o documento
+    if tree.body is not None:
+        return tree.body.text()
+    
+    return tree.root.text() if tree.root is not None else ""
+
+
+def _remove_unwanted_elements(soup: "BeautifulSoup") -> None:
+    """Remove elementos HTML desnecessários para extração de texto."""
+    for element in _SOUP_UNWANTED.select(soup):
+        # Elementos aninhados já saem junto com o ancestral removido antes
+        if not element.decomposed:
             element.decompose()
 
 
-def _extract_title(soup: BeautifulSoup) -> str:
+def _extract_title(soup: "BeautifulSoup") -> str:
     """Extrai o título da página."""
     title_element = soup.find("title")
     return title_element.get_text().strip() if title_element else "Sem título"
 
 
-def _extract_meta_description(soup: BeautifulSoup) -> str:
+def _extract_meta_description(soup: "BeautifulSoup") -> str:
     """Extrai a meta description da página."""
     meta_element = soup.find("meta", attrs={"name": "description"})
     return meta_element.get("content", "").strip() if meta_element else ""
 
 
-def _extract_main_content(soup: BeautifulSoup) -> str:
+def _extract_main_content(soup: "BeautifulSoup") -> str:
     """Extrai o conteúdo principal da página usando seletores prioritários."""
-    # Seletores ordenados por prioridade
-    priority_selectors = [
-        'main', 'article', '.content', '.main-content',
-        '#content', '.post-content', '.entry-content'
-    ]
-    
     # Tenta encontrar conteúdo usando seletores prioritários
-    for selector in priority_selectors:
-        elements = soup.select(selector)
-        if elements:
-            return elements[0].get_text()
+    elements = _SOUP_PRIORITY.select(soup)
+    if elements:
+        element = min(elements, key=lambda element: _selector_rank(
+            element.name,
+            element.get("id"),
+            element.get("class") or []
+        ))
+        return element.get_text()
     
     # Fallback: usa body ou todo o documento
     body_element = soup.find("body")
@@ -269,6 +562,28 @@ def _extract_main_content(soup: BeautifulSoup) -> str:
     return soup.get_text()
 
 
+def _selector_rank(tag: str, element_id: Optional[str], classes: List[str]) -> int:
+    """
+    Retorna a prioridade do seletor mais prioritário que casa com o elemento.
+    
+    Args:
+        tag (str): Nome da tag do elemento
+        element_id (Optional[str]): Atributo id do elemento
+        classes (List[str]): Classes do elemento
+        
+    Returns:
+        int: Posição em PRIORITY_SELECTORS (menor é mais prioritário)
+        
+    Note:
+        A busca pela união dos seletores percorre o documento uma única vez
+        e devolve os elementos em ordem de documento; `min` sobre esta
+        prioridade (estável entre empates) escolhe o mesmo elemento que
+        testar os seletores um a um.
+    """
+    candidates = [tag, f"#{element_id}"] + [f".{name}" for name in classes]
+    return min(_SELECTOR_RANKS.get(candidate, len(_SELECTOR_RANKS)) for candidate in candidates)
+
+
 def _clean_text_content(raw_text: str) -> str:
     """Limpa e normaliza o conteúdo textual."""
     # Remove quebras de linha excessivas e espaços
@@ -278,25 +593,15 @@ def _clean_text_content(raw_text: str) -> str:
     # Junta chunks não vazios com tamanho mínimo
     clean_text = ' '.join(chunk for chunk in chunks if chunk and len(chunk) > 3)
     
-    # Normaliza espaços em branco
-    clean_text = re.sub(r'\s+', ' ', clean_text)
-    
-    # Remove caracteres especiais mantendo pontuação básica
-    clean_text = re.sub(
-        r'[^\w\s\.,!?;:()\-\[\]"áàâãéèêíìîóòôõúùûç]', 
-        ' ', 
-        clean_text
-    )
-    
-    # Normalização final
-    clean_text = re.sub(r'\s+', ' ', clean_text).strip()
-    
-    return clean_text
+    # Remove caracteres especiais mantendo pontuação básica e normaliza
+    # espaços em branco, na mesma passada
+    return _RE_CLEANUP.sub(' ', clean_text).strip()
 
 
 def download_and_save_content(
     search_results: Dict[str, List[str]], 
-    output_file: str = "dados_coletados.json"
+    output_file: str = "dados_coletados.json",
+    compress: bool = False
 ) -> Dict[str, Any]:
     """
     Baixa conteúdo de todas as URLs e salva em arquivo JSON estruturado.
@@ -304,6 +609,8 @@ def download_and_save_content(
     Args:
         search_results (Dict[str, List[str]]): Resultados da busca por termo
         output_file (str, optional): Nome do arquivo de saída. Default: "dados_coletados.json"
+        compress (bool, optional): Comprime o JSON com zstd, salvando em
+            `{output_file}.zst`. Default: False
     
     Returns:
         Dict[str, Any]: Dados completos coletados e organizados
@@ -311,35 +618,118 @@ def download_and_save_content(
     Structure:
         - metadata: Informações sobre a coleta
         - dados: Conteúdo organizado por termo de busca
+        
+    Note:
+        Executa `download_and_save_content_async` em um novo event loop.
     """
-    # Estrutura inicial dos dados
-    complete_data = {
-        "metadata": {
-            "data_coleta": datetime.now().isoformat(),
-            "total_termos": len(search_results),
-            "total_urls": sum(len(urls) for urls in search_results.values()),
-            "arquivo": output_file,
-            "versao": "2.0"
-        },
-        "dados": {}
-    }
+    return asyncio.run(download_and_save_content_async(search_results, output_file, compress))
+
+
+async def download_and_save_content_async(
+    search_results: Dict[str, List[str]], 
+    output_file: str = "dados_coletados.json",
+    compress: bool = False
+) -> Dict[str, Any]:
+    """
+    Versão assíncrona de `download_and_save_content`.
+    
+    Args:
+        search_results (Dict[str, List[str]]): Resultados da busca por termo
+        output_file (str, optional): Nome do arquivo de saída. Default: "dados_coletados.json"
+        compress (bool, optional): Comprime o JSON com zstd. Default: False
+    
+    Returns:
+        Dict[str, Any]: Dados completos coletados e organizados
+        
+    Note:
+        Todas as URLs são baixadas concorrentemente em uma única sessão
+        aiohttp, limitada a `MAX_CONCURRENT_DOWNLOADS` conexões no total e
+        `MAX_CONNECTIONS_PER_HOST` por domínio. Cada termo é gravado no JSON
+        assim que suas páginas terminam (`_stream_json_data`).
+    """
+    return await download_terms_and_save_async(
+        _iterate_async(search_results.items()), output_file, compress
+    )
+
+
+async def download_terms_and_save_async(
+    term_stream: AsyncIterable[Tuple[str, List[str]]], 
+    output_file: str = "dados_coletados.json",
+    compress: bool = False
+) -> Dict[str, Any]:
+    """
+    Baixa as páginas de cada termo assim que ele chega e salva o JSON estruturado.
+    
+    Args:
+        term_stream (AsyncIterable[Tuple[str, List[str]]]): Pares (termo,
+            URLs) produzidos sob demanda, por exemplo à medida que a IA gera
+            os termos de busca
+        output_file (str, optional): Nome do arquivo de saída. Default: "dados_coletados.json"
+        compress (bool, optional): Comprime o JSON com zstd, salvando em
+            `{output_file}.zst` (requer `zstandard`). Default: False
+    
+    Returns:
+        Dict[str, Any]: Dados completos coletados e organizados (mesma
+        estrutura de `download_and_save_content`)
+        
+    Note:
+        Os downloads de um termo começam assim que ele chega, sobrepondo-se
+        à produção dos termos seguintes. Termos repetidos são ignorados.
+    """
+    # Um único timestamp para a coleta inteira (também usado em cada página)
+    collection_time = datetime.now().isoformat()
+    
+    if compress and zstandard is None:
+        print("⚠️ zstandard não instalado: salvando o JSON sem compressão")
+        compress = False
+    if compress:
+        output_file += '.zst'
     
     print(f"\n📥 Iniciando download do conteúdo das páginas...")
     
-    # Processa cada termo e suas URLs
-    for term, urls in search_results.items():
-        print(f"\n🔄 Processando termo: {term}")
-        complete_data["dados"][term] = []
+    connector = aiohttp.TCPConnector(
+        limit=MAX_CONCURRENT_DOWNLOADS,
+        limit_per_host=MAX_CONNECTIONS_PER_HOST,
+        ttl_dns_cache=300
+    )
+    timeout = aiohttp.ClientTimeout(total=REQUEST_TIMEOUT)
+    headers = {'User-Agent': DEFAULT_USER_AGENT}
+    
+    async with aiohttp.ClientSession(
+        connector=connector, timeout=timeout, headers=headers
+    ) as session:
         
-        for index, url in enumerate(urls, 1):
-            print(f"   📖 Baixando {index}/{len(urls)}: {url[:80]}...")
-            
+        async def download(url: str) -> Dict[str, Any]:
             # Extrai conteúdo da página
-            page_content = extract_page_content(url)
-            complete_data["dados"][term].append(page_content)
-    
-    # Salva dados no arquivo JSON
-    _save_json_data(complete_data, output_file)
+            page_content = await extract_page_content_async(session, url, collection_time)
+            icon = "✅" if page_content["status"] == "sucesso" else "❌"
+            print(f"   {icon} {url[:80]}")
+            return page_content
+        
+        # Dispara os downloads de cada termo assim que ele chega
+        term_tasks = {}
+        total_urls = 0
+        async for term, urls in term_stream:
+            if term in term_tasks:
+                continue
+            term_tasks[term] = asyncio.gather(*(download(url) for url in urls))
+            total_urls += len(urls)
+        
+        complete_data = {
+            "metadata": {
+                "data_coleta": collection_time,
+                "total_termos": len(term_tasks),
+                "total_urls": total_urls,
+                "arquivo": output_file,
+                "versao": "2.0"
+            },
+            "dados": {}
+        }
+        
+        # Salva dados no arquivo JSON à medida que os termos terminam
+        complete_data["dados"] = await _stream_json_data(
+            complete_data["metadata"], term_tasks, output_file, compress
+        )
     
     # Exibe estatísticas finais
     _display_collection_stats(complete_data)
@@ -347,30 +737,92 @@ def download_and_save_content(
     return complete_data
 
 
-def _save_json_data(data: Dict[str, Any], filename: str) -> None:
-    """Salva dados em arquivo JSON com tratamento de erros."""
+async def _iterate_async(items: Iterable[Tuple[str, List[str]]]) -> AsyncIterator[Tuple[str, List[str]]]:
+    """Expõe pares (termo, URLs) já conhecidos como iterável assíncrono."""
+    for item in items:
+        yield item
+
+
+async def _stream_json_data(
+    metadata: Dict[str, Any], 
+    term_tasks: Dict[str, Awaitable[List[Dict[str, Any]]]], 
+    filename: str,
+    compress: bool = False
+) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Grava o JSON da coleta termo a termo, na ordem original dos termos.
+    
+    Args:
+        metadata (Dict[str, Any]): Metadados da coleta
+        term_tasks (Dict[str, Awaitable[List[Dict[str, Any]]]]): Páginas
+            de cada termo, ainda sendo baixadas
+        filename (str): Arquivo JSON de saída
+        compress (bool, optional): Comprime a saída com zstd. Default: False
+        
+    Returns:
+        Dict[str, List[Dict[str, Any]]]: Páginas coletadas por termo
+        
+    Note:
+        O documento nunca é serializado inteiro de uma vez: cada termo é
+        codificado e escrito assim que termina. A escrita vai para um arquivo
+        temporário que substitui o definitivo (`os.replace`) ao final, sem
+        deixar um JSON pela metade se a coleta falhar.
+    """
+    collected = {}
+    temp_file = filename + '.tmp'
+    
     try:
-        with open(filename, 'w', encoding='utf-8') as file:
-            json.dump(data, file, ensure_ascii=False, indent=2)
+        with _open_output(temp_file, compress) as file:
+            file.write(b'{\n"metadata": ' + _json_bytes(metadata) + b',\n"dados": {')
+            
+            separator = b'\n'
+            for term, task in term_tasks.items():
+                pages = list(await task)
+                collected[term] = pages
+                file.write(separator + _json_bytes(term) + b': ' + _json_bytes(pages))
+                separator = b',\n'
+            
+            file.write(b'\n}\n}\n')
+        
+        os.replace(temp_file, filename)
         print(f"\n✅ Dados salvos com sucesso em: {filename}")
         
     except Exception as error:
         print(f"❌ Erro ao salvar arquivo JSON: {error}")
+        # Não deixa o arquivo temporário incompleto para trás
+        if os.path.exists(temp_file):
+            os.remove(temp_file)
         raise
+    
+    return collected
+
+
+def _open_output(filename: str, compress: bool):
+    """Abre o arquivo de saída em modo binário (com compressão zstd, se pedida)."""
+    file = open(filename, 'wb')
+    if not compress:
+        return file
+    # Fecha o arquivo junto com o compressor
+    return zstandard.ZstdCompressor(level=ZSTD_LEVEL, threads=-1).stream_writer(file)
+
+
+def _json_bytes(value: Any) -> bytes:
+    """Codifica um valor em JSON UTF-8 (orjson, se instalado)."""
+    if orjson is not None:
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(value, ensure_ascii=False).encode('utf-8')
 
 
 def _display_collection_stats(data: Dict[str, Any]) -> None:
     """Exibe estatísticas da coleta de dados."""
-    # Calcula estatísticas
-    success_count = sum(
-        len([page for page in pages if page["status"] == "sucesso"]) 
-        for pages in data["dados"].values()
-    )
-    
-    error_count = sum(
-        len([page for page in pages if page["status"] != "sucesso"]) 
-        for pages in data["dados"].values()
-    )
+    # Calcula estatísticas em uma única passada pelas páginas
+    success_count = error_count = 0
+    for pages in data["dados"].values():
+        for page in pages:
+            if page["status"] == "sucesso":
+                success_count += 1
+            else:
+                error_count += 1
     
     total_pages = success_count + error_count
     
@@ -15,18 +15,81 @@ Autor: Marco
 Data: Agosto 2025
 """
 
+import asyncio
 import re
 import os
-from typing import Tuple, List, Dict, Any
+from itertools import islice
+from typing import AsyncIterator, Tuple, List, Dict, Any
 from utils.console import (
     print_header, print_section, print_step, print_result, 
     log, RichProgress, confirm_action, prompt_input, console
 )
 
-from core.web_search import collect_web_pages, download_and_save_content
+from core.config import SystemConfig
+from core.web_search import search_pages_for_term, download_terms_and_save_async
 from core.proces_response import create_multi_agent_summary
 
 
+# Prompt de sistema do gerador de termos de busca
+_TERM_GENERATOR_SYS = (
+    "ESPECIALISTA EM ESTRATÉGIA DE BUSCA EDUCACIONAL\n"
+    "════════════════════════════════════════════\n\n"
+    "MISSÃO: Gerar termos de busca estratégicos para coleta de conteúdo educacional de alta qualidade.\n\n"
+    "CRITÉRIOS OBRIGATÓRIOS:\n"
+    "• Foque APENAS em recursos educacionais confiáveis\n"
+    "• EVITE sites comerciais, marketplaces ou páginas pagas\n"
+    "• Priorize documentação oficial, tutoriais e guias técnicos\n"
+    "• Use termos que direcionem para conteúdo substantivo\n"
+    "• Varie entre termos específicos e gerais\n\n"
+    "FORMATO DE RESPOSTA OBRIGATÓRIO:\n"
+    "1. [termo específico técnico]\n"
+    "2. [termo de aprendizado/tutorial]\n"
+    "3. [termo de documentação]\n"
+    "4. [termo de exemplos práticos]\n"
+    "5. [termo de conceitos fundamentais]\n\n"
+    "EXEMPLOS DE TERMOS VÁLIDOS:\n"
+    "• 'python tutorial básico'\n"
+    "• 'documentação oficial python'\n"
+    "• 'python conceitos fundamentais'\n"
+    "• 'guia python iniciantes'\n\n"
+    "USE APENAS português brasileiro e seja específico para o tema solicitado."
+)
+
+# Pedido de termos enviado ao gerador (preenchido com `str.format`)
+_TERM_PROMPT_TMPL = """
+TEMA SOLICITADO: {search_query}
+
+GERE 5 termos de busca estratégicos que direcionem para:
+✅ Documentação oficial e tutoriais educacionais
+✅ Guias técnicos e conceitos fundamentais  
+✅ Exemplos práticos e aplicações
+✅ Recursos de aprendizado confiáveis
+
+❌ EVITE termos que levem a:
+❌ Sites comerciais ou de venda
+❌ Marketplaces ou plataformas pagas
+❌ Conteúdo promocional ou publicitário
+
+Responda APENAS com a lista numerada dos termos.
+"""
+
+# Converte o nome normalizado de um arquivo de dados de volta em tema
+_UNDERSCORE_TO_SPACE = str.maketrans('_', ' ')
+
+# Extensões dos arquivos de dados (JSON simples ou compactado com zstd)
+_DATA_FILE_SUFFIXES = ('.json', '.json.zst')
+
+# Linha numerada da resposta do gerador ("1. termo")
+_NUMBERED_TERM = re.compile(r'\d+\.\s*([^\n]+)')
+
+# Linha não numerada aproveitável como termo: mais de 5 caracteres (sem os
+# espaços das pontas) e fora dos cabeçalhos ecoados do prompt
+_FALLBACK_TERM = re.compile(
+    r'^[ \t]*(?!TEMA|GERE|✅|❌)(\S[^\n]{4,}\S)[ \t\r]*$',
+    re.MULTILINE
+)
+
+
 def normalize_filename(topic: str) -> str:
     """
     Normaliza um tema para criar um nome de arquivo válido.
@@ -75,98 +138,123 @@ def process_search_query(search_query: str) -> Tuple[List[str], Dict[str, List[s
     
     log.info(f"Arquivo será salvo como: {data_file}")
     
-    # Etapa 1: Gera termos de busca usando IA
-    print_section("GERANDO TERMOS DE BUSCA COM IA")
-    
-    search_terms = _generate_search_terms(search_query)
+    # Etapas 1 a 3: Gera termos com IA, coleta páginas e extrai o conteúdo
+    # (os downloads de cada termo começam assim que a IA o gera)
+    print_section("GERANDO TERMOS, COLETANDO PÁGINAS E EXTRAINDO CONTEÚDO")
     
-    # Etapa 2: Coleta páginas da web
-    print_section("COLETANDO PÁGINAS DA WEB")
+    search_terms, collected_urls, complete_data = asyncio.run(
+        _generate_and_collect_async(search_query, data_file)
+    )
     
-    collected_urls = collect_web_pages(search_terms)
+    # Etapa 4: Análise com múltiplos agentes (sobre o arquivo de fato gravado,
+    # que ganha `.zst` com SystemConfig.COMPRESS_OUTPUT)
+    print_section("PROCESSANDO COM MÚLTIPLOS AGENTES IA")
     
-    # Etapa 3: Extrai conteúdo otimizado
-    print_section("EXTRAINDO CONTEÚDO DE TEXTO")
+    create_multi_agent_summary(complete_data["metadata"]["arquivo"])
     
-    complete_data = download_and_save_content(collected_urls, data_file)
+    return search_terms, collected_urls, complete_data
+
+
+async def _generate_and_collect_async(
+    search_query: str, 
+    data_file: str
+) -> Tuple[List[str], Dict[str, List[str]], Dict[str, Any]]:
+    """
+    Gera os termos de busca e baixa as páginas de cada um assim que ele surge.
     
-    # Etapa 4: Análise com múltiplos agentes
-    print_section("PROCESSANDO COM MÚLTIPLOS AGENTES IA")
+    Args:
+        search_query (str): Consulta original do usuário
+        data_file (str): Arquivo JSON de saída dos dados coletados
+        
+    Returns:
+        Tuple contendo:
+        - List[str]: Termos de busca gerados
+        - Dict[str, List[str]]: URLs coletadas por termo
+        - Dict[str, Any]: Dados completos salvos
+    """
+    search_terms = []
+    collected_urls = {}
+    
+    async def collect_terms() -> AsyncIterator[Tuple[str, List[str]]]:
+        async for term in _stream_search_terms(search_query):
+            found_pages = search_pages_for_term(term)
+            search_terms.append(term)
+            collected_urls[term] = found_pages
+            
+            print(f"\n🔍 Buscando páginas para termo {len(search_terms)}: {term}")
+            print(f"📋 Encontradas {len(found_pages)} páginas:")
+            for page_num, url in enumerate(found_pages, 1):
+                print(f"   {page_num}. {url}")
+            
+            yield term, found_pages
     
-    create_multi_agent_summary(data_file)
+    complete_data = await download_terms_and_save_async(
+        collect_terms(), data_file, compress=SystemConfig.COMPRESS_OUTPUT
+    )
     
     return search_terms, collected_urls, complete_data
 
 
-def _generate_search_terms(search_query: str) -> List[str]:
+async def _stream_search_terms(search_query: str) -> AsyncIterator[str]:
     """
     Gera termos de busca usando IA baseado na consulta do usuário.
     
     Args:
         search_query (str): Consulta original do usuário
         
-    Returns:
-        List[str]: Lista de termos de busca gerados
+    Yields:
+        str: Cada termo de busca, assim que sua linha termina de ser gerada
+        
+    Note:
+        A resposta da IA é transmitida em trechos (lidos em uma thread, sem
+        bloquear o event loop) e cada linha numerada é emitida ao chegar.
+        Sem linhas numeradas, recorre às demais linhas da resposta e, por
+        fim, a termos padrão baseados na consulta.
     """
     from core.co import create_agent
     
     # Cria agente especializado em geração de termos de busca
     log.step("Criando gerador de termos com IA")
-    term_generator = create_agent(
-        "ESPECIALISTA EM ESTRATÉGIA DE BUSCA EDUCACIONAL\n"
-        "════════════════════════════════════════════\n\n"
-        "MISSÃO: Gerar termos de busca estratégicos para coleta de conteúdo educacional de alta qualidade.\n\n"
-        "CRITÉRIOS OBRIGATÓRIOS:\n"
-        "• Foque APENAS em recursos educacionais confiáveis\n"
-        "• EVITE sites comerciais, marketplaces ou páginas pagas\n"
-        "• Priorize documentação oficial, tutoriais e guias técnicos\n"
-        "• Use termos que direcionem para conteúdo substantivo\n"
-        "• Varie entre termos específicos e gerais\n\n"
-        "FORMATO DE RESPOSTA OBRIGATÓRIO:\n"
-        "1. [termo específico técnico]\n"
-        "2. [termo de aprendizado/tutorial]\n"
-        "3. [termo de documentação]\n"
-        "4. [termo de exemplos práticos]\n"
-        "5. [termo de conceitos fundamentais]\n\n"
-        "EXEMPLOS DE TERMOS VÁLIDOS:\n"
-        "• 'python tutorial básico'\n"
-        "• 'documentação oficial python'\n"
-        "• 'python conceitos fundamentais'\n"
-        "• 'guia python iniciantes'\n\n"
-        "USE APENAS português brasileiro e seja específico para o tema solicitado.",
-        max_tokens=400
-    )
+    term_generator = create_agent(_TERM_GENERATOR_SYS, max_tokens=400)
     
     # Prompt específico para geração de termos
-    search_prompt = f"""
-TEMA SOLICITADO: {search_query}
-
-GERE 5 termos de busca estratégicos que direcionem para:
-✅ Documentação oficial e tutoriais educacionais
-✅ Guias técnicos e conceitos fundamentais  
-✅ Exemplos práticos e aplicações
-✅ Recursos de aprendizado confiáveis
-
-❌ EVITE termos que levem a:
-❌ Sites comerciais ou de venda
-❌ Marketplaces ou plataformas pagas
-❌ Conteúdo promocional ou publicitário
-
-Responda APENAS com a lista numerada dos termos.
-"""
+    search_prompt = _TERM_PROMPT_TMPL.format(search_query=search_query)
     
     log.step("Processando consulta com IA")
-    response = term_generator(search_prompt)
-    
-    # Extrai termos numerados da resposta
-    terms = re.findall(r'\d+\.\s*([^\n]+)', response)
-    
-    # Fallback se não conseguir extrair termos
-    if not terms:
-        # Extrai qualquer linha que pareça um termo
-        lines = [line.strip() for line in response.split('\n') if line.strip()]
-        terms = [line for line in lines if len(line) > 5 and not line.startswith(('TEMA', 'GERE', '✅', '❌'))]
-        terms = terms[:5]  # Limita a 5 termos
+    chunks = iter(term_generator.stream(search_prompt))
+    response_parts = []
+    pending = ""
+    emitted = 0
+    
+    while True:
+        chunk = await asyncio.to_thread(next, chunks, None)
+        if chunk is None:
+            break
+        response_parts.append(chunk)
+        
+        # Emite os termos numerados das linhas já completas
+        *lines, pending = (pending + chunk).split('\n')
+        for line in lines:
+            match = _NUMBERED_TERM.search(line)
+            if match:
+                emitted += 1
+                yield match.group(1)
+    
+    match = _NUMBERED_TERM.search(pending)
+    if match:
+        emitted += 1
+        yield match.group(1)
+    
+    # Fallback se não conseguir extrair termos numerados
+    if not emitted:
+        for term in _fallback_search_terms("".join(response_parts), search_query):
+            yield term
+
+
+def _fallback_search_terms(response: str, search_query: str) -> List[str]:
+    """Extrai termos de uma resposta sem lista numerada (ou usa termos padrão)."""
+    # Extrai qualquer linha que pareça um termo (limitado a 5 termos)
+    terms = [match.group(1) for match in islice(_FALLBACK_TERM.finditer(response), 5)]
     
     # Se ainda não tiver termos, usa termos padrão baseados na consulta
     if not terms:
@@ -178,10 +266,6 @@ Responda APENAS com a lista numerada dos termos.
             f"{search_query} exemplos práticos"
         ]
     
-    log.success("Termos de busca gerados:")
-    for i, term in enumerate(terms, 1):
-        console.print(f"   [bold cyan]{i}.[/bold cyan] [white]{term}[/white]")
-    
     return terms
 
 
@@ -207,9 +291,12 @@ def summarize_only(topic: str) -> None:
         
     Note:
         O arquivo de dados deve existir no formato: dados_{topic_normalizado}.json
+        (ou sua versão compactada, .json.zst)
     """
     file_base = normalize_filename(topic)
     data_file = f"dados_{file_base}.json"
+    if not os.path.exists(data_file) and os.path.exists(data_file + '.zst'):
+        data_file += '.zst'
     
     if not os.path.exists(data_file):
         log.error(f"Arquivo não encontrado: {data_file}")
@@ -309,8 +396,16 @@ def handle_existing_data_summary():
     """Lida com a geração de resumo de dados existentes."""
     print_section("RESUMO DE DADOS EXISTENTES")
     
-    # Lista arquivos de dados disponíveis
-    data_files = [f for f in os.listdir('.') if f.startswith('dados_') and f.endswith('.json')]
+    # Lista arquivos de dados disponíveis (com o tema extraído do nome)
+    with os.scandir('.') as entries:
+        data_files = [
+            (
+                entry.name,
+                entry.name[len('dados_'):].removesuffix('.zst')[:-len('.json')].translate(_UNDERSCORE_TO_SPACE)
+            )
+            for entry in entries
+            if entry.name.startswith('dados_') and entry.name.endswith(_DATA_FILE_SUFFIXES) and entry.is_file()
+        ]
     
     if not data_files:
         log.warning("Nenhum arquivo de dados encontrado.")
@@ -318,10 +413,8 @@ def handle_existing_data_summary():
         return
     
     log.info("Arquivos de dados disponíveis:")
-    for i, file in enumerate(data_files, 1):
-        # Extrai o tema do nome do arquivo
-        topic = file.replace('dados_', '').replace('.json', '').replace('_', ' ').title()
-        console.print(f"   [bold cyan]{i}.[/bold cyan] [white]{topic}[/white] [dim]({file})[/dim]")
+    for i, (file, topic) in enumerate(data_files, 1):
+        console.print(f"   [bold cyan]{i}.[/bold cyan] [white]{topic.title()}[/white] [dim]({file})[/dim]")
     
     console.print()
     
@@ -330,8 +423,7 @@ def handle_existing_data_summary():
     if choice.isdigit():
         choice_num = int(choice)
         if 1 <= choice_num <= len(data_files):
-            selected_file = data_files[choice_num - 1]
-            topic = selected_file.replace('dados_', '').replace('.json', '').replace('_', ' ')
+            selected_file, topic = data_files[choice_num - 1]
             
             log.info(f"Gerando resumo para: {topic}")
             create_multi_agent_summary(selected_file)
@@ -449,6 +541,9 @@ def main():
 
 
 if __name__ == "__main__":
+    # Avisos dos módulos do pacote vão para o stderr, sem disputar o stdout
+    SystemConfig.configure_logging()
+    
     # Para usar apenas resumo de dados existentes, descomente:
     # summarize_only("Python programação")
     
@@ -8,37 +8,60 @@ Autor: Marco
 Data: Agosto 2025
 """
 
+import asyncio
 import time
 import json
-from core.co import create_agent, test_api_connection
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+from core.co import async_client_session, create_async_agent, parse_json_objects, test_api_connection
 from core.config import SystemConfig
 from utils.console import (
     print_header, print_section, print_step, print_result, 
-    log, RichProgress, RichTable, console
+    log, RichTable, batch_print, simple_track, console, RICH_AVAILABLE
 )
 
-
-def test_optimized_prompts():
-    """Testa os prompts otimizados com diferentes tamanhos de conteúdo."""
-    print_section("TESTANDO PROMPTS OTIMIZADOS")
-    
-    # Verifica conexão
-    if not test_api_connection():
-        log.error("Falha na conexão com API. Configure COHERE_API_KEY")
-        return
+if RICH_AVAILABLE:
+    from rich.text import Text
     
-    # Conteúdo de teste
-    test_contents = {
-        'pequeno': "Python é uma linguagem de programação versátil e fácil de aprender.",
-        'medio': """
+    # Markup fixo do bloco de estatísticas do benchmark, interpretado uma
+    # única vez; só os números são acrescentados a cada execução
+    _STATS_HEADER = Text.from_markup("\n[bold green]📊 ESTATÍSTICAS FINAIS:[/bold green]")
+    _STATS_BULLET = Text.from_markup("   [cyan]•[/cyan] ")
+else:
+    _STATS_HEADER = "\n📊 ESTATÍSTICAS FINAIS:"
+    _STATS_BULLET = None
+
+
+# Conteúdos analisados por chamada em `test_optimized_prompts` (lotes
+# maiores diluem pouco o custo fixo e alongam demais a resposta)
+BATCH_SIZE = 3
+
+# Prompts de sistema fixos: enviados sempre idênticos, no início da chamada
+# (`preamble`), com o conteúdo variável só no fim da mensagem
+_ANALISE_TECNICA_SYS = (
+    "ESPECIALISTA EM ANÁLISE TÉCNICA\n"
+    "═══════════════════════════════\n\n"
+    "MISSÃO: Analisar conteúdo técnico e extrair insights importantes.\n\n"
+    "INSTRUÇÕES:\n"
+    "• Identifique pontos-chave\n"
+    "• Use linguagem técnica apropriada\n"
+    "• Seja conciso mas informativo\n"
+    "• Foque em aspectos práticos\n\n"
+    "FORMATO: Resposta estruturada em português brasileiro."
+)
+
+_BENCHMARK_SYS = "Responda de forma concisa sobre o tema apresentado."
+
+# Conteúdos de teste (tamanho, texto, caracteres), montados uma única vez
+_CONTEUDO_PEQUENO = "Python é uma linguagem de programação versátil e fácil de aprender."
+_CONTEUDO_MEDIO = """
 Python é uma linguagem de programação de alto nível, interpretada e de propósito geral.
 Foi criada por Guido van Rossum e lançada pela primeira vez em 1991.
 Python enfatiza a legibilidade do código e sua sintaxe permite que os programadores
 expressem conceitos em menos linhas de código do que seria possível em linguagens
 como C++ ou Java. A linguagem fornece construções que permitem programação clara
 em pequena e grande escala.
-        """,
-        'grande': """
+        """
+_CONTEUDO_GRANDE = """
 Python é uma linguagem de programação de alto nível, interpretada, de script, 
 imperativa, orientada a objetos, funcional, de tipagem dinâmica e forte.
 Foi lançada por Guido van Rossum em 1991. Atualmente possui um modelo de 
@@ -56,56 +79,200 @@ funcional e procedural. Possui tipagem dinâmica e uma de suas principais
 características é permitir a fácil leitura do código e exigir poucas linhas 
 de código se comparado ao mesmo programa em outras linguagens.
         """ * 2
-    }
+
+_TEST_CONTENTS = tuple(
+    (size_name, content, len(content))
+    for size_name, content in (
+        ('pequeno', _CONTEUDO_PEQUENO),
+        ('medio', _CONTEUDO_MEDIO),
+        ('grande', _CONTEUDO_GRANDE),
+    )
+)
+
+_ANALYSIS_ROW_TMPL = "### ROW {id}:\n{content}"
+
+_BATCH_ANALYSIS_PROMPT_TMPL = """Analise cada um dos conteúdos sobre Python abaixo.
+
+Responda APENAS em JSON, sem texto adicional, com um objeto por conteúdo:
+[{{"id": <número do ROW>, "analise": "<análise em markdown>"}}, ...]
+
+{rows}"""
+
+
+async def _run_timed_calls(
+    agent: Callable[[str], Awaitable[str]], 
+    prompts: List[str], 
+    description: str
+) -> List[Tuple[Any, int, int, Optional[str]]]:
+    """
+    Dispara todas as chamadas ao agente de uma vez e coleta os resultados.
+    
+    Args:
+        agent (Callable[[str], Awaitable[str]]): Agente assíncrono
+        prompts (List[str]): Prompts enviados ao agente
+        description (str): Descrição da barra de progresso, que avança a
+            cada chamada concluída
+        
+    Returns:
+        List[Tuple[Any, int, int, Optional[str]]]: Resposta (ou exceção),
+        tempo até o primeiro trecho e tempo total de cada chamada em
+        nanossegundos (`perf_counter_ns`, formatados só na exibição) e tipo
+        de cache que a respondeu ("Cache hit" ou "Cache semântico"; None se
+        chamou a API), na ordem dos prompts
+        
+    Note:
+        As chamadas são concorrentes, então o tempo total fica próximo ao da
+        chamada mais lenta em vez da soma de todas. Prompts já respondidos
+        (ou, com `ENABLE_SEMANTIC_CACHE`, parecidos com um já respondido)
+        não geram texto na API; os demais são transmitidos (`agent.stream`),
+        medindo quando chega o primeiro trecho.
+    """
+    async def timed_call(index: int, prompt: str) -> Tuple[int, Any, int, int, Optional[str]]:
+        start_ns = time.perf_counter_ns()
+        first_chunk_ns = None
+        cache_hit = None
+        try:
+            result = agent.cached(prompt)
+            if result is not None:
+                cache_hit = "Cache hit"
+            elif SystemConfig.ENABLE_SEMANTIC_CACHE:
+                # O embedding é uma chamada de rede síncrona
+                result = await asyncio.to_thread(agent.cached, prompt, semantic=True)
+                if result is not None:
+                    cache_hit = "Cache semântico"
+            
+            if result is None:
+                chunks = []
+                async for chunk in agent.stream(prompt):
+                    if first_chunk_ns is None:
+                        first_chunk_ns = time.perf_counter_ns() - start_ns
+                    chunks.append(chunk)
+                result = "".join(chunks)
+        except Exception as e:
+            result = e
+        
+        call_time_ns = time.perf_counter_ns() - start_ns
+        if first_chunk_ns is None:
+            first_chunk_ns = call_time_ns
+        return index, result, first_chunk_ns, call_time_ns, cache_hit
+    
+    results = [None] * len(prompts)
+    
+    # Um único cliente para todas as chamadas, fechado ao final
+    async with async_client_session():
+        tasks = [asyncio.ensure_future(timed_call(i, prompt)) for i, prompt in enumerate(prompts)]
+        
+        # Atualiza o progresso na ordem em que as chamadas terminam
+        for future in simple_track(asyncio.as_completed(tasks), description, total=len(tasks)):
+            index, result, first_chunk_ns, call_time_ns, cache_hit = await future
+            results[index] = (result, first_chunk_ns, call_time_ns, cache_hit)
+    
+    return results
+
+
+def _stat_line(label: str, value: str) -> Any:
+    """
+    Monta uma linha do bloco de estatísticas sem passar pelo parser de markup.
+    
+    Args:
+        label (str): Descrição da estatística
+        value (str): Valor já formatado, exibido em negrito
+        
+    Returns:
+        Any: `Text` pronto para impressão (ou string simples sem Rich)
+    """
+    if _STATS_BULLET is None:
+        return f"   • {label}: {value}"
+    line = _STATS_BULLET.copy()
+    line.append(f"{label}: ")
+    line.append(value, style="bold")
+    return line
+
+
+def _parse_batch_analyses(response: str) -> Dict[int, str]:
+    """
+    Separa as análises de cada conteúdo da resposta JSON de um lote.
+    
+    Args:
+        response (str): Resposta do agente ao prompt do lote
+        
+    Returns:
+        Dict[int, str]: Análise de cada ROW encontrado (vazio se a resposta
+        não for um JSON válido)
+    """
+    analyses = {}
+    for item in parse_json_objects(response):
+        if item.get('analise'):
+            try:
+                analyses[int(item['id'])] = str(item['analise'])
+            except (KeyError, TypeError, ValueError):
+                continue
+    return analyses
+
+
+def test_optimized_prompts():
+    """Testa os prompts otimizados com diferentes tamanhos de conteúdo."""
+    print_section("TESTANDO PROMPTS OTIMIZADOS")
+    
+    # Verifica conexão
+    if not test_api_connection():
+        log.error("Falha na conexão com API. Configure COHERE_API_KEY")
+        return
     
     # Cria agente otimizado
     log.step("Criando agente com prompts otimizados")
-    optimized_agent = create_agent(
-        "ESPECIALISTA EM ANÁLISE TÉCNICA\n"
-        "═══════════════════════════════\n\n"
-        "MISSÃO: Analisar conteúdo técnico e extrair insights importantes.\n\n"
-        "INSTRUÇÕES:\n"
-        "• Identifique pontos-chave\n"
-        "• Use linguagem técnica apropriada\n"
-        "• Seja conciso mas informativo\n"
-        "• Foque em aspectos práticos\n\n"
-        "FORMATO: Resposta estruturada em português brasileiro.",
-        max_tokens=400
-    )
+    optimized_agent = create_async_agent(_ANALISE_TECNICA_SYS, max_tokens=400 * BATCH_SIZE)
     
     # Testa com diferentes tamanhos
     test_results = []
     
-    with RichProgress("Testando conteúdos de diferentes tamanhos") as progress:
-        total_tests = len(test_contents)
-        for i, (size_name, content) in enumerate(test_contents.items()):
-            progress.update((i / total_tests) * 100, f"Testando conteúdo {size_name}")
-            
-            start_time = time.time()
-            
-            try:
-                response = optimized_agent(f"Analise este conteúdo sobre Python:\n\n{content}")
-                processing_time = time.time() - start_time
-                
+    # Vários conteúdos por chamada: o prompt de sistema e a latência de
+    # rede são pagos uma vez por lote
+    batches = [_TEST_CONTENTS[i:i + BATCH_SIZE] for i in range(0, len(_TEST_CONTENTS), BATCH_SIZE)]
+    
+    prompts = [
+        _BATCH_ANALYSIS_PROMPT_TMPL.format(rows="\n\n".join(
+            _ANALYSIS_ROW_TMPL.format(id=row, content=content)
+            for row, (_, content, _) in enumerate(batch)
+        ))
+        for batch in batches
+    ]
+    responses = asyncio.run(
+        _run_timed_calls(optimized_agent, prompts, "Testando conteúdos de diferentes tamanhos")
+    )
+    
+    for batch, (response, first_chunk_ns, batch_time_ns, cache_hit) in zip(batches, responses):
+        analyses = {} if isinstance(response, Exception) else _parse_batch_analyses(response)
+        # O tempo do lote é dividido igualmente entre seus conteúdos; o
+        # primeiro trecho é o do lote inteiro
+        processing_time = batch_time_ns / len(batch) / 1e9
+        first_chunk_time = first_chunk_ns / 1e9
+        
+        for row, (size_name, _, char_count) in enumerate(batch):
+            analysis = analyses.get(row)
+            if analysis is not None:
                 test_results.append({
                     "Tamanho": size_name.title(),
-                    "Chars Input": len(content),
-                    "Chars Output": len(response),
+                    "Chars Input": char_count,
+                    "Chars Output": len(analysis),
+                    "1º Trecho (s)": f"{first_chunk_time:.2f}",
                     "Tempo (s)": f"{processing_time:.2f}",
-                    "Status": "✅ Sucesso"
+                    "Status": f"✅ {cache_hit or 'Sucesso'}"
                 })
                 
                 log.success(f"Conteúdo {size_name} processado em {processing_time:.2f}s")
                 
-            except Exception as e:
+            else:
+                error = response if isinstance(response, Exception) else "Análise ausente na resposta"
                 test_results.append({
                     "Tamanho": size_name.title(),
-                    "Chars Input": len(content),
+                    "Chars Input": char_count,
                     "Chars Output": 0,
+                    "1º Trecho (s)": "N/A",
                     "Tempo (s)": "N/A",
-                    "Status": f"❌ {str(e)[:30]}..."
+                    "Status": f"❌ {str(error)[:30]}..."
                 })
-                log.error(f"Erro no conteúdo {size_name}: {e}")
+                log.error(f"Erro no conteúdo {size_name}: {error}")
     
     # Exibe tabela de resultados
     if test_results:
@@ -167,7 +334,7 @@ def benchmark_performance():
         return
     
     # Cria agente simples para teste
-    test_agent = create_agent("Responda de forma concisa sobre o tema apresentado.")
+    test_agent = create_async_agent(_BENCHMARK_SYS)
     
     test_prompts = [
         "O que é Python?",
@@ -177,58 +344,85 @@ def benchmark_performance():
     
     benchmark_results = []
     total_time = 0
+    total_first_chunk_time = 0
     successful_calls = 0
+    cache_hits = 0
+    
+    benchmark_start_ns = time.perf_counter_ns()
+    responses = asyncio.run(
+        _run_timed_calls(test_agent, test_prompts, "Executando benchmark de performance")
+    )
+    wall_time = (time.perf_counter_ns() - benchmark_start_ns) / 1e9
     
-    with RichProgress("Executando benchmark de performance") as progress:
-        for i, prompt in enumerate(test_prompts):
-            progress.update((i / len(test_prompts)) * 100, f"Teste {i+1}/{len(test_prompts)}")
+    for i, (prompt, (response, first_chunk_ns, call_time_ns, cache_hit)) in enumerate(zip(test_prompts, responses)):
+        call_time = call_time_ns / 1e9
+        first_chunk_time = first_chunk_ns / 1e9
+        if cache_hit:
+            # Respostas do cache ficam fora das médias de tempo da API
+            cache_hits += 1
             
-            start_time = time.time()
+            benchmark_results.append({
+                "Teste": f"#{i+1}",
+                "Prompt": prompt[:30] + "...",
+                "1º Trecho (s)": f"{first_chunk_time:.2f}",
+                "Tempo (s)": f"{call_time:.2f}",
+                "Chars": len(response),
+                "Status": f"✅ {cache_hit}"
+            })
             
-            try:
-                response = test_agent(prompt)
-                end_time = time.time()
-                
-                call_time = end_time - start_time
-                total_time += call_time
-                successful_calls += 1
-                
-                benchmark_results.append({
-                    "Teste": f"#{i+1}",
-                    "Prompt": prompt[:30] + "...",
-                    "Tempo (s)": f"{call_time:.2f}",
-                    "Chars": len(response),
-                    "Status": "✅ Sucesso"
-                })
-                
-                log.success(f"Teste {i+1} concluído em {call_time:.2f}s")
-                
-            except Exception as e:
-                benchmark_results.append({
-                    "Teste": f"#{i+1}",
-                    "Prompt": prompt[:30] + "...",
-                    "Tempo (s)": "N/A",
-                    "Chars": 0,
-                    "Status": f"❌ {str(e)[:20]}..."
-                })
-                log.error(f"Falha no teste {i+1}: {e}")
+            log.success(f"Teste {i+1} respondido pelo cache ({cache_hit})")
+            
+        elif not isinstance(response, Exception):
+            total_time += call_time
+            total_first_chunk_time += first_chunk_time
+            successful_calls += 1
+            
+            benchmark_results.append({
+                "Teste": f"#{i+1}",
+                "Prompt": prompt[:30] + "...",
+                "1º Trecho (s)": f"{first_chunk_time:.2f}",
+                "Tempo (s)": f"{call_time:.2f}",
+                "Chars": len(response),
+                "Status": "✅ Sucesso"
+            })
+            
+            log.success(f"Teste {i+1} concluído em {call_time:.2f}s (1º trecho em {first_chunk_time:.2f}s)")
+            
+        else:
+            benchmark_results.append({
+                "Teste": f"#{i+1}",
+                "Prompt": prompt[:30] + "...",
+                "1º Trecho (s)": "N/A",
+                "Tempo (s)": "N/A",
+                "Chars": 0,
+                "Status": f"❌ {str(response)[:20]}..."
+            })
+            log.error(f"Falha no teste {i+1}: {response}")
     
-    # Exibe resultados do benchmark
+    # Exibe resultados do benchmark (tabela e estatísticas em uma única escrita)
+    output = []
     if benchmark_results:
-        table = RichTable.create_summary_table(benchmark_results, "Resultados do Benchmark")
-        console.print(table)
+        output.append(RichTable.create_summary_table(benchmark_results, "Resultados do Benchmark"))
     
-    if successful_calls > 0:
-        avg_time = total_time / successful_calls
-        console.print(f"\n[bold green]📊 ESTATÍSTICAS FINAIS:[/bold green]")
-        console.print(f"   [cyan]•[/cyan] Chamadas bem-sucedidas: [bold]{successful_calls}/{len(test_prompts)}[/bold]")
-        console.print(f"   [cyan]•[/cyan] Tempo médio por chamada: [bold]{avg_time:.2f}s[/bold]")
-        console.print(f"   [cyan]•[/cyan] Tempo total: [bold]{total_time:.2f}s[/bold]")
+    if successful_calls > 0 or cache_hits > 0:
+        output.append(_STATS_HEADER)
+        output.append(_stat_line("Chamadas bem-sucedidas", f"{successful_calls}/{len(test_prompts)}"))
+        output.append(_stat_line("Respostas do cache", f"{cache_hits}/{len(test_prompts)}"))
+        if successful_calls > 0:
+            avg_time = total_time / successful_calls
+            avg_first_chunk_time = total_first_chunk_time / successful_calls
+            output.append(_stat_line("Tempo médio até o 1º trecho", f"{avg_first_chunk_time:.2f}s"))
+            output.append(_stat_line("Tempo médio por chamada", f"{avg_time:.2f}s"))
+            output.append(_stat_line("Tempo total", f"{total_time:.2f}s"))
+        output.append(_stat_line("Tempo real (chamadas em paralelo)", f"{wall_time:.2f}s"))
+        batch_print(*output)
     else:
+        batch_print(*output)
         log.error("Nenhuma chamada bem-sucedida")
 
 
 if __name__ == "__main__":
+    SystemConfig.configure_logging()
     print_header("SISTEMA DE TESTES DE OTIMIZAÇÃO", "Validação completa das melhorias implementadas")
     
     try:
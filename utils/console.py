@@ -10,32 +10,80 @@ Autor: Marco
 Data: Agosto 2025
 """
 
+# Só o Console é importado de início; os demais componentes do Rich são
+# importados no primeiro uso (o logger não precisa de nenhum deles)
 try:
     from rich.console import Console
-    from rich.panel import Panel
-    from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
-    from rich.table import Table
-    from rich.text import Text
-    from rich.tree import Tree
-    from rich.columns import Columns
-    from rich.align import Align
-    from rich.live import Live
-    from rich.markdown import Markdown
-    from rich.syntax import Syntax
-    from rich.prompt import Prompt, Confirm
-    from rich.status import Status
     RICH_AVAILABLE = True
 except ImportError as e:
     print(f"⚠️ Rich não disponível: {e}")
     print("💡 Usando fallback para interface simples")
     RICH_AVAILABLE = False
 
-from typing import Any, Dict, List, Optional
+from importlib import import_module
+from typing import Any, Dict, Iterable, List, Optional
+import json
+import os
+import sys
 import time
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Intervalo mínimo entre mensagens de `RichProgress.update` no modo simples
+# (com Rich, os redesenhos já são limitados pelo `refresh_per_second`)
+PROGRESS_MIN_INTERVAL = 0.05
+
+# Mensagens de `log.debug` só são exibidas com WEBBUSC_DEBUG=1
+_DEBUG_ENABLED = os.environ.get("WEBBUSC_DEBUG", "0") == "1"
+
+# Réguas dos cabeçalhos e títulos de seção
+_HEADER_RULE = '=' * 60
+_SECTION_RULE = '=' * 20
+
+# Limite de linhas renderizadas por `RichTable.create_summary_table`
+MAX_TABLE_ROWS = 5000
+
+# Componentes do Rich expostos sob demanda como atributos do módulo
+_LAZY_RICH = {
+    'Panel': 'rich.panel',
+    'Progress': 'rich.progress',
+    'SpinnerColumn': 'rich.progress',
+    'TextColumn': 'rich.progress',
+    'BarColumn': 'rich.progress',
+    'TaskProgressColumn': 'rich.progress',
+    'Table': 'rich.table',
+    'Text': 'rich.text',
+    'Tree': 'rich.tree',
+    'Columns': 'rich.columns',
+    'Align': 'rich.align',
+    'Live': 'rich.live',
+    'Markdown': 'rich.markdown',
+    'Syntax': 'rich.syntax',
+    'Prompt': 'rich.prompt',
+    'Confirm': 'rich.prompt',
+    'Status': 'rich.status',
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Importa um componente do Rich no primeiro acesso (PEP 562)."""
+    module_name = _LAZY_RICH.get(name)
+    if module_name is None or not RICH_AVAILABLE:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name), name)
+    globals()[name] = value
+    return value
+
 # Console global configurado
 if RICH_AVAILABLE:
-    console = Console(width=120, force_terminal=True)
+    # Cores só em terminal interativo: com a saída redirecionada (pipe, CI,
+    # arquivo) o Rich escreve texto puro, sem sequências ANSI; o realce
+    # automático (regex sobre cada string impressa) fica desligado
+    _IS_TTY = sys.stdout.isatty()
+    console = Console(width=120, force_terminal=_IS_TTY, no_color=not _IS_TTY, highlight=False)
 else:
     # Fallback simples
     class MockConsole:
@@ -44,72 +92,116 @@ else:
     console = MockConsole()
 
 
-class RichLogger:
+class _RichLogger:
     """Logger customizado usando Rich para output profissional."""
     
+    _debug_enabled = _DEBUG_ENABLED
+    
     def __init__(self):
         self.console = console
+        # Prefixos (ícone + título) já convertidos de markup, por markup
+        self._prefixes = {}
+    
+    def _prefix(self, markup: str):
+        """Converte o markup de um prefixo em `Text` uma única vez."""
+        prefix = self._prefixes.get(markup)
+        if prefix is None:
+            from rich.text import Text
+            prefix = self._prefixes[markup] = Text.from_markup(markup)
+        return prefix
     
     def info(self, message: str, title: str = "Info"):
         """Log de informação com formatação azul."""
-        if RICH_AVAILABLE:
-            self.console.print(f"[bold blue]ℹ️  {title}:[/bold blue] {message}")
-        else:
-            print(f"ℹ️  {title}: {message}")
+        self.console.print(self._prefix(f"[bold blue]ℹ️  {title}:[/bold blue]"), message)
     
     def success(self, message: str, title: str = "Sucesso"):
         """Log de sucesso com formatação verde."""
-        if RICH_AVAILABLE:
-            self.console.print(f"[bold green]✅ {title}:[/bold green] {message}")
-        else:
-            print(f"✅ {title}: {message}")
+        self.console.print(self._prefix(f"[bold green]✅ {title}:[/bold green]"), message)
     
     def warning(self, message: str, title: str = "Aviso"):
         """Log de aviso com formatação amarela."""
-        if RICH_AVAILABLE:
-            self.console.print(f"[bold yellow]⚠️  {title}:[/bold yellow] {message}")
-        else:
-            print(f"⚠️  {title}: {message}")
+        self.console.print(self._prefix(f"[bold yellow]⚠️  {title}:[/bold yellow]"), message)
     
     def error(self, message: str, title: str = "Erro"):
         """Log de erro com formatação vermelha."""
-        if RICH_AVAILABLE:
-            self.console.print(f"[bold red]❌ {title}:[/bold red] {message}")
-        else:
-            print(f"❌ {title}: {message}")
+        self.console.print(self._prefix(f"[bold red]❌ {title}:[/bold red]"), message)
     
     def debug(self, message: str, title: str = "Debug"):
-        """Log de debug com formatação magenta."""
-        if RICH_AVAILABLE:
-            self.console.print(f"[bold magenta]🔍 {title}:[/bold magenta] {message}")
+        """
+        Log de debug com formatação magenta (ignorado sem WEBBUSC_DEBUG=1).
+        
+        Note:
+            A mensagem já chega formatada; para não montar textos caros à
+            toa, use `if __debug__ and log._debug_enabled: log.debug(...)`,
+            que o `python -O` remove por completo.
+        """
+        if not _DEBUG_ENABLED:
+            return
+        self.console.print(self._prefix(f"[bold magenta]🔍 {title}:[/bold magenta]"), message)
+    
+    def step(self, message: str, step_num: int = None):
+        """Log de passo do processo."""
+        if step_num:
+            self.console.print(self._prefix(f"[bold cyan]🔄 Passo {step_num}:[/bold cyan]"), message)
+        else:
+            self.console.print(self._prefix("[bold cyan]🔄[/bold cyan]"), message)
+    
+    def result(self, message: str, value: Any = None):
+        """Log de resultado com valor opcional."""
+        if value is not None:
+            self.console.print(self._prefix("[bold green]📊 Resultado:[/bold green]"), f"{message} = [bold]{value}[/bold]")
         else:
-            print(f"🔍 {title}: {message}")
+            self.console.print(self._prefix("[bold green]📊 Resultado:[/bold green]"), message)
+
+
+class _PlainLogger:
+    """Logger em texto simples, usado quando o Rich não está disponível."""
+    
+    _debug_enabled = _DEBUG_ENABLED
+    
+    def __init__(self):
+        self.console = console
+    
+    def info(self, message: str, title: str = "Info"):
+        """Log de informação."""
+        print(f"ℹ️  {title}: {message}")
+    
+    def success(self, message: str, title: str = "Sucesso"):
+        """Log de sucesso."""
+        print(f"✅ {title}: {message}")
+    
+    def warning(self, message: str, title: str = "Aviso"):
+        """Log de aviso."""
+        print(f"⚠️  {title}: {message}")
+    
+    def error(self, message: str, title: str = "Erro"):
+        """Log de erro."""
+        print(f"❌ {title}: {message}")
+    
+    def debug(self, message: str, title: str = "Debug"):
+        """Log de debug (ignorado sem WEBBUSC_DEBUG=1)."""
+        if not _DEBUG_ENABLED:
+            return
+        print(f"🔍 {title}: {message}")
     
     def step(self, message: str, step_num: int = None):
         """Log de passo do processo."""
         if step_num:
-            if RICH_AVAILABLE:
-                self.console.print(f"[bold cyan]🔄 Passo {step_num}:[/bold cyan] {message}")
-            else:
-                print(f"🔄 Passo {step_num}: {message}")
+            print(f"🔄 Passo {step_num}: {message}")
         else:
-            if RICH_AVAILABLE:
-                self.console.print(f"[bold cyan]🔄[/bold cyan] {message}")
-            else:
-                print(f"🔄 {message}")
+            print(f"🔄 {message}")
     
     def result(self, message: str, value: Any = None):
         """Log de resultado com valor opcional."""
         if value is not None:
-            if RICH_AVAILABLE:
-                self.console.print(f"[bold green]📊 Resultado:[/bold green] {message} = [bold]{value}[/bold]")
-            else:
-                print(f"📊 Resultado: {message} = {value}")
+            print(f"📊 Resultado: {message} = {value}")
         else:
-            if RICH_AVAILABLE:
-                self.console.print(f"[bold green]📊 Resultado:[/bold green] {message}")
-            else:
-                print(f"📊 Resultado: {message}")
+            print(f"📊 Resultado: {message}")
+
+
+# Implementação escolhida uma única vez, na importação (sem testar
+# RICH_AVAILABLE a cada mensagem)
+RichLogger = _RichLogger if RICH_AVAILABLE else _PlainLogger
 
 
 class RichPanel:
@@ -119,13 +211,17 @@ class RichPanel:
     def title_panel(title: str, subtitle: str = None):
         """Cria painel de título principal."""
         if not RICH_AVAILABLE:
-            print(f"\n{'='*60}")
+            print(f"\n{_HEADER_RULE}")
             print(f"  {title}")
             if subtitle:
                 print(f"  {subtitle}")
-            print(f"{'='*60}\n")
+            print(f"{_HEADER_RULE}\n")
             return None
-            
+        
+        from rich.align import Align
+        from rich.panel import Panel
+        from rich.text import Text
+        
         content = f"[bold blue]{title}[/bold blue]"
         if subtitle:
             content += f"\n[dim]{subtitle}[/dim]"
@@ -144,7 +240,9 @@ class RichPanel:
             print(content)
             print("-" * (len(title) + 8))
             return None
-            
+        
+        from rich.panel import Panel
+        
         return Panel(
             content,
             title=f"[bold blue]ℹ️  {title}[/bold blue]",
@@ -160,7 +258,9 @@ class RichPanel:
             print(content)
             print("-" * 40)
             return None
-            
+        
+        from rich.panel import Panel
+        
         return Panel(
             content,
             title=f"[bold green]✅ {title}[/bold green]",
@@ -176,7 +276,9 @@ class RichPanel:
             print(content)
             print("-" * 40)
             return None
-            
+        
+        from rich.panel import Panel
+        
         return Panel(
             content,
             title=f"[bold red]❌ {title}[/bold red]",
@@ -193,7 +295,9 @@ class RichPanel:
                 print(f"  • {key}: {value}")
             print("-" * 40)
             return None
-            
+        
+        from rich.panel import Panel
+        
         content = ""
         for key, value in configs.items():
             content += f"[bold cyan]•[/bold cyan] {key}: [bold]{value}[/bold]\n"
@@ -209,8 +313,15 @@ class RichPanel:
 class RichProgress:
     """Gerenciador de progresso avançado."""
     
-    def __init__(self, description: str = "Processando..."):
+    def __init__(self, description: str = "Processando...", total: int = 100):
+        """
+        Args:
+            description (str, optional): Descrição inicial da barra
+            total (int, optional): Total de passos; o padrão 100 permite
+                informar porcentagens em `update`. Default: 100
+        """
         if RICH_AVAILABLE:
+            from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
             self.progress = Progress(
                 SpinnerColumn(),
                 TextColumn("[progress.description]{task.description}"),
@@ -223,11 +334,15 @@ class RichProgress:
         self.description = description
         self.task_id = None
         self.is_rich = RICH_AVAILABLE
+        self.total = total
+        self.completed = 0
+        self._last_update = 0.0
+        self._pending_message = None
     
     def __enter__(self):
         if self.is_rich:
             self.progress.start()
-            self.task_id = self.progress.add_task(self.description, total=100)
+            self.task_id = self.progress.add_task(self.description, total=self.total)
         else:
             print(f"🔄 {self.description}")
         return self
@@ -235,23 +350,61 @@ class RichProgress:
     def __exit__(self, exc_type, exc_val, exc_tb):
         if self.is_rich:
             self.progress.stop()
+        else:
+            self._flush_pending()
+    
+    def _flush_pending(self):
+        """Exibe a última mensagem adiada pelo intervalo mínimo, se houver."""
+        if self._pending_message is not None:
+            print(self._pending_message)
+            self._pending_message = None
     
     def update(self, completed: int, description: str = None):
-        """Atualiza o progresso."""
+        """
+        Atualiza o progresso.
+        
+        Args:
+            completed (int): Passos concluídos (de `total`)
+            description (str, optional): Nova descrição da barra
+        
+        Com Rich, o estado é sempre repassado à barra, que se redesenha no
+        seu próprio ritmo. No modo simples, mensagens a menos de
+        `PROGRESS_MIN_INTERVAL` da anterior são adiadas (exceto a de
+        conclusão): só a mais recente é exibida, na próxima escrita ou ao
+        concluir.
+        """
+        self.completed = completed
+        
         if self.is_rich and self.progress:
             if description:
                 self.progress.update(self.task_id, completed=completed, description=description)
             else:
                 self.progress.update(self.task_id, completed=completed)
-        else:
-            if description:
-                print(f"🔄 {description} ({completed:.0f}%)")
+            return
+        
+        if not description:
+            return
+        
+        message = f"🔄 {description} ({completed * 100 / self.total:.0f}%)"
+        now = time.monotonic()
+        if completed < self.total and now - self._last_update < PROGRESS_MIN_INTERVAL:
+            self._pending_message = message
+            return
+        
+        self._last_update = now
+        self._pending_message = None
+        print(message)
+    
+    def advance(self, description: str = None, steps: int = 1):
+        """Avança o progresso em `steps` passos (sem calcular porcentagens)."""
+        self.update(self.completed + steps, description)
     
     def complete(self):
         """Marca como concluído."""
         if self.is_rich and self.progress:
-            self.progress.update(self.task_id, completed=100)
+            self.progress.update(self.task_id, completed=self.total)
         else:
+            self._flush_pending()
             print("✅ Concluído!")
 
 
@@ -268,17 +421,23 @@ class RichTable:
                 print(f"{i+1}. {item}")
             print("-" * 50)
             return None
-            
+        
+        from rich.table import Table
+        
         table = Table(title=f"[bold blue]{title}[/bold blue]", show_header=True, header_style="bold cyan")
         
         # Adiciona colunas baseadas nas chaves do primeiro item
         for key in data[0].keys():
             table.add_column(key.title(), style="white")
         
-        # Adiciona linhas
-        for item in data:
-            row = [str(value) for value in item.values()]
-            table.add_row(*row)
+        # Adiciona linhas (acima de MAX_TABLE_ROWS, o restante vira um rodapé)
+        add_row = table.add_row
+        for item in data[:MAX_TABLE_ROWS]:
+            add_row(*[value if type(value) is str else str(value) for value in item.values()])
+        
+        hidden_rows = len(data) - MAX_TABLE_ROWS
+        if hidden_rows > 0:
+            add_row(f"[dim]... mais {hidden_rows} linhas[/dim]", *[""] * (len(table.columns) - 1))
         
         return table
     
@@ -292,23 +451,71 @@ class RichTable:
                 print(f"{key}: {value} ({type(value).__name__})")
             print("-" * 50)
             return None
-            
+        
+        from rich.table import Table
+        
         table = Table(title=f"[bold yellow]{title}[/bold yellow]", show_header=True, header_style="bold yellow")
         table.add_column("Parâmetro", style="cyan")
         table.add_column("Valor", style="white")
         table.add_column("Tipo", style="dim")
         
         for key, value in configs.items():
-            table.add_row(key, str(value), type(value).__name__)
+            table.add_row(key, value if type(value) is str else str(value), type(value).__name__)
         
         return table
 
 
+def simple_track(iterable: Iterable[Any], description: str, total: Optional[int] = None) -> Iterable[Any]:
+    """
+    Acompanha um laço curto com uma barra leve, que some ao terminar.
+    
+    Args:
+        iterable (Iterable[Any]): Itens percorridos
+        description (str): Descrição exibida na barra
+        total (int, optional): Quantidade de itens, se `iterable` não tiver
+            `len`. Default: None
+        
+    Returns:
+        Iterable[Any]: Os mesmos itens, avançando a barra a cada um
+        
+    Note:
+        Usa `rich.progress.track` (sem spinner nem contador extra); sem Rich,
+        apenas anuncia a descrição e devolve o próprio iterável.
+    """
+    if not RICH_AVAILABLE:
+        print(f"🔄 {description}")
+        return iterable
+    
+    from rich.progress import track
+    return track(
+        iterable, description=description, total=total,
+        console=console, transient=True, refresh_per_second=4
+    )
+
+
+def batch_print(*renderables: Any):
+    """
+    Imprime vários itens (tabelas, painéis, textos com markup) de uma vez.
+    
+    Com Rich, os itens são agrupados em um único `Group` e escritos em uma
+    só chamada ao console; itens None (tabelas/painéis já impressos no modo
+    simples) são ignorados.
+    """
+    renderables = [item for item in renderables if item is not None]
+    if RICH_AVAILABLE:
+        from rich.console import Group
+        console.print(Group(*renderables))
+    else:
+        for item in renderables:
+            print(item)
+
+
 class RichStatus:
     """Indicador de status para operações longas."""
     
     def __init__(self, message: str, spinner: str = "dots"):
         if RICH_AVAILABLE:
+            from rich.status import Status
             self.status = Status(message, spinner=spinner, console=console)
         else:
             self.status = None
@@ -334,52 +541,73 @@ class RichStatus:
             print(f"🔄 {message}")
 
 
-def print_header(title: str, subtitle: str = None):
+def _print_header_rich(title: str, subtitle: str = None):
     """Imprime cabeçalho principal da aplicação."""
-    if RICH_AVAILABLE:
-        console.print()
-        panel = RichPanel.title_panel(title, subtitle)
-        if panel:
-            console.print(panel)
-        console.print()
-    else:
-        print("\n" + "="*60)
-        print(f"  {title}")
-        if subtitle:
-            print(f"  {subtitle}")
-        print("="*60 + "\n")
+    console.print()
+    panel = RichPanel.title_panel(title, subtitle)
+    if panel:
+        console.print(panel)
+    console.print()
+
+
+def _print_header_plain(title: str, subtitle: str = None):
+    """Imprime cabeçalho principal da aplicação."""
+    print(f"\n{_HEADER_RULE}")
+    print(f"  {title}")
+    if subtitle:
+        print(f"  {subtitle}")
+    print(f"{_HEADER_RULE}\n")
 
 
-def print_section(title: str):
+def _print_section_rich(title: str):
     """Imprime título de seção."""
-    if RICH_AVAILABLE:
-        console.print(f"\n[bold cyan]{'='*20} {title} {'='*20}[/bold cyan]")
-    else:
-        print(f"\n{'='*20} {title} {'='*20}")
+    console.print(f"\n[bold cyan]{_SECTION_RULE} {title} {_SECTION_RULE}[/bold cyan]")
+
+
+def _print_section_plain(title: str):
+    """Imprime título de seção."""
+    print(f"\n{_SECTION_RULE} {title} {_SECTION_RULE}")
 
 
-def print_step(step: int, total: int, description: str):
+def _print_step_rich(step: int, total: int, description: str):
     """Imprime passo do processo."""
-    if RICH_AVAILABLE:
-        console.print(f"[bold blue]📋 Passo {step}/{total}:[/bold blue] {description}")
-    else:
-        print(f"📋 Passo {step}/{total}: {description}")
+    console.print(f"[bold blue]📋 Passo {step}/{total}:[/bold blue] {description}")
+
+
+def _print_step_plain(step: int, total: int, description: str):
+    """Imprime passo do processo."""
+    print(f"📋 Passo {step}/{total}: {description}")
 
 
-def print_result(title: str, content: str, success: bool = True):
+def _print_result_rich(title: str, content: str, success: bool = True):
     """Imprime resultado formatado."""
-    if RICH_AVAILABLE:
-        if success:
-            panel = RichPanel.success_panel(content, title)
-        else:
-            panel = RichPanel.error_panel(content, title)
-        if panel:
-            console.print(panel)
+    if success:
+        panel = RichPanel.success_panel(content, title)
     else:
-        prefix = "✅" if success else "❌"
-        print(f"\n{prefix} {title}")
-        print(content)
-        print("-" * 40)
+        panel = RichPanel.error_panel(content, title)
+    if panel:
+        console.print(panel)
+
+
+def _print_result_plain(title: str, content: str, success: bool = True):
+    """Imprime resultado formatado."""
+    prefix = "✅" if success else "❌"
+    print(f"\n{prefix} {title}")
+    print(content)
+    print("-" * 40)
+
+
+# Variantes escolhidas uma única vez, na importação
+if RICH_AVAILABLE:
+    print_header = _print_header_rich
+    print_section = _print_section_rich
+    print_step = _print_step_rich
+    print_result = _print_result_rich
+else:
+    print_header = _print_header_plain
+    print_section = _print_section_plain
+    print_step = _print_step_plain
+    print_result = _print_result_plain
 
 
 def print_config(configs: Dict[str, Any], title: str = "Configurações"):
@@ -397,11 +625,12 @@ def print_config(configs: Dict[str, Any], title: str = "Configurações"):
 
 def print_json_data(data: Dict[str, Any], title: str = "Dados JSON"):
     """Imprime dados JSON formatados."""
-    import json
-    json_str = json.dumps(data, indent=2, ensure_ascii=False)
+    json_str = _dumps_indented(data)
     
     if RICH_AVAILABLE:
         try:
+            from rich.panel import Panel
+            from rich.syntax import Syntax
             syntax = Syntax(json_str, "json", theme="monokai", line_numbers=True)
             panel = Panel(
                 syntax,
@@ -422,10 +651,21 @@ def print_json_data(data: Dict[str, Any], title: str = "Dados JSON"):
         print("-" * 50)
 
 
+def _dumps_indented(data: Any) -> str:
+    """Serializa em JSON indentado (orjson, se instalado)."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode('utf-8')
+        except TypeError:
+            pass  # Tipos que o orjson não serializa: usa o json padrão
+    return json.dumps(data, indent=2, ensure_ascii=False)
+
+
 def confirm_action(message: str, default: bool = True) -> bool:
     """Solicita confirmação do usuário."""
     if RICH_AVAILABLE:
         try:
+            from rich.prompt import Confirm
             return Confirm.ask(f"[yellow]❓[/yellow] {message}", default=default, console=console)
         except:
             pass
@@ -442,6 +682,7 @@ def prompt_input(message: str, default: str = None) -> str:
     """Solicita entrada do usuário."""
     if RICH_AVAILABLE:
         try:
+            from rich.prompt import Prompt
             return Prompt.ask(f"[cyan]📝[/cyan] {message}", default=default, console=console)
         except:
             pass